@@ -0,0 +1,44 @@
+# standard imports
+import sys
+import logging
+
+# external imports
+from chainlib.chain import ChainSpec
+from chainlib.eth.tx import TxFormat
+
+# local imports
+from craft_nft import CraftNFT
+from common import measure
+
+logg = logging.getLogger(__name__)
+
+chain_spec = ChainSpec('evm', 'foochain', 42)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+contract_address = '0x2B5AD5c4795c026514f8317c7a215E218DcCD6cF'
+sender_address = '0x6813Eb9362372EEF6200f3b1dbC3f819671cBA69'
+recipient_address = '0x1efF47bc3a10a45D4B230B5d10E37751FE6AA718'
+
+
+def cases():
+    c = CraftNFT(chain_spec)
+    return [
+        ('allocate', lambda: c.allocate(contract_address, sender_address, hash_of_foo, amount=1000, tx_format=TxFormat.RAW_ARGS)),
+        ('set_cap', lambda: c.set_cap(contract_address, sender_address, hash_of_foo, 1, 1000, tx_format=TxFormat.RAW_ARGS)),
+        ('mint_to', lambda: c.mint_to(contract_address, sender_address, recipient_address, hash_of_foo, 1, tx_format=TxFormat.RAW_ARGS)),
+        ('mint_to.index', lambda: c.mint_to(contract_address, sender_address, recipient_address, hash_of_foo, 1, index=42, tx_format=TxFormat.RAW_ARGS)),
+        ('token_at', lambda: c.token_at(contract_address, 42, sender_address=sender_address)),
+        ('get_token_spec', lambda: c.get_token_spec(contract_address, hash_of_foo, 1, sender_address=sender_address)),
+        ('get_token', lambda: c.get_token(contract_address, hash_of_foo, sender_address=sender_address)),
+        ('get_digest', lambda: c.get_digest(contract_address, hash_of_foo, sender_address=sender_address)),
+        ('to_uri', lambda: c.to_uri(contract_address, hash_of_foo, sender_address=sender_address)),
+        ('to_url', lambda: c.to_url(contract_address, hash_of_foo, sender_address=sender_address)),
+        ('token_uri', lambda: c.token_uri(contract_address, int(hash_of_foo, 16), sender_address=sender_address)),
+        ]
+
+
+def run(number=1000, repeat=5):
+    results = []
+    for (name, fn) in cases():
+        results.append(measure('calldata.' + name, fn, number=number, repeat=repeat))
+    return results
@@ -0,0 +1,105 @@
+# standard imports
+import os
+import logging
+import tempfile
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.runnable import dump
+from common import measure_once
+
+logg = logging.getLogger(__name__)
+
+# the test connection logs every failed call, and finding list lengths fails calls by design
+logging.getLogger('chainlib.eth.unittest.base').setLevel(logging.CRITICAL)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+# sparse batch tokens are minted at every SPARSE_STEP index
+SPARSE_STEP = 7
+
+UNIQUE_COUNT = 2
+
+VARIANTS = [
+    ('call', []),
+    ('call.batch', ['--batch-size', '20']),
+    ('call.workers', ['--batch-size', '20', '--workers', '4']),
+    ('storage', ['--source', 'storage']),
+    ('storage.batch', ['--source', 'storage', '--batch-size', '20']),
+    ('log', ['--source', 'log']),
+    ]
+
+
+class Network(TestCraftNFT):
+    """Contract on an eth-tester backend, outside of a test run.
+    """
+
+    def runTest(self):
+        pass
+
+
+def unique_token(i):
+    return (i + 1).to_bytes(32, 'big').hex()
+
+
+def seed(network, count):
+    """Mint count tokens, half in a dense batch, the rest in a sparse batch and as unique tokens.
+    """
+    nonce_oracle = RPCNonceOracle(network.accounts[0], network.rpc)
+    c = CraftNFT(network.chain_spec, signer=network.signer, nonce_oracle=nonce_oracle)
+
+    dense = count // 2
+    sparse = count - dense - UNIQUE_COUNT
+    network.rpc.do(c.allocate(network.address, network.accounts[0], hash_of_foo, amount=dense)[1])
+    network.rpc.do(c.allocate(network.address, network.accounts[0], hash_of_bar, amount=sparse * SPARSE_STEP)[1])
+    for i in range(UNIQUE_COUNT):
+        network.rpc.do(c.allocate(network.address, network.accounts[0], unique_token(i))[1])
+
+    recipients = network.accounts[1:]
+    for i in range(dense):
+        network.rpc.do(c.mint_to(network.address, network.accounts[0], recipients[i % len(recipients)], hash_of_foo, 0)[1])
+    for i in range(sparse):
+        network.rpc.do(c.mint_to(network.address, network.accounts[0], recipients[i % len(recipients)], hash_of_bar, 0, index=i * SPARSE_STEP)[1])
+    for i in range(UNIQUE_COUNT):
+        network.rpc.do(c.mint_to(network.address, network.accounts[0], recipients[0], unique_token(i), 0)[1])
+
+
+def run_dump(network, argv):
+    argv = ['-p', 'http://localhost:8545', '-z', '--fee-price', '1', '-e', network.address] + argv
+    (config, settings) = dump.process_cli(argv)
+    settings.set('CONN', network.rpc)
+    # the eth-tester backend does not accept calls from the zero address
+    settings.set('SENDER_ADDRESS', network.accounts[0])
+    dump.dump(network.rpc, config, settings)
+
+
+def run(count=100):
+    network = Network('runTest')
+    network.setUp()
+    (v, seeded) = measure_once('dump.seed', lambda: seed(network, count), unit_count=count)
+
+    results = [seeded]
+    d = tempfile.mkdtemp()
+    try:
+        for (name, argv) in VARIANTS:
+            path = os.path.join(d, name)
+            network.rpc.roundtrips = 0
+            (v, o) = measure_once('dump.' + name, lambda: run_dump(network, argv + ['--format', 'ndjson', '--output', path]), unit_count=count)
+            f = open(path, 'r')
+            n = len(f.readlines())
+            f.close()
+            if n != count:
+                raise RuntimeError('dump {} output {} tokens, expected {}'.format(name, n, count))
+            o['roundtrips'] = network.rpc.roundtrips
+            results.append(o)
+    finally:
+        for v in os.listdir(d):
+            os.unlink(os.path.join(d, v))
+        os.rmdir(d)
+        network.tearDown()
+    return results
@@ -0,0 +1,95 @@
+"""Measure the import time of the package and the command line tools, and check it against a budget
+
+.. moduleauthor:: Louis Holbrook <dev@holbrook.no>
+.. pgp:: 0826EDA1702D1E87C6E2875121D2E7BB88C2A746
+
+"""
+
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# standard imports
+import os
+import sys
+import time
+import argparse
+import subprocess
+import statistics
+
+# local imports
+from common import rootdir
+from common import report
+
+# milliseconds above bare interpreter startup, median of all runs
+# about a fifth above the times measured on a reference machine, use --scale on slower ones
+BUDGET = {
+    'craft_nft': 20,
+    'craft_nft.nft': 400,
+    'craft_nft.runnable.publish': 900,
+    'craft_nft.runnable.allocate': 900,
+    'craft_nft.runnable.mint': 900,
+    'craft_nft.runnable.dump': 900,
+    'craft_nft.runnable.sync': 900,
+    'craft_nft.runnable.sign': 900,
+    }
+
+
+def measure(code, runs):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = rootdir + os.pathsep + env.get('PYTHONPATH', '')
+    r = []
+    for i in range(runs):
+        t = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True, stdout=subprocess.DEVNULL)
+        r.append((time.perf_counter() - t) * 1000)
+    return r
+
+
+def run(modules=None, runs=5, scale=1.0):
+    """Return the import time of each module, and whether any of them exceeded its budget.
+    """
+    if modules == None or len(modules) == 0:
+        modules = list(BUDGET.keys())
+
+    base = statistics.median(measure('pass', runs))
+    results = [{
+        'name': 'import.baseline',
+        'unit': 'ms',
+        'value': round(base, 3),
+        }]
+    exceeded = False
+    for m in modules:
+        v = statistics.median(measure('import {}'.format(m), runs)) - base
+        budget = BUDGET.get(m)
+        ok = True
+        if budget != None:
+            budget *= scale
+            ok = v <= budget
+        if not ok:
+            exceeded = True
+        results.append({
+            'name': 'import.' + m,
+            'unit': 'ms',
+            'value': round(v, 3),
+            'budget': budget,
+            'ok': ok,
+            })
+    return (results, exceeded,)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description='Measure import time of modules in fresh interpreters')
+    argparser.add_argument('--runs', type=int, default=5, help='Number of runs for each module (default: 5)')
+    argparser.add_argument('--scale', type=float, default=1.0, help='Multiply all budgets by this factor, for slower machines (default: 1.0)')
+    argparser.add_argument('--no-budget', dest='no_budget', action='store_true', help='Only report, do not fail when a budget is exceeded')
+    argparser.add_argument('module', type=str, nargs='*', help='Modules to measure (default: all with a budget)')
+    args = argparser.parse_args()
+
+    (results, exceeded) = run(args.module, runs=args.runs, scale=args.scale)
+    report(results)
+
+    if exceeded and not args.no_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
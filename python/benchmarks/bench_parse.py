@@ -0,0 +1,70 @@
+# standard imports
+import logging
+
+# external imports
+from chainlib.chain import ChainSpec
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.nft import to_batch_key
+from craft_nft.nft import to_batch_key_bytes
+from craft_nft.nft import batch_keys
+from craft_nft.nft import parse_token_word
+from craft_nft.decode import parse_tokens
+from craft_nft.decode import parse_token_specs
+from craft_nft.decode import have_numpy
+from common import measure
+
+logg = logging.getLogger(__name__)
+
+chain_spec = ChainSpec('evm', 'foochain', 42)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+owner = 'eb3907ecad74a0013c259d5874ae7f22dcbcc95c'
+
+token_batched = '0x80' + hash_of_foo[48:] + '000000' + owner
+token_unique = '0xc0' + '00' * 11 + owner
+token_spec = '0x' + (1000).to_bytes(32, 'big').hex() + (42).to_bytes(32, 'big').hex() + '00' * 32 + (1).to_bytes(32, 'big').hex()
+
+BULK_SIZE = 1000
+
+
+def cases():
+    c = CraftNFT(chain_spec)
+    key = to_batch_key(hash_of_foo, 1, 42)
+    key_bytes = bytes.fromhex(key)
+    token_id_bytes = bytes.fromhex(hash_of_foo)
+    word = bytes.fromhex(token_batched[2:])
+    r = [
+        ('parse_token', lambda: c.parse_token(token_batched, key), 1),
+        ('parse_token.unique', lambda: c.parse_token(token_unique, hash_of_foo), 1),
+        ('parse_token_word', lambda: parse_token_word(word, key_bytes), 1),
+        ('parse_token_spec', lambda: c.parse_token_spec(token_spec), 1),
+        ('to_batch_key', lambda: to_batch_key(hash_of_foo, 1, 42), 1),
+        ('to_batch_key_bytes', lambda: to_batch_key_bytes(token_id_bytes, 1, 42), 1),
+        ]
+
+    keys = [to_batch_key(hash_of_foo, 1, i) for i in range(BULK_SIZE)]
+    values = [token_batched] * BULK_SIZE
+    specs = [token_spec] * BULK_SIZE
+    r += [
+        ('batch_keys.{}'.format(BULK_SIZE), lambda: list(batch_keys(token_id_bytes, 1, range(BULK_SIZE))), BULK_SIZE),
+        ('parse_tokens.python.{}'.format(BULK_SIZE), lambda: parse_tokens(values, keys, use_numpy=False), BULK_SIZE),
+        ('parse_token_specs.python.{}'.format(BULK_SIZE), lambda: parse_token_specs(specs, use_numpy=False), BULK_SIZE),
+        ]
+    if have_numpy():
+        r += [
+            ('parse_tokens.numpy.{}'.format(BULK_SIZE), lambda: parse_tokens(values, keys), BULK_SIZE),
+            ('parse_token_specs.numpy.{}'.format(BULK_SIZE), lambda: parse_token_specs(specs), BULK_SIZE),
+            ]
+    return r
+
+
+def run(number=1000, repeat=5):
+    results = []
+    for (name, fn, size) in cases():
+        n = number
+        if size > 1:
+            n = max(1, number // 100)
+        results.append(measure('parse.' + name, fn, number=n, repeat=repeat))
+    return results
@@ -0,0 +1,65 @@
+# standard imports
+import os
+import sys
+import json
+import time
+import timeit
+import platform
+import configparser
+
+benchdir = os.path.dirname(os.path.realpath(__file__))
+rootdir = os.path.dirname(benchdir)
+
+
+def package_version():
+    config = configparser.ConfigParser()
+    config.read(os.path.join(rootdir, 'setup.cfg'))
+    return config.get('metadata', 'version', fallback=None)
+
+
+def measure(name, fn, number=1000, repeat=5):
+    """Time number calls of fn, repeat times, and return the result of the fastest run as microseconds per call.
+    """
+    r = timeit.repeat(fn, number=number, repeat=repeat)
+    v = min(r) / number
+    return {
+        'name': name,
+        'unit': 'us',
+        'value': round(v * 1000000, 3),
+        'ops': round(1 / v, 1),
+        'number': number,
+        'repeat': repeat,
+        }
+
+
+def measure_once(name, fn, unit_count=None):
+    """Time a single call of fn, returning the result of fn together with the measurement.
+
+    If unit_count is given, the throughput is included as units per second.
+    """
+    t = time.perf_counter()
+    v = fn()
+    t = time.perf_counter() - t
+    o = {
+        'name': name,
+        'unit': 'ms',
+        'value': round(t * 1000, 3),
+        }
+    if unit_count != None:
+        o['count'] = unit_count
+        o['ops'] = round(unit_count / t, 1)
+    return (v, o,)
+
+
+def report(results, w=sys.stdout):
+    o = {
+        'package': 'craft-nft',
+        'version': package_version(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': int(time.time()),
+        'results': results,
+        }
+    json.dump(o, w, indent=2)
+    w.write('\n')
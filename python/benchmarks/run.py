@@ -0,0 +1,84 @@
+"""Run the benchmarks of the python client hot paths, and output the results as JSON
+
+.. moduleauthor:: Louis Holbrook <dev@holbrook.no>
+.. pgp:: 0826EDA1702D1E87C6E2875121D2E7BB88C2A746
+
+"""
+
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# standard imports
+import sys
+import argparse
+import logging
+
+# local imports
+from common import rootdir
+from common import report
+
+sys.path.insert(0, rootdir)
+
+logging.basicConfig(level=logging.WARNING)
+logg = logging.getLogger()
+
+SUITES = [
+    'calldata',
+    'parse',
+    'dump',
+    'import',
+    ]
+
+
+def main():
+    argparser = argparse.ArgumentParser(description='Run benchmarks of the python client, without network access')
+    argparser.add_argument('--number', type=int, default=1000, help='Number of calls in each timing run of calldata and parse benchmarks (default: 1000)')
+    argparser.add_argument('--repeat', type=int, default=5, help='Number of timing runs of calldata and parse benchmarks, of which the fastest is reported (default: 5)')
+    argparser.add_argument('--tokens', type=int, default=100, help='Number of tokens to mint for the dump benchmarks (default: 100)')
+    argparser.add_argument('--suite', type=str, action='append', choices=SUITES, help='Run only this suite. May be given more than once (default: all)')
+    argparser.add_argument('--scale', type=float, default=1.0, help='Multiply all import time budgets by this factor, for slower machines (default: 1.0)')
+    argparser.add_argument('--no-budget', dest='no_budget', action='store_true', help='Only report, do not fail when an import time budget is exceeded')
+    argparser.add_argument('-o', '--output', type=str, help='Write results to file instead of standard output')
+    argparser.add_argument('-v', action='store_true', help='Log progress')
+    args = argparser.parse_args()
+
+    if args.v:
+        logg.setLevel(logging.INFO)
+
+    suites = args.suite
+    if suites == None:
+        suites = SUITES
+
+    results = []
+    exceeded = False
+    for suite in suites:
+        logg.info('running {} benchmarks'.format(suite))
+        if suite == 'calldata':
+            import bench_calldata
+            results += bench_calldata.run(number=args.number, repeat=args.repeat)
+        elif suite == 'parse':
+            import bench_parse
+            results += bench_parse.run(number=args.number, repeat=args.repeat)
+        elif suite == 'dump':
+            import bench_dump
+            results += bench_dump.run(count=args.tokens)
+        elif suite == 'import':
+            import bench_import
+            (r, exceeded) = bench_import.run(scale=args.scale)
+            results += r
+
+    w = sys.stdout
+    if args.output != None:
+        w = open(args.output, 'w')
+    try:
+        report(results, w=w)
+    finally:
+        if w != sys.stdout:
+            w.close()
+
+    if exceeded and not args.no_budget:
+        logg.error('import time budget exceeded')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,23 @@
-# local imports
-from .nft import CraftNFT
-from .nft import create
-from .nft import bytecode
-from .nft import args
+# standard imports
+import importlib
 
+# the contract interface pulls in the chainlib transaction stack, so it is only imported when first used
+__lazy = {
+        'CraftNFT': 'nft',
+        'create': 'nft',
+        'bytecode': 'nft',
+        'args': 'nft',
+        }
 
+
+def __getattr__(k):
+    m = __lazy.get(k)
+    if m == None:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, k))
+    v = getattr(importlib.import_module('.' + m, __name__), k)
+    globals()[k] = v
+    return v
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(__lazy.keys()))
@@ -0,0 +1,489 @@
+# generated by craft_nft.build from data/CraftNFT.json and data/CraftNFT.bin, do not edit
+
+SELECTORS = {
+    'addMultiCodec(uint8,uint64,string)': '1f8cf649',
+    'addWriter(address)': 'da2824a8',
+    'allocate(bytes32,int48)': 'f70a3de8',
+    'balanceOf(address)': '70a08231',
+    'baseURL()': '40c84b0e',
+    'defaultDigestEncoding()': 'a249e912',
+    'deleteWriter(address)': '5ae06f7e',
+    'encodeDigest(bytes)': 'c43ead88',
+    'encodeDigest(bytes,uint256)': 'cfc3b179',
+    'getApproved(uint256)': '081812fc',
+    'getDigest(bytes32)': 'f9613ab2',
+    'getMsg()': 'b5fdeb23',
+    'isApprovedForAll(address,address)': 'e985e9c5',
+    'isWriter(address)': '2b29ba23',
+    'mint(address,uint256,bytes)': '94d008ef',
+    'mintExactFromBatchTo(address,bytes32,uint16,uint48)': 'f117e173',
+    'mintFromBatchTo(address,bytes32,uint16)': 'd824ee4f',
+    'mintTo(address,uint256)': '449a52f8',
+    'mintToBytes(address,bytes32)': '53a1fd02',
+    'mintedToken(bytes32)': '24e0febc',
+    'multiHash(uint256)': 'a5d6f209',
+    'name()': '06fdde03',
+    'owner()': '8da5cb5b',
+    'ownerOf(uint256)': '6352211e',
+    'safeMint(address,uint256,bytes)': '8832e6e3',
+    'safeTransferFrom(address,address,uint256)': '42842e0e',
+    'safeTransferFrom(address,address,uint256,bytes)': 'b88d4fde',
+    'setApprovalForAll(address,bool)': 'a22cb465',
+    'setBaseURL(string)': '49f2553a',
+    'setCap(bytes32,uint16,uint48)': 'c6eba7c4',
+    'setMsg(bytes)': '5344299a',
+    'setMsgCodec(uint256)': '9a7c5e9f',
+    'supportsInterface(bytes4)': '01ffc9a7',
+    'symbol()': '95d89b41',
+    'toHex(bytes)': 'c5bec6fc',
+    'toURI(bytes)': '86e90b59',
+    'toURL(bytes)': '6b9cb86a',
+    'token(bytes32,uint256)': '559f5dc9',
+    'tokenByIndex(uint256)': '4f6ccce7',
+    'tokenOfOwnerByIndex(address,uint256)': '2f745c59',
+    'tokenURI(uint256)': 'c87b56dd',
+    'tokens(uint256)': '4f64b2be',
+    'totalSupply()': '18160ddd',
+    'transferFrom(address,address,uint256)': '23b872dd',
+    'transferOwnership(address)': 'f2fde38b',
+    }
+
+TOPICS = {
+    'Allocate(address,uint48,bool,bytes32)': '77d96978d8b40ac826d1984d992e71a84672e62d825fda78cd646656481d065b',
+    'Approval(address,address,uint256)': '8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925',
+    'ApprovalForAll(address,address,bool)': '17307eab39ab6107e8899845ad3d59bd9653f200f220920489ca2b5937696c31',
+    'Mint(address,address,uint256)': 'ab8530f87dc9b59234c4623bf917212bb2536d647574c8e7e5da92c2ede0c9f8',
+    'Msg(bytes)': '502ae868d71f78c5d099f033dd3007a4f58aebb3a2816544fe690f8b9604b56c',
+    'OwnershipTransferred(address,address)': '8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0',
+    'Transfer(address,address,uint256)': 'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef',
+    'TransferWithData(address,address,uint256,bytes32)': '75c9e114f073c346aac7d1d7e9a3c3c14edabcdd27de07d1d9e425f45d318c5e',
+    }
+
+BYTECODE = (
+    '60806040523480156200001157600080fd5b5060405162006a7138038062006a71833981810160405281019062000037919062000631565b336000806101000a'
+    '81548173ffffffffffffffffffffffffffffffffffffffff021916908373ffffffffffffffffffffffffffffffffffffffff1602179055508160099081620000'
+    '88919062000907565b5080600a90816200009a919062000907565b50620000ee602060126040518060400160405280600681526020017f736861323536000000'
+    '000000000000000000000000000000000000000000000081525062000161640100000000026401000000009004565b6012601181905550602067ffffffffffff'
+    'ffff811115620001145762000113620004cd565b5b6040519080825280601f01601f191660200182016040528015620001475781602001600182028036833780'
+    '820191505090505b506010908162000158919062000a5e565b50505062000db3565b6060819050601081511115620001ae576040517f08c379a0000000000000'
+    '000000000000000000000000000000000000000000008152600401620001a59062000ba6565b60405180910390fd5b620001b862000438565b6000600790505b'
+    '60008160ff16106200021c576000600882620001dc919062000c04565b60ff1660ff9060020a029050600086821667ffffffffffffffff161115620002055750'
+    '6200021c565b8180620002129062000c4a565b92505050620001bf565b6001816200022b919062000c78565b826020019060ff16908160ff1681525050600881'
+    '60076200024d919062000cb4565b62000259919062000c04565b60ff168567ffffffffffffffff169060020a0278010000000000000000000000000000000000'
+    '0000000000000002826080019077ffffffffffffffffffffffffffffffffffffffffffffffff1916908177ffffffffffffffffffffffffffffffffffffffffff'
+    'ffffff1916815250508251826040019060ff16908160ff168152505082620002e79062000d43565b82606001906fffffffffffffffffffffffffffffffff1916'
+    '90816fffffffffffffffffffffffffffffffff19168152505085826000019060ff16908160ff168152505081600f60008767ffffffffffffffff168152602001'
+    '90815260200160002060008201518160000160006101000a81548160ff021916908360ff16021790555060208201518160000160016101000a81548160ff0219'
+    '16908360ff16021790555060408201518160000160026101000a81548160ff021916908360ff16021790555060608201518160000160036101000a8154816fff'
+    'ffffffffffffffffffffffffffffff02191690837001000000000000000000000000000000009004021790555060808201518160000160136101000a81548167'
+    'ffffffffffffffff0219169083780100000000000000000000000000000000000000000000000090040217905550905050505050505050565b6040518060a001'
+    '60405280600060ff168152602001600060ff168152602001600060ff16815260200160006fffffffffffffffffffffffffffffffff19168152602001600077ff'
+    'ffffffffffffffffffffffffffffffffffffffffffffff191681525090565b6000604051905090565b600080fd5b600080fd5b600080fd5b600080fd5b600060'
+    '1f19601f8301169050919050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052604160045260246000fd5b620005'
+    '0782620004bc565b810181811067ffffffffffffffff82111715620005295762000528620004cd565b5b80604052505050565b60006200053e6200049e565b90'
+    '506200054c8282620004fc565b919050565b600067ffffffffffffffff8211156200056f576200056e620004cd565b5b6200057a82620004bc565b9050602081'
+    '019050919050565b60005b83811015620005a75780820151818401526020810190506200058a565b60008484015250505050565b6000620005ca620005c48462'
+    '000551565b62000532565b905082815260208101848484011115620005e957620005e8620004b7565b5b620005f684828562000587565b509392505050565b60'
+    '0082601f830112620006165762000615620004b2565b5b815162000628848260208601620005b3565b91505092915050565b600080604083850312156200064b'
+    '576200064a620004a8565b5b600083015167ffffffffffffffff8111156200066c576200066b620004ad565b5b6200067a85828601620005fe565b9250506020'
+    '83015167ffffffffffffffff8111156200069e576200069d620004ad565b5b620006ac85828601620005fe565b9150509250929050565b600081519050919050'
+    '565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052602260045260246000fd5b600060028204905060018216806200'
+    '070957607f821691505b6020821081036200071f576200071e620006c1565b5b50919050565b60008190508160005260206000209050919050565b6000602060'
+    '1f8301049050919050565b60008160020a8302905092915050565b6000600883026200078c7fffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffff826200074a565b6200079886836200074a565b95508019841693508086168417925050509392505050565b6000819050919050565b6000819050'
+    '919050565b6000620007e5620007df620007d984620007b0565b620007ba565b620007b0565b9050919050565b6000819050919050565b6200080183620007c4'
+    '565b620008196200081082620007ec565b8484546200075a565b825550505050565b600090565b6200083062000821565b6200083d818484620007f6565b5050'
+    '50565b5b8181101562000865576200085960008262000826565b60018101905062000843565b5050565b601f821115620008b4576200087e8162000725565b62'
+    '000889846200073a565b8101602085101562000899578190505b620008b1620008a8856200073a565b83018262000842565b50505b505050565b60008160020a'
+    '8304905092915050565b6000620008dc60001984600802620008b9565b1980831691505092915050565b6000620008f78383620008c9565b9150826002028217'
+    '905092915050565b6200091282620006b6565b67ffffffffffffffff8111156200092e576200092d620004cd565b5b6200093a8254620006f0565b6200094782'
+    '828562000869565b600060209050601f8311600181146200097f57600084156200096a578287015190505b620009768582620008e9565b865550620009e6565b'
+    '601f1984166200098f8662000725565b60005b82811015620009b95784890151825560018201915060208501945060208101905062000992565b868310156200'
+    '09d95784890151620009d5601f891682620008c9565b8355505b6001600288020188555050505b505050505050565b600081519050919050565b600081905081'
+    '60005260206000209050919050565b601f82111562000a595762000a2381620009f9565b62000a2e846200073a565b8101602085101562000a3e578190505b62'
+    '000a5662000a4d856200073a565b83018262000842565b50505b505050565b62000a6982620009ee565b67ffffffffffffffff81111562000a855762000a8462'
+    '0004cd565b5b62000a918254620006f0565b62000a9e82828562000a0e565b600060209050601f83116001811462000ad6576000841562000ac1578287015190'
+    '505b62000acd8582620008e9565b86555062000b3d565b601f19841662000ae686620009f9565b60005b8281101562000b105784890151825560018201915060'
+    '208501945060208101905062000ae9565b8683101562000b30578489015162000b2c601f891682620008c9565b8355505b6001600288020188555050505b5050'
+    '50505050565b600082825260208201905092915050565b7f4552525f5052454649585f544f4f5f4c4f4e4700000000000000000000000000600082015250565b'
+    '600062000b8e60138362000b45565b915062000b9b8262000b56565b602082019050919050565b6000602082019050818103600083015262000bc18162000b7f'
+    '565b9050919050565b600060ff82169050919050565b7f4e487b7100000000000000000000000000000000000000000000000000000000600052601160045260'
+    '246000fd5b600062000c118262000bc8565b915062000c1e8362000bc8565b925082820262000c2e8162000bc8565b915080821462000c435762000c4262000b'
+    'd5565b5b5092915050565b600062000c578262000bc8565b91506000820362000c6d5762000c6c62000bd5565b5b600182039050919050565b600062000c8582'
+    '62000bc8565b915062000c928362000bc8565b9250828201905060ff81111562000cae5762000cad62000bd5565b5b92915050565b600062000cc18262000bc8'
+    '565b915062000cce8362000bc8565b9250828203905060ff81111562000cea5762000ce962000bd5565b5b92915050565b600081905060208201905091905056'
+    '5b60007fffffffffffffffffffffffffffffffff0000000000000000000000000000000082169050919050565b600062000d3a825162000d00565b8091505091'
+    '9050565b600062000d5082620009ee565b8262000d5c8462000cf0565b905062000d698162000d2c565b9250601082101562000dac5762000da77fffffffffff'
+    'ffffffffffffffffffffff00000000000000000000000000000000836010036008026200074a565b831692505b5050919050565b615cae8062000dc360003960'
+    '00f3fe60806040526004361061028f576000357c01000000000000000000000000000000000000000000000000000000009004806386e90b591161016c578063'
+    'c43ead88116100de578063da2824a811610097578063da2824a814610a51578063e985e9c514610a7a578063f117e17314610ab7578063f2fde38b14610af457'
+    '8063f70a3de814610b31578063f9613ab214610b6e5761028f565b8063c43ead88146108f7578063c5bec6fc14610934578063c6eba7c414610971578063c87b'
+    '56dd1461099a578063cfc3b179146109d7578063d824ee4f14610a145761028f565b80639a7c5e9f116101305780639a7c5e9f146107f2578063a22cb4651461'
+    '081b578063a249e91214610844578063a5d6f2091461086f578063b5fdeb23146108b0578063b88d4fde146108db5761028f565b806386e90b591461070d5780'
+    '638832e6e31461074a5780638da5cb5b1461077357806394d008ef1461079e57806395d89b41146107c75761028f565b8063449a52f81161020557806353a1fd'
+    '02116101c957806353a1fd02146105b0578063559f5dc9146105ed5780635ae06f7e1461062d5780636352211e146106565780636b9cb86a1461069357806370'
+    'a08231146106d05761028f565b8063449a52f8146104a757806349f2553a146104e45780634f64b2be1461050d5780634f6ccce71461054a5780635344299a14'
+    '6105875761028f565b806323b872dd1161025757806323b872dd1461038d57806324e0febc146103a95780632b29ba23146103e65780632f745c591461042357'
+    '806340c84b0e1461046057806342842e0e1461048b5761028f565b806301ffc9a71461029457806306fdde03146102d1578063081812fc146102fc5780631816'
+    '0ddd146103395780631f8cf64914610364575b600080fd5b3480156102a057600080fd5b506102bb60048036038101906102b6919061468d565b610bab565b60'
+    '40516102c891906146d5565b60405180910390f35b3480156102dd57600080fd5b506102e6610caa565b6040516102f39190614780565b60405180910390f35b'
+    '34801561030857600080fd5b50610323600480360381019061031e91906147d8565b610d38565b6040516103309190614846565b60405180910390f35b348015'
+    '61034557600080fd5b5061034e610d75565b60405161035b9190614870565b60405180910390f35b34801561037057600080fd5b5061038b6004803603810190'
+    '6103869190614a39565b610d82565b005b6103a760048036038101906103a29190614ad4565b611044565b005b3480156103b557600080fd5b506103d0600480'
+    '36038101906103cb9190614b5d565b6110af565b6040516103dd9190614b99565b60405180910390f35b3480156103f257600080fd5b5061040d600480360381'
+    '01906104089190614bb4565b6110c7565b60405161041a91906146d5565b60405180910390f35b34801561042f57600080fd5b5061044a600480360381019061'
+    '04459190614be1565b611173565b6040516104579190614870565b60405180910390f35b34801561046c57600080fd5b50610475611198565b60405161048291'
+    '90614c76565b60405180910390f35b6104a560048036038101906104a09190614ad4565b611226565b005b3480156104b357600080fd5b506104ce6004803603'
+    '8101906104c99190614be1565b611291565b6040516104db9190614b99565b60405180910390f35b3480156104f057600080fd5b5061050b6004803603810190'
+    '6105069190614c98565b6112ad565b005b34801561051957600080fd5b50610534600480360381019061052f91906147d8565b6115c5565b6040516105419190'
+    '614b99565b60405180910390f35b34801561055657600080fd5b50610571600480360381019061056c91906147d8565b6115e9565b60405161057e9190614870'
+    '565b60405180910390f35b34801561059357600080fd5b506105ae60048036038101906105a99190614d82565b61160d565b005b3480156105bc57600080fd5b'
+    '506105d760048036038101906105d29190614dcb565b611699565b6040516105e49190614b99565b60405180910390f35b3480156105f957600080fd5b506106'
+    '14600480360381019061060f9190614e0b565b6119eb565b6040516106249493929190614e6c565b60405180910390f35b34801561063957600080fd5b506106'
+    '54600480360381019061064f9190614bb4565b611a72565b005b34801561066257600080fd5b5061067d600480360381019061067891906147d8565b611b9156'
+    '5b60405161068a9190614846565b60405180910390f35b34801561069f57600080fd5b506106ba60048036038101906106b59190614d82565b611bcd565b6040'
+    '516106c79190614780565b60405180910390f35b3480156106dc57600080fd5b506106f760048036038101906106f29190614bb4565b611de6565b6040516107'
+    '049190614870565b60405180910390f35b34801561071957600080fd5b50610734600480360381019061072f9190614d82565b611e2f565b6040516107419190'
+    '614780565b60405180910390f35b34801561075657600080fd5b50610771600480360381019061076c9190614f11565b6120da565b005b34801561077f576000'
+    '80fd5b506107886120eb565b6040516107959190614846565b60405180910390f35b3480156107aa57600080fd5b506107c560048036038101906107c0919061'
+    '4f11565b61210f565b005b3480156107d357600080fd5b506107dc612120565b6040516107e99190614780565b60405180910390f35b3480156107fe57600080'
+    'fd5b50610819600480360381019061081491906147d8565b6121ae565b005b34801561082757600080fd5b50610842600480360381019061083d9190614fb156'
+    '5b612261565b005b34801561085057600080fd5b50610859612503565b6040516108669190614870565b60405180910390f35b34801561087b57600080fd5b50'
+    '610896600480360381019061089191906147d8565b612509565b6040516108a7959493929190615076565b60405180910390f35b3480156108bc57600080fd5b'
+    '506108c56125a8565b6040516108d29190614c76565b60405180910390f35b6108f560048036038101906108f091906150c9565b612642565b005b3480156109'
+    '0357600080fd5b5061091e60048036038101906109199190614d82565b61271d565b60405161092b9190614c76565b60405180910390f35b3480156109405760'
+    '0080fd5b5061095b60048036038101906109569190614d82565b612732565b6040516109689190614c76565b60405180910390f35b34801561097d57600080fd'
+    '5b50610998600480360381019061099391906151b2565b612aeb565b005b3480156109a657600080fd5b506109c160048036038101906109bc91906147d8565b'
+    '612ca3565b6040516109ce9190614780565b60405180910390f35b3480156109e357600080fd5b506109fe60048036038101906109f99190615205565b612df6'
+    '565b604051610a0b9190614c76565b60405180910390f35b348015610a2057600080fd5b50610a3b6004803603810190610a369190615261565b6130cc565b60'
+    '4051610a489190614b99565b60405180910390f35b348015610a5d57600080fd5b50610a786004803603810190610a739190614bb4565b613371565b005b3480'
+    '15610a8657600080fd5b50610aa16004803603810190610a9c91906152b4565b613459565b604051610aae91906146d5565b60405180910390f35b348015610a'
+    'c357600080fd5b50610ade6004803603810190610ad991906152f4565b6134f1565b604051610aeb9190614b99565b60405180910390f35b348015610b005760'
+    '0080fd5b50610b1b6004803603810190610b169190614bb4565b61369b565b604051610b2891906146d5565b60405180910390f35b348015610b3d57600080fd'
+    '5b50610b586004803603810190610b539190615394565b6137dd565b604051610b6591906146d5565b60405180910390f35b348015610b7a57600080fd5b5061'
+    '0b956004803603810190610b909190614b5d565b613b0b565b604051610ba29190614b99565b60405180910390f35b6000806000837c01000000000000000000'
+    '00000000000000000000000000000000000000900491506301ffc9a7847c0100000000000000000000000000000000000000000000000000000000900463ffff'
+    'ffff1603610c0f57600192505050610ca5565b60005b610100811015610c9d5763ffffffff817fc22876c3d283ef1ddd9d2087449a52f8abe1f1f5ed75b333f0'
+    '440c0f982ab05d908060020a820491505016915060008263ffffffff1603610c6a5760009350505050610ca5565b8163ffffffff168363ffffffff1603610c89'
+    '5760019350505050610ca5565b602081610c969190615403565b9050610c12565b506000925050505b919050565b60098054610cb790615466565b80601f0160'
+    '208091040260200160405190810160405280929190818152602001828054610ce390615466565b8015610d305780601f10610d05576101008083540402835291'
+    '60200191610d30565b820191906000526020600020905b815481529060010190602001808311610d1357829003601f168201915b505050505081565b60006007'
+    '600083815260200190815260200160002060009054906101000a900473ffffffffffffffffffffffffffffffffffffffff169050919050565b60006006805490'
+    '50905090565b6060819050601081511115610dcc576040517f08c379a0000000000000000000000000000000000000000000000000000000008152600401610d'
+    'c3906154e3565b60405180910390fd5b610dd461457f565b6000600790505b60008160ff1610610e30576000600882610df59190615503565b60ff1660ff9060'
+    '020a029050600086821667ffffffffffffffff161115610e1c5750610e30565b8180610e2790615540565b92505050610ddb565b600181610e3d919061556956'
+    '5b826020019060ff16908160ff16815250506008816007610e5d919061559e565b610e679190615503565b60ff168567ffffffffffffffff169060020a027801'
+    '00000000000000000000000000000000000000000000000002826080019077ffffffffffffffffffffffffffffffffffffffffffffffff1916908177ffffffff'
+    'ffffffffffffffffffffffffffffffffffffffff1916815250508251826040019060ff16908160ff168152505082610ef390615608565b82606001906fffffff'
+    'ffffffffffffffffffffffffff191690816fffffffffffffffffffffffffffffffff19168152505085826000019060ff16908160ff168152505081600f600087'
+    '67ffffffffffffffff16815260200190815260200160002060008201518160000160006101000a81548160ff021916908360ff16021790555060208201518160'
+    '000160016101000a81548160ff021916908360ff16021790555060408201518160000160026101000a81548160ff021916908360ff1602179055506060820151'
+    '8160000160036101000a8154816fffffffffffffffffffffffffffffffff02191690837001000000000000000000000000000000009004021790555060808201'
+    '518160000160136101000a81548167ffffffffffffffff0219169083780100000000000000000000000000000000000000000000000090040217905550905050'
+    '505050505050565b61104f838383613bb7565b808273ffffffffffffffffffffffffffffffffffffffff168473ffffffffffffffffffffffffffffffffffffff'
+    'ff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60405160405180910390a4505050565b60056020528060005260406000'
+    '206000915090505481565b6000600160008373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152'
+    '60200190815260200160002060009054906101000a900460ff168061116c575060008054906101000a900473ffffffffffffffffffffffffffffffffffffffff'
+    '1673ffffffffffffffffffffffffffffffffffffffff168273ffffffffffffffffffffffffffffffffffffffff16145b9050919050565b600c60205281600052'
+    '6040600020602052806000526040600020600091509150505481565b600b80546111a590615466565b80601f0160208091040260200160405190810160405280'
+    '9291908181526020018280546111d190615466565b801561121e5780601f106111f35761010080835404028352916020019161121e565b820191906000526020'
+    '600020905b81548152906001019060200180831161120157829003601f168201915b505050505081565b611231838383613bb7565b808273ffffffffffffffff'
+    'ffffffffffffffffffffffff168473ffffffffffffffffffffffffffffffffffffffff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a'
+    '4df523b3ef60405160405180910390a4505050565b6000808260010290506112a48482611699565b91505092915050565b606060008060009054906101000a90'
+    '0473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffff'
+    'ffffff161461130a57600080fd5b82915081519050602f7f01000000000000000000000000000000000000000000000000000000000000000282600183611343'
+    '919061566f565b81518110611354576113536156a3565b5b60200101517f01000000000000000000000000000000000000000000000000000000000000009004'
+    '7f0100000000000000000000000000000000000000000000000000000000000000027effffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffff1916146113d45780806113d0906156d2565b9150505b8067ffffffffffffffff8111156113ee576113ed61490e565b5b6040519080825280601f01601f19'
+    '16602001820160405280156114205781602001600182028036833780820191505090505b50600b908161142f91906158bc565b5060005b825181101561152057'
+    '82818151811061144f5761144e6156a3565b5b60200101517f010000000000000000000000000000000000000000000000000000000000000090047f01000000'
+    '0000000000000000000000000000000000000000000000000000000002600b8281546114a790615466565b81106114b6576114b56156a3565b5b815460011615'
+    '6114d55790600052602060002090602091828204019190065b601f036101000a81548160ff021916907f01000000000000000000000000000000000000000000'
+    '00000000000000000000840402179055508080611518906156d2565b915050611433565b50815181146115c0577f2f0000000000000000000000000000000000'
+    '0000000000000000000000000000600b8351815461155990615466565b8110611568576115676156a3565b5b8154600116156115875790600052602060002090'
+    '602091828204019190065b601f036101000a81548160ff021916907f010000000000000000000000000000000000000000000000000000000000000084040217'
+    '9055505b505050565b600381815481106115d557600080fd5b906000526020600020016000915090505481565b600681815481106115f957600080fd5b906000'
+    '526020600020016000915090505481565b6000600f6000601154815260200190815260200160002090508060000160009054906101000a900460ff1660ff1682'
+    '511461164757600080fd5b816010908161165691906158bc565b507f502ae868d71f78c5d099f033dd3007a4f58aebb3a2816544fe690f8b9604b56c61168061'
+    '25a8565b60405161168d9190614c76565b60405180910390a15050565b60008060008060008054906101000a900473ffffffffffffffffffffffffffffffffff'
+    'ffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff1614806117425750600160003373ffff'
+    'ffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060009054906101000a'
+    '900460ff165b61174b57600080fd5b600160046000878152602001908152602001600020805490501461176e57600080fd5b6000600460008781526020019081'
+    '52602001600020600081548110611796576117956156a3565b5b9060005260206000200160000160009054906101000a900465ffffffffffff1665ffffffffff'
+    'ff16146117c857600080fd5b60006001026005600087815260200190815260200160002054146117eb57600080fd5b8573ffffffffffffffffffffffffffffff'
+    'ffffffffff1692507fc0000000000000000000000000000000000000000000000000000000000000008317925082600102600560008781526020019081526020'
+    '016000208190555084600190049150600e60008773ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16'
+    '815260200190815260200160002054905080600d60008481526020019081526020016000208190555081600c60008873ffffffffffffffffffffffffffffffff'
+    'ffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000206000838152602001908152602001600020819055506001'
+    '600e60008873ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060'
+    '0082825461194a9190615403565b9250508190555060068290806001815401808255809150506001900390600052602060002001600090919091909150558573'
+    'ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff167fab8530f87dc9b59234c4623bf917212bb2536d'
+    '647574c8e7e5da92c2ede0c9f8846040516119d79190614870565b60405180910390a384935050505092915050565b6004602052816000526040600020818154'
+    '8110611a0757600080fd5b90600052602060002001600091509150508060000160009054906101000a900465ffffffffffff1690806000016006905490610100'
+    '0a900465ffffffffffff169080600001600c9054906101000a900460ff169080600001600d9054906101000a900460ff16905084565b8073ffffffffffffffff'
+    'ffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff161480611af7575060008054906101000a900473ffffffffffffffffff'
+    'ffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff16145b611b365760'
+    '40517f08c379a0000000000000000000000000000000000000000000000000000000008152600401611b2d906159da565b60405180910390fd5b600060016000'
+    '8373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000206000610100'
+    '0a81548160ff02191690831515021790555050565b600080600560008460010281526020019081526020016000205490506060819060020a026c010000000000'
+    '000000000000009004915050919050565b60608060606000611bdd85612732565b9150600b8054611bec90615466565b90509050808251611bfd919061540356'
+    '5b67ffffffffffffffff811115611c1657611c1561490e565b5b6040519080825280601f01601f191660200182016040528015611c4857816020016001820280'
+    '36833780820191505090505b50925060005b81811015611d0d57600b818154611c6490615466565b8110611c7357611c726156a3565b5b815460011615611c92'
+    '5790600052602060002090602091828204019190065b9054901a7f01000000000000000000000000000000000000000000000000000000000000000284828151'
+    '8110611ccb57611cca6156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a9053508080'
+    '611d05906156d2565b915050611c4e565b5060005b8251811015611dda57828181518110611d2d57611d2c6156a3565b5b60200101517f010000000000000000'
+    '000000000000000000000000000000000000000000000090047f0100000000000000000000000000000000000000000000000000000000000000028483815181'
+    '10611d8a57611d896156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a905350818061'
+    '1dc4906156d2565b9250508080611dd2906156d2565b915050611d11565b50829350505050919050565b6000600e60008373ffffffffffffffffffffffffffff'
+    'ffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020549050919050565b606060006060806000611e4186'
+    '612732565b9150600f6000601154815260200190815260200160002093508360000160029054906101000a900460ff1660ff1690506001825182611e80919061'
+    '5403565b611e8a9190615403565b67ffffffffffffffff811115611ea357611ea261490e565b5b6040519080825280601f01601f191660200182016040528015'
+    '611ed55781602001600182028036833780820191505090505b50925060005b81811015611f8f578460000160039054906101000a900470010000000000000000'
+    '0000000000000000028160108110611f1757611f166156a3565b5b1a7f0100000000000000000000000000000000000000000000000000000000000000028482'
+    '81518110611f4d57611f4c6156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a905350'
+    '8080611f87906156d2565b915050611edb565b50603a7f010000000000000000000000000000000000000000000000000000000000000002838281518110611f'
+    'c757611fc66156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a905350808061200190'
+    '6156d2565b91505060005b82518110156120cd57828181518110612023576120226156a3565b5b60200101517f01000000000000000000000000000000000000'
+    '0000000000000000000000000090047f01000000000000000000000000000000000000000000000000000000000000000284828461207a9190615403565b8151'
+    '811061208b5761208a6156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a9053508080'
+    '6120c5906156d2565b915050612007565b5082945050505050919050565b6120e48484611291565b5050505050565b60008054906101000a900473ffffffffff'
+    'ffffffffffffffffffffffffffffff1681565b6121198484611291565b5050505050565b600a805461212d90615466565b80601f016020809104026020016040'
+    '519081016040528092919081815260200182805461215990615466565b80156121a65780601f1061217b576101008083540402835291602001916121a6565b82'
+    '0191906000526020600020905b81548152906001019060200180831161218957829003601f168201915b505050505081565b6000600f60008381526020019081'
+    '52602001600020905060008160000160009054906101000a900460ff1660ff16116121e657600080fd5b816011819055508060000160009054906101000a9004'
+    '60ff1660ff1667ffffffffffffffff81111561221b5761221a61490e565b5b6040519080825280601f01601f19166020018201604052801561224d5781602001'
+    '600182028036833780820191505090505b506010908161225c91906158bc565b505050565b801561238257600073ffffffffffffffffffffffffffffffffffff'
+    'ffff16600860003373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160'
+    '002060009054906101000a900473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16146122ff576000'
+    '80fd5b81600860003373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001'
+    '60002060006101000a81548173ffffffffffffffffffffffffffffffffffffffff021916908373ffffffffffffffffffffffffffffffffffffffff1602179055'
+    '5061249a565b600073ffffffffffffffffffffffffffffffffffffffff16600860003373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffff'
+    'ffffffffffffffffffffffffffff16815260200190815260200160002060009054906101000a900473ffffffffffffffffffffffffffffffffffffffff1673ff'
+    'ffffffffffffffffffffffffffffffffffffff160361241a57600080fd5b6000600860003373ffffffffffffffffffffffffffffffffffffffff1673ffffffff'
+    'ffffffffffffffffffffffffffffffff16815260200190815260200160002060006101000a81548173ffffffffffffffffffffffffffffffffffffffff021916'
+    '908373ffffffffffffffffffffffffffffffffffffffff1602179055505b8173ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffff'
+    'ffffffffffffffffffffff167f17307eab39ab6107e8899845ad3d59bd9653f200f220920489ca2b5937696c31836040516124f791906146d5565b6040518091'
+    '0390a35050565b60115481565b600f6020528060005260406000206000915090508060000160009054906101000a900460ff1690806000016001905490610100'
+    '0a900460ff16908060000160029054906101000a900460ff16908060000160039054906101000a90047001000000000000000000000000000000000290806000'
+    '0160139054906101000a9004780100000000000000000000000000000000000000000000000002905085565b606061263d601080546125ba90615466565b8060'
+    '1f01602080910402602001604051908101604052809291908181526020018280546125e690615466565b80156126335780601f10612608576101008083540402'
+    '83529160200191612633565b820191906000526020600020905b81548152906001019060200180831161261657829003601f168201915b505050505061271d56'
+    '5b905090565b61264d848484613bb7565b818373ffffffffffffffffffffffffffffffffffffffff168573ffffffffffffffffffffffffffffffffffffffff16'
+    '7fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60405160405180910390a4818373ffffffffffffffffffffffffffffffffff'
+    'ffffff168573ffffffffffffffffffffffffffffffffffffffff167f75c9e114f073c346aac7d1d7e9a3c3c14edabcdd27de07d1d9e425f45d318c5e84612702'
+    '90615a0f565b60405161270f9190614b99565b60405180910390a450505050565b606061272b82601154612df6565b9050919050565b60608060008060028551'
+    '6127469190615a76565b67ffffffffffffffff81111561275f5761275e61490e565b5b6040519080825280601f01601f19166020018201604052801561279157'
+    '81602001600182028036833780820191505090505b5092506000905060005b6020811015612adf57600460f08783815181106127bb576127ba6156a3565b5b60'
+    '200101517f010000000000000000000000000000000000000000000000000000000000000090047f010000000000000000000000000000000000000000000000'
+    '0000000000000000027f010000000000000000000000000000000000000000000000000000000000000090041660ff16908060020a82049150509250600a8360'
+    'ff1610156128ba576030836128519190615569565b7f010000000000000000000000000000000000000000000000000000000000000002848381518110612886'
+    '576128856156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a90535061292c565b6057'
+    '836128c79190615569565b7f0100000000000000000000000000000000000000000000000000000000000000028483815181106128fc576128fb6156a3565b5b'
+    '60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a9053505b600f8682815181106129415761294061'
+    '56a3565b5b60200101517f010000000000000000000000000000000000000000000000000000000000000090047f010000000000000000000000000000000000'
+    '0000000000000000000000000000027f01000000000000000000000000000000000000000000000000000000000000009004169250600a8360ff161015612a3f'
+    '576030836129ca9190615569565b7f010000000000000000000000000000000000000000000000000000000000000002846001846129fa9190615403565b8151'
+    '8110612a0b57612a0a6156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a905350612a'
+    'bd565b605783612a4c9190615569565b7f01000000000000000000000000000000000000000000000000000000000000000284600184612a7c9190615403565b'
+    '81518110612a8d57612a8c6156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a905350'
+    '5b600282612aca9190615403565b91508080612ad7906156d2565b91505061279b565b50829350505050919050565b6000600460008581526020019081526020'
+    '016000208361ffff1681548110612b1657612b156156a3565b5b90600052602060002001905080600001600c9054906101000a900460ff1615612b7457604051'
+    '7f08c379a0000000000000000000000000000000000000000000000000000000008152600401612b6b90615b04565b60405180910390fd5b80600001600d9054'
+    '906101000a900460ff1615612bc6576040517f08c379a0000000000000000000000000000000000000000000000000000000008152600401612bbd90615b7056'
+    '5b60405180910390fd5b60008265ffffffffffff1603612bf0578060000160069054906101000a900465ffffffffffff1691505b806000016000905490610100'
+    '0a900465ffffffffffff1665ffffffffffff168265ffffffffffff161015612c59576040517f08c379a000000000000000000000000000000000000000000000'
+    '0000000000008152600401612c5090615bdc565b60405180910390fd5b818160000160006101000a81548165ffffffffffff021916908365ffffffffffff1602'
+    '17905550600181600001600d6101000a81548160ff02191690831515021790555050505050565b60606000606083600102915060006004600084815260200190'
+    '81526020016000208054905003612cd957612cd682613b0b565b91505b6000600460008481526020019081526020016000208054905011612cfc57600080fd5b'
+    '602067ffffffffffffffff811115612d1757612d1661490e565b5b6040519080825280601f01601f191660200182016040528015612d49578160200160018202'
+    '8036833780820191505090505b50905060005b6020811015612de357828160208110612d6b57612d6a6156a3565b5b1a7f010000000000000000000000000000'
+    '000000000000000000000000000000000002828281518110612da157612da06156a3565b5b60200101907effffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffff1916908160001a9053508080612ddb906156d2565b915050612d4f565b50612ded81611bcd565b92505050919050565b606060006060'
+    '600f600085815260200190815260200160002091508160000160019054906101000a900460ff1660ff168260000160009054906101000a900460ff1660ff1686'
+    '51612e479190615403565b612e519190615403565b67ffffffffffffffff811115612e6a57612e6961490e565b5b6040519080825280601f01601f1916602001'
+    '82016040528015612e9c5781602001600182028036833780820191505090505b50905060005b8260000160019054906101000a900460ff1660ff16811015612f'
+    '72578260000160139054906101000a90047801000000000000000000000000000000000000000000000000028160088110612efa57612ef96156a3565b5b1a7f'
+    '010000000000000000000000000000000000000000000000000000000000000002828281518110612f3057612f2f6156a3565b5b60200101907effffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a9053508080612f6a906156d2565b915050612ea2565b82600001600090549061'
+    '01000a900460ff167f010000000000000000000000000000000000000000000000000000000000000002828281518110612fb957612fb86156a3565b5b602001'
+    '01907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a9053508080612ff3906156d2565b91505060005b865181'
+    '10156130bf57868181518110613015576130146156a3565b5b60200101517f010000000000000000000000000000000000000000000000000000000000000090'
+    '047f01000000000000000000000000000000000000000000000000000000000000000283828461306c9190615403565b8151811061307d5761307c6156a3565b'
+    '5b60200101907effffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1916908160001a90535080806130b7906156d2565b915050612f'
+    'f9565b5081935050505092915050565b600080600460008581526020019081526020016000208361ffff16815481106130f8576130f76156a3565b5b90600052'
+    '602060002001905080600001600c9054906101000a900460ff1615613156576040517f08c379a000000000000000000000000000000000000000000000000000'
+    '000000815260040161314d90615b04565b60405180910390fd5b60008054906101000a900473ffffffffffffffffffffffffffffffffffffffff1673ffffffff'
+    'ffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff1614806131f95750600160003373ffffffffffffffffffffff'
+    'ffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060009054906101000a900460ff165b613238'
+    '576040517f08c379a000000000000000000000000000000000000000000000000000000000815260040161322f906159da565b60405180910390fd5b60008361'
+    'ffff1614801561326a575060008160000160009054906101000a900465ffffffffffff1665ffffffffffff16145b8015613284575080600001600d9054906101'
+    '000a900460ff165b156132e35760018160000160068282829054906101000a900465ffffffffffff166132af9190615bfc565b92506101000a81548165ffffff'
+    'ffffff021916908365ffffffffffff1602179055506132db8585611699565b91505061336a565b80600001600d9054906101000a900460ff1615613343578060'
+    '000160009054906101000a900465ffffffffffff1665ffffffffffff168160000160069054906101000a900465ffffffffffff1665ffffffffffff1610613342'
+    '57600080fd5b5b6133668585858460000160069054906101000a900465ffffffffffff16856140d2565b9150505b9392505050565b60008054906101000a9004'
+    '73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffff'
+    'ffff16146133ff576040517f08c379a00000000000000000000000000000000000000000000000000000000081526004016133f6906159da565b604051809103'
+    '90fd5b60018060008373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001'
+    '60002060006101000a81548160ff02191690831515021790555050565b60008173ffffffffffffffffffffffffffffffffffffffff16600860008573ffffffff'
+    'ffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060009054906101000a9004'
+    '73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1614905092915050565b6000806004600086815260'
+    '20019081526020016000208461ffff168154811061351d5761351c6156a3565b5b90600052602060002001905060008054906101000a900473ffffffffffffff'
+    'ffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff1614806135cc'
+    '5750600160003373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000'
+    '2060009054906101000a900460ff165b61360b576040517f08c379a0000000000000000000000000000000000000000000000000000000008152600401613602'
+    '906159da565b60405180910390fd5b60008160000160009054906101000a900465ffffffffffff1665ffffffffffff161161363657600080fd5b80600001600d'
+    '9054906101000a900460ff1661365157600080fd5b8060000160009054906101000a900465ffffffffffff1665ffffffffffff168365ffffffffffff16106136'
+    '8357600080fd5b61369086868686856140d2565b915050949350505050565b60008060008054906101000a900473ffffffffffffffffffffffffffffffffffff'
+    'ffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff16146136f657600080fd5b600080549061'
+    '01000a900473ffffffffffffffffffffffffffffffffffffffff169050826000806101000a81548173ffffffffffffffffffffffffffffffffffffffff021916'
+    '908373ffffffffffffffffffffffffffffffffffffffff16021790555060008054906101000a900473ffffffffffffffffffffffffffffffffffffffff1673ff'
+    'ffffffffffffffffffffffffffffffffffffff168173ffffffffffffffffffffffffffffffffffffffff167f8be0079c531659141344cd1fd0a4f28419497f97'
+    '22a3daafe3b4186f6b6457e060405160405180910390a36001915050919050565b60008060008054906101000a900473ffffffffffffffffffffffffffffffff'
+    'ffffffff1673ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffffffffffffffff1614806138835750600160003373ff'
+    'ffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000206000905490610100'
+    '0a900460ff165b6138c2576040517f08c379a00000000000000000000000000000000000000000000000000000000081526004016138b9906159da565b604051'
+    '80910390fd5b6138ca6145e5565b6004600086815260200190815260200160002080549050915060008211156139475760006004600087815260200190815260'
+    '2001600020600081548110613914576139136156a3565b5b9060005260206000200160000160009054906101000a900465ffffffffffff1665ffffffffffff16'
+    '1161394657600080fd5b5b60008460050b036139685760018160600190151590811515815250506139a3565b60008460050b13156139a25783816000019065ff'
+    'ffffffffff16908165ffffffffffff168152505060018160600190151590811515815250505b5b60046000868152602001908152602001600020819080600181'
+    '540180825580915050600190039060005260206000200160009091909190915060008201518160000160006101000a81548165ffffffffffff021916908365ff'
+    'ffffffffff16021790555060208201518160000160066101000a81548165ffffffffffff021916908365ffffffffffff16021790555060408201518160000160'
+    '0c6101000a81548160ff021916908315150217905550606082015181600001600d6101000a81548160ff02191690831515021790555050506003859080600181'
+    '54018082558091505060019003906000526020600020016000909190919091505580606001511515816000015165ffffffffffff163373ffffffffffffffffff'
+    'ffffffffffffffffffffff167f77d96978d8b40ac826d1984d992e71a84672e62d825fda78cd646656481d065b88604051613af79190614b99565b6040518091'
+    '0390a460019250505092915050565b60008060056000848152602001908152602001600020549050613b2d8161448a565b613b3657600080fd5b613b3f816144'
+    'bc565b15613b4d5782915050613bb2565b7effffffffffffffff00000000000000000000000000000000000000000000006001028116905060b881908060020a'
+    '820491505090507fffffffffffffffffffffffffffffffffffffffffffffffff0000000000000000600102831681179050809150505b919050565b6000806000'
+    '3073ffffffffffffffffffffffffffffffffffffffff16636352211e856040518263ffffffff167c010000000000000000000000000000000000000000000000'
+    '0000000000028152600401613c119190614870565b602060405180830381865afa158015613c2e573d6000803e3d6000fd5b505050506040513d601f19601f82'
+    '011682018060405250810190613c529190615c4b565b92508573ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffff'
+    'ffffffffff1614613c8c57600080fd5b3373ffffffffffffffffffffffffffffffffffffffff168673ffffffffffffffffffffffffffffffffffffffff161461'
+    '3dc0573373ffffffffffffffffffffffffffffffffffffffff166007600086815260200190815260200160002060009054906101000a900473ffffffffffffff'
+    'ffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff161480613db657503373ffffffffffffffffffffffffffffffffffffff'
+    'ff16600860008573ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000'
+    '2060009054906101000a900473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16145b613dbf576000'
+    '80fd5b5b60006007600086815260200190815260200160002060006101000a81548173ffffffffffffffffffffffffffffffffffffffff021916908373ffffff'
+    'ffffffffffffffffffffffffffffffffff160217905550613e1d84866144ee565b600d60008581526020019081526020016000205491506001600e60008873ff'
+    'ffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002054613e7f91906156'
+    '6f565b905081811115613f2f57600c60008773ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152'
+    '602001908152602001600020600082815260200190815260200160002054600c60008873ffffffffffffffffffffffffffffffffffffffff1673ffffffffffff'
+    'ffffffffffffffffffffffffffff1681526020019081526020016000206000848152602001908152602001600020819055505b6000600c60008873ffffffffff'
+    'ffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020600083815260200190815260'
+    '200160002081905550600e60008673ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190'
+    '815260200160002054905083600c60008773ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260'
+    '20019081526020016000206000838152602001908152602001600020819055506001600e60008873ffffffffffffffffffffffffffffffffffffffff1673ffff'
+    'ffffffffffffffffffffffffffffffffffff168152602001908152602001600020600082825461406c919061566f565b925050819055506001600e60008773ff'
+    'ffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060008282546140c3'
+    '9190615403565b92505081905550505050505050565b60008060008060007fffffffffffffffffffffffffffffffffffffffffffffffff000000000000000089'
+    '60019004169350603067ffffffffffffffff8961ffff161667ffffffffffffffff169060020a0267ffffffffffffffff16841793508665ffffffffffff168417'
+    '9350836001029150600060010260056000848152602001908152602001600020541461416757600080fd5b85600001600c9054906101000a900460ff166141c9'
+    '578560000160069054906101000a900465ffffffffffff1665ffffffffffff168765ffffffffffff16146141c857600186600001600c6101000a81548160ff02'
+    '19169083151502179055505b5b67ffffffffffffffff896001900416925060b8839060020a0292507f8000000000000000000000000000000000000000000000'
+    '000000000000000000831792508973ffffffffffffffffffffffffffffffffffffffff168317925060018660000160068282829054906101000a900465ffffff'
+    'ffffff1661424a9190615bfc565b92506101000a81548165ffffffffffff021916908365ffffffffffff16021790555085600001600d9054906101000a900460'
+    'ff166142cb5760018660000160008282829054906101000a900465ffffffffffff166142a89190615bfc565b92506101000a81548165ffffffffffff02191690'
+    '8365ffffffffffff1602179055505b826001026005600084815260200190815260200160002081905550600e60008b73ffffffffffffffffffffffffffffffff'
+    'ffffffff1673ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002054905080600d6000868152602001908152602001600020'
+    '8190555083600c60008c73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020'
+    '016000206000838152602001908152602001600020819055506001600e60008c73ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffff'
+    'ffffffffffffffffffffff16815260200190815260200160002060008282546143e59190615403565b9250508190555060068490806001815401808255809150'
+    '506001900390600052602060002001600090919091909150558973ffffffffffffffffffffffffffffffffffffffff163373ffffffffffffffffffffffffffff'
+    'ffffffffffff167fab8530f87dc9b59234c4623bf917212bb2536d647574c8e7e5da92c2ede0c9f8866040516144729190614870565b60405180910390a38194'
+    '505050505095945050505050565b6000807f8000000000000000000000000000000000000000000000000000000000000000836001900416119050919050565b'
+    '6000807f4000000000000000000000000000000000000000000000000000000000000000836001900416119050919050565b6000808360010290506005600082'
+    '8152602001908152602001600020546001900491506000820361451e57600080fd5b7fffffffffffffffffffffffff0000000000000000000000000000000000'
+    '000000821691508273ffffffffffffffffffffffffffffffffffffffff1682179150816001026005600083815260200190815260200160002081905550505050'
+    '50565b6040518060a00160405280600060ff168152602001600060ff168152602001600060ff16815260200160006fffffffffffffffffffffffffffffffff19'
+    '168152602001600077ffffffffffffffffffffffffffffffffffffffffffffffff191681525090565b6040518060800160405280600065ffffffffffff168152'
+    '602001600065ffffffffffff1681526020016000151581526020016000151581525090565b6000604051905090565b600080fd5b600080fd5b60007fffffffff'
+    '0000000000000000000000000000000000000000000000000000000082169050919050565b61466a81614635565b811461467557600080fd5b50565b60008135'
+    '905061468781614661565b92915050565b6000602082840312156146a3576146a261462b565b5b60006146b184828501614678565b91505092915050565b6000'
+    '8115159050919050565b6146cf816146ba565b82525050565b60006020820190506146ea60008301846146c6565b92915050565b600081519050919050565b60'
+    '0082825260208201905092915050565b60005b8381101561472a57808201518184015260208101905061470f565b60008484015250505050565b6000601f1960'
+    '1f8301169050919050565b6000614752826146f0565b61475c81856146fb565b935061476c81856020860161470c565b61477581614736565b84019150509291'
+    '5050565b6000602082019050818103600083015261479a8184614747565b905092915050565b6000819050919050565b6147b5816147a2565b81146147c05760'
+    '0080fd5b50565b6000813590506147d2816147ac565b92915050565b6000602082840312156147ee576147ed61462b565b5b60006147fc848285016147c3565b'
+    '91505092915050565b600073ffffffffffffffffffffffffffffffffffffffff82169050919050565b600061483082614805565b9050919050565b6148408161'
+    '4825565b82525050565b600060208201905061485b6000830184614837565b92915050565b61486a816147a2565b82525050565b600060208201905061488560'
+    '00830184614861565b92915050565b600060ff82169050919050565b6148a18161488b565b81146148ac57600080fd5b50565b6000813590506148be81614898'
+    '565b92915050565b600067ffffffffffffffff82169050919050565b6148e1816148c4565b81146148ec57600080fd5b50565b6000813590506148fe816148d8'
+    '565b92915050565b600080fd5b600080fd5b7f4e487b7100000000000000000000000000000000000000000000000000000000600052604160045260246000fd'
+    '5b61494682614736565b810181811067ffffffffffffffff821117156149655761496461490e565b5b80604052505050565b6000614978614621565b90506149'
+    '84828261493d565b919050565b600067ffffffffffffffff8211156149a4576149a361490e565b5b6149ad82614736565b9050602081019050919050565b8281'
+    '8337600083830152505050565b60006149dc6149d784614989565b61496e565b9050828152602081018484840111156149f8576149f7614909565b5b614a0384'
+    '82856149ba565b509392505050565b600082601f830112614a2057614a1f614904565b5b8135614a308482602086016149c9565b91505092915050565b600080'
+    '600060608486031215614a5257614a5161462b565b5b6000614a60868287016148af565b9350506020614a71868287016148ef565b925050604084013567ffff'
+    'ffffffffffff811115614a9257614a91614630565b5b614a9e86828701614a0b565b9150509250925092565b614ab181614825565b8114614abc57600080fd5b'
+    '50565b600081359050614ace81614aa8565b92915050565b600080600060608486031215614aed57614aec61462b565b5b6000614afb86828701614abf565b93'
+    '50506020614b0c86828701614abf565b9250506040614b1d868287016147c3565b9150509250925092565b6000819050919050565b614b3a81614b27565b8114'
+    '614b4557600080fd5b50565b600081359050614b5781614b31565b92915050565b600060208284031215614b7357614b7261462b565b5b6000614b8184828501'
+    '614b48565b91505092915050565b614b9381614b27565b82525050565b6000602082019050614bae6000830184614b8a565b92915050565b6000602082840312'
+    '15614bca57614bc961462b565b5b6000614bd884828501614abf565b91505092915050565b60008060408385031215614bf857614bf761462b565b5b6000614c'
+    '0685828601614abf565b9250506020614c17858286016147c3565b9150509250929050565b600081519050919050565b60008282526020820190509291505056'
+    '5b6000614c4882614c21565b614c528185614c2c565b9350614c6281856020860161470c565b614c6b81614736565b840191505092915050565b600060208201'
+    '90508181036000830152614c908184614c3d565b905092915050565b600060208284031215614cae57614cad61462b565b5b600082013567ffffffffffffffff'
+    '811115614ccc57614ccb614630565b5b614cd884828501614a0b565b91505092915050565b600067ffffffffffffffff821115614cfc57614cfb61490e565b5b'
+    '614d0582614736565b9050602081019050919050565b6000614d25614d2084614ce1565b61496e565b905082815260208101848484011115614d4157614d4061'
+    '4909565b5b614d4c8482856149ba565b509392505050565b600082601f830112614d6957614d68614904565b5b8135614d79848260208601614d12565b915050'
+    '92915050565b600060208284031215614d9857614d9761462b565b5b600082013567ffffffffffffffff811115614db657614db5614630565b5b614dc2848285'
+    '01614d54565b91505092915050565b60008060408385031215614de257614de161462b565b5b6000614df085828601614abf565b9250506020614e0185828601'
+    '614b48565b9150509250929050565b60008060408385031215614e2257614e2161462b565b5b6000614e3085828601614b48565b9250506020614e4185828601'
+    '6147c3565b9150509250929050565b600065ffffffffffff82169050919050565b614e6681614e4b565b82525050565b6000608082019050614e816000830187'
+    '614e5d565b614e8e6020830186614e5d565b614e9b60408301856146c6565b614ea860608301846146c6565b95945050505050565b600080fd5b600080fd5b60'
+    '008083601f840112614ed157614ed0614904565b5b8235905067ffffffffffffffff811115614eee57614eed614eb1565b5b6020830191508360018202830111'
+    '15614f0a57614f09614eb6565b5b9250929050565b60008060008060608587031215614f2b57614f2a61462b565b5b6000614f3987828801614abf565b945050'
+    '6020614f4a878288016147c3565b935050604085013567ffffffffffffffff811115614f6b57614f6a614630565b5b614f7787828801614ebb565b9250925050'
+    '92959194509250565b614f8e816146ba565b8114614f9957600080fd5b50565b600081359050614fab81614f85565b92915050565b6000806040838503121561'
+    '4fc857614fc761462b565b5b6000614fd685828601614abf565b9250506020614fe785828601614f9c565b9150509250929050565b614ffa8161488b565b8252'
+    '5050565b60007fffffffffffffffffffffffffffffffff0000000000000000000000000000000082169050919050565b61503581615000565b82525050565b60'
+    '007fffffffffffffffff00000000000000000000000000000000000000000000000082169050919050565b6150708161503b565b82525050565b600060a08201'
+    '905061508b6000830188614ff1565b6150986020830187614ff1565b6150a56040830186614ff1565b6150b2606083018561502c565b6150bf60808301846150'
+    '67565b9695505050505050565b600080600080608085870312156150e3576150e261462b565b5b60006150f187828801614abf565b9450506020615102878288'
+    '01614abf565b9350506040615113878288016147c3565b925050606085013567ffffffffffffffff81111561513457615133614630565b5b6151408782880161'
+    '4d54565b91505092959194509250565b600061ffff82169050919050565b6151638161514c565b811461516e57600080fd5b50565b6000813590506151808161'
+    '515a565b92915050565b61518f81614e4b565b811461519a57600080fd5b50565b6000813590506151ac81615186565b92915050565b60008060006060848603'
+    '12156151cb576151ca61462b565b5b60006151d986828701614b48565b93505060206151ea86828701615171565b92505060406151fb8682870161519d565b91'
+    '50509250925092565b6000806040838503121561521c5761521b61462b565b5b600083013567ffffffffffffffff81111561523a57615239614630565b5b6152'
+    '4685828601614d54565b9250506020615257858286016147c3565b9150509250929050565b60008060006060848603121561527a5761527961462b565b5b6000'
+    '61528886828701614abf565b935050602061529986828701614b48565b92505060406152aa86828701615171565b9150509250925092565b6000806040838503'
+    '12156152cb576152ca61462b565b5b60006152d985828601614abf565b92505060206152ea85828601614abf565b9150509250929050565b6000806000806080'
+    '858703121561530e5761530d61462b565b5b600061531c87828801614abf565b945050602061532d87828801614b48565b935050604061533e87828801615171'
+    '565b925050606061534f8782880161519d565b91505092959194509250565b60008160050b9050919050565b6153718161535b565b811461537c57600080fd5b'
+    '50565b60008135905061538e81615368565b92915050565b600080604083850312156153ab576153aa61462b565b5b60006153b985828601614b48565b925050'
+    '60206153ca8582860161537f565b9150509250929050565b7f4e487b710000000000000000000000000000000000000000000000000000000060005260116004'
+    '5260246000fd5b600061540e826147a2565b9150615419836147a2565b9250828201905080821115615431576154306153d4565b5b92915050565b7f4e487b71'
+    '00000000000000000000000000000000000000000000000000000000600052602260045260246000fd5b6000600282049050600182168061547e57607f821691'
+    '505b60208210810361549157615490615437565b5b50919050565b7f4552525f5052454649585f544f4f5f4c4f4e470000000000000000000000000060008201'
+    '5250565b60006154cd6013836146fb565b91506154d882615497565b602082019050919050565b600060208201905081810360008301526154fc816154c0565b'
+    '9050919050565b600061550e8261488b565b91506155198361488b565b92508282026155278161488b565b9150808214615539576155386153d4565b5b509291'
+    '5050565b600061554b8261488b565b91506000820361555e5761555d6153d4565b5b600182039050919050565b60006155748261488b565b915061557f836148'
+    '8b565b9250828201905060ff811115615598576155976153d4565b5b92915050565b60006155a98261488b565b91506155b48361488b565b9250828203905060'
+    'ff8111156155cd576155cc6153d4565b5b92915050565b6000819050602082019050919050565b60006155ef8251615000565b80915050919050565b60008160'
+    '020a8302905092915050565b600061561382614c21565b8261561d846155d3565b9050615628816155e3565b92506010821015615668576156637fffffffffff'
+    'ffffffffffffffffffffff00000000000000000000000000000000836010036008026155f8565b831692505b5050919050565b600061567a826147a2565b9150'
+    '615685836147a2565b925082820390508181111561569d5761569c6153d4565b5b92915050565b7f4e487b710000000000000000000000000000000000000000'
+    '0000000000000000600052603260045260246000fd5b60006156dd826147a2565b91507fffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffff820361570f5761570e6153d4565b5b600182019050919050565b60008190508160005260206000209050919050565b60006020601f83010490509190'
+    '50565b60006008830261576f7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff826155f8565b61577986836155f8565b955080'
+    '19841693508086168417925050509392505050565b6000819050919050565b60006157b66157b16157ac846147a2565b615791565b6147a2565b905091905056'
+    '5b6000819050919050565b6157d08361579b565b6157e46157dc826157bd565b84845461573f565b825550505050565b600090565b6157f96157ec565b615804'
+    '8184846157c7565b505050565b5b818110156158285761581d6000826157f1565b60018101905061580a565b5050565b601f82111561586d5761583e8161571a'
+    '565b6158478461572f565b81016020851015615856578190505b61586a6158628561572f565b830182615809565b50505b505050565b60008160020a83049050'
+    '92915050565b600061589360001984600802615872565b1980831691505092915050565b60006158ac8383615882565b9150826002028217905092915050565b'
+    '6158c582614c21565b67ffffffffffffffff8111156158de576158dd61490e565b5b6158e88254615466565b6158f382828561582c565b600060209050601f83'
+    '11600181146159265760008415615914578287015190505b61591e85826158a0565b865550615986565b601f1984166159348661571a565b60005b8281101561'
+    '595c57848901518255600182019150602085019450602081019050615937565b868310156159795784890151615975601f891682615882565b8355505b600160'
+    '0288020188555050505b505050505050565b7f4552525f41434345535300000000000000000000000000000000000000000000600082015250565b60006159c4'
+    '600a836146fb565b91506159cf8261598e565b602082019050919050565b600060208201905081810360008301526159f3816159b7565b9050919050565b6000'
+    '615a068251614b27565b80915050919050565b6000615a1a82614c21565b82615a24846155d3565b9050615a2f816159fa565b92506020821015615a6f57615a'
+    '6a7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff836020036008026155f8565b831692505b5050919050565b6000615a8182'
+    '6147a2565b9150615a8c836147a2565b9250828202615a9a816147a2565b91508282048414831517615ab157615ab06153d4565b5b5092915050565b7f455252'
+    '5f53504152534500000000000000000000000000000000000000000000600082015250565b6000615aee600a836146fb565b9150615af982615ab8565b602082'
+    '019050919050565b60006020820190508181036000830152615b1d81615ae1565b9050919050565b7f4552525f43415050454400000000000000000000000000'
+    '000000000000000000600082015250565b6000615b5a600a836146fb565b9150615b6582615b24565b602082019050919050565b600060208201905081810360'
+    '00830152615b8981615b4d565b9050919050565b7f4552525f4341505f4c4f57000000000000000000000000000000000000000000600082015250565b600061'
+    '5bc6600b836146fb565b9150615bd182615b90565b602082019050919050565b60006020820190508181036000830152615bf581615bb9565b9050919050565b'
+    '6000615c0782614e4b565b9150615c1283614e4b565b9250828201905065ffffffffffff811115615c3057615c2f6153d4565b5b92915050565b600081519050'
+    '615c4581614aa8565b92915050565b600060208284031215615c6157615c6061462b565b5b6000615c6f84828501615c36565b9150509291505056fea2646970'
+    '66735822122050c46c41c021119f2db1cd645fbb63951f9b71bc6bc73741dd001524ffd8683364736f6c63430008120033'
+    )
@@ -0,0 +1,136 @@
+# standard imports
+import os
+import mmap
+import json
+import logging
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+# external imports
+from chainlib.eth.constant import ZERO_ADDRESS
+from chainlib.error import JSONRPCException
+
+# local imports
+from .scan import pool_map
+from .sign import AllocationEntry
+from .sign import METHOD_ALLOCATE
+
+logg = logging.getLogger(__name__)
+
+
+def file_digest(path):
+    """Return the sha256 digest of the contents of the file at path, in hex.
+
+    The file is memory mapped, so that it is read in pages as it is hashed, without being copied into memory.
+    """
+    h = hashlib.sha256()
+    f = open(path, 'rb')
+    try:
+        if os.fstat(f.fileno()).st_size > 0:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if hasattr(m, 'madvise'):
+                    m.madvise(mmap.MADV_SEQUENTIAL)
+                h.update(m)
+            finally:
+                m.close()
+    finally:
+        f.close()
+    return h.hexdigest()
+
+
+def _file_digest(path):
+    return (path, file_digest(path),)
+
+
+def iter_asset_paths(paths):
+    """Yield the paths of all regular files in paths, in order, descending into directories.
+
+    The files of a directory are yielded in sorted order, with those of its subdirectories after them.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            if not os.path.isfile(path):
+                raise FileNotFoundError(path)
+            yield path
+            continue
+        for (root, dirs, files) in os.walk(path):
+            dirs.sort()
+            for v in sorted(files):
+                v = os.path.join(root, v)
+                if os.path.isfile(v):
+                    yield v
+
+
+def read_asset_list(f):
+    """Yield the paths listed in the file object f, one per line.
+    """
+    for line in f:
+        line = line.rstrip('\n')
+        if len(line) == 0 or line[0] == '#':
+            continue
+        yield line
+
+
+def hash_files(paths, workers=None):
+    """Yield the path and sha256 digest of every file in paths, in order, hashing them across a pool of workers processes.
+
+    workers defaults to one per core. With a single worker, files are hashed in the calling process.
+    """
+    if workers == None:
+        workers = os.cpu_count() or 1
+    workers = max(workers, 1)
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from pool_map(executor, _file_digest, paths, ordered=True, max_pending=workers * 2)
+    finally:
+        if executor != None:
+            executor.shutdown()
+
+
+def is_allocated(c, conn, contract_address, token_id, sender_address=ZERO_ADDRESS):
+    """Return True if token_id has been allocated in the token contract.
+    """
+    o = c.get_token_spec(contract_address, token_id, 0, sender_address=sender_address)
+    try:
+        conn.do(o)
+    except JSONRPCException:
+        return False
+    return True
+
+
+def asset_allocations(digests, amount=0, allocated=None, line=0):
+    """Yield an AllocationEntry of amount tokens for every (path, digest) in digests.
+
+    Files with the same contents as a file before them are skipped, since their token id is already allocated. If allocated is set, files whose digest it returns True for are skipped too.
+
+    The entries are numbered by their line in the manifest written by write_asset_manifest, following the given line.
+    """
+    seen = {}
+    for (path, digest) in digests:
+        if digest in seen:
+            logg.warning('{} has the same content as {}, skipping'.format(path, seen[digest]))
+            continue
+        seen[digest] = path
+        if allocated != None and allocated(digest):
+            logg.info('{} is already allocated as {}, skipping'.format(path, digest))
+            continue
+        line += 1
+        yield AllocationEntry(line, digest, amount=amount, path=path)
+
+
+def write_asset_manifest(w, entry):
+    """Write an allocation of asset_allocations to w as a line of json.
+
+    The lines are plan entries of the allocate method, which can also be signed with craft_nft.sign.
+    """
+    o = {
+        'method': METHOD_ALLOCATE,
+        'path': entry.path,
+        'token_id': entry.token_id,
+        'amount': entry.amount,
+        }
+    w.write(json.dumps(o) + '\n')
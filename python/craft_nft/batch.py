@@ -0,0 +1,227 @@
+# standard imports
+import bisect
+import logging
+
+# external imports
+from chainlib.eth.constant import ZERO_ADDRESS
+from chainlib.error import JSONRPCException
+
+# local imports
+from .rpc import batch_results
+from .rpc import find_length
+from .scan import Scanner
+
+logg = logging.getLogger(__name__)
+
+
+def read_specs(c, conn, contract_address, token_id, start=0, sender_address=ZERO_ADDRESS, batch_size=1, height=None):
+    """Return the specs of the batches of token_id from batch start onwards.
+
+    An empty list is returned if the token has not been allocated.
+    """
+    if start == 0:
+        scanner = Scanner(c, conn, contract_address, batch_size=batch_size, sender_address=sender_address, height=height)
+        try:
+            return scanner.token_specs(token_id)
+        except JSONRPCException:
+            return []
+        finally:
+            scanner.close()
+
+    req = lambda i: c.get_token_spec(contract_address, token_id, i, sender_address=sender_address, height=height)
+    count = find_length(conn, req, start=start)
+    reqs = [req(i) for i in range(start, count)]
+    return [c.parse_token_spec(r) for r in batch_results(conn, reqs, batch_size=batch_size)]
+
+
+def batch_available(spec, batch):
+    """Return True if a token can be minted from the batch with the given spec with mintFromBatchTo.
+    """
+    if spec.sparse:
+        return False
+    if spec.count == 0 and spec.capped:
+        # a unique token, which can only be minted once
+        return batch == 0 and spec.cursor == 0
+    if not spec.capped:
+        return True
+    return spec.cursor < spec.count
+
+
+class BatchTracker:
+    """Selects the batch of a token to mint from, without reading the batch specs for every mint.
+
+    The specs of all batches are read once, and are then updated locally for every mint issued. The batch selected is the first one with tokens left. Since batches only ever run out, the batches before it are not looked at again, and selecting a batch costs O(1) amortized.
+
+    If a mint fails, the local specs may no longer match the contract, and invalidate must be called. They are then read again on the next selection. Mints that are sent but not yet confirmed must be waited for before that, or they will not be counted.
+
+    When all batches known have run out, the batches allocated since the specs were read are fetched.
+    """
+
+    def __init__(self, c, conn, contract_address, token_id, sender_address=ZERO_ADDRESS, batch_size=1):
+        self.c = c
+        self.conn = conn
+        self.contract_address = contract_address
+        self.token_id = token_id
+        self.sender_address = sender_address
+        self.batch_size = batch_size
+        self.specs = None
+        self.current = 0
+
+
+    def sync(self):
+        """Read the specs of all batches of the token.
+        """
+        self.specs = read_specs(self.c, self.conn, self.contract_address, self.token_id, sender_address=self.sender_address, batch_size=self.batch_size)
+        self.current = 0
+        logg.debug('read {} batch specs of token {}'.format(len(self.specs), self.token_id))
+
+
+    def refresh(self):
+        """Read the specs of the batches allocated since the specs were last read, and return the number of new batches.
+        """
+        if self.specs == None or len(self.specs) == 0:
+            self.sync()
+            return len(self.specs)
+
+        r = read_specs(self.c, self.conn, self.contract_address, self.token_id, start=len(self.specs), sender_address=self.sender_address, batch_size=self.batch_size)
+        self.specs += r
+        return len(r)
+
+
+    def invalidate(self):
+        self.specs = None
+
+
+    def select(self):
+        """Return the first batch with tokens left to mint, or None if there is none.
+        """
+        if self.specs == None:
+            self.sync()
+
+        while True:
+            while self.current < len(self.specs):
+                if batch_available(self.specs[self.current], self.current):
+                    return self.current
+                self.current += 1
+            if self.refresh() == 0:
+                return None
+
+
+    def issue(self, batch, index=None):
+        """Count a mint from batch in the local specs, at index if it is given, and at the cursor of the batch if not.
+        """
+        if self.specs == None or batch >= len(self.specs):
+            return
+        spec = self.specs[batch]
+        if index != None and index != spec.cursor:
+            spec.sparse = True
+        spec.cursor += 1
+        if not spec.capped:
+            spec.count += 1
+
+
+class BatchIndex:
+    """Finds the batch of a token that holds a token by its index across all batches, by binary search over the cumulative counts of the batches.
+
+    The counts are read once. The count of a capped batch never changes, so lookups within the capped batches before the first unbounded one are answered without any queries. Otherwise the unbounded batches are read again, as are any batches allocated since the last read.
+
+    If height is set, the counts are read at that block.
+    """
+
+    def __init__(self, c, conn, contract_address, token_id, sender_address=ZERO_ADDRESS, batch_size=1, height=None):
+        self.c = c
+        self.conn = conn
+        self.contract_address = contract_address
+        self.token_id = token_id
+        self.sender_address = sender_address
+        self.batch_size = batch_size
+        self.height = height
+        self.specs = []
+        self.cumulative = []
+        self.open = None
+
+
+    def index(self, start=0):
+        """Recalculate the cumulative counts from batch start onwards.
+        """
+        del self.cumulative[start:]
+        c = 0
+        if start > 0:
+            c = self.cumulative[start - 1]
+        for spec in self.specs[start:]:
+            c += spec.count
+            self.cumulative.append(c)
+
+        self.open = None
+        for (i, spec) in enumerate(self.specs):
+            if not spec.capped:
+                self.open = i
+                break
+
+
+    def refresh(self):
+        """Read the unbounded batches again, and the batches allocated since the last read, and return the number of new batches.
+        """
+        start = len(self.specs)
+        if start == 0:
+            self.specs = read_specs(self.c, self.conn, self.contract_address, self.token_id, sender_address=self.sender_address, batch_size=self.batch_size, height=self.height)
+            self.index()
+            return len(self.specs)
+
+        changed = start
+        if self.open != None:
+            changed = self.open
+            indices = [i for i in range(self.open, start) if not self.specs[i].capped]
+            reqs = [self.c.get_token_spec(self.contract_address, self.token_id, i, sender_address=self.sender_address, height=self.height) for i in indices]
+            for (i, r) in zip(indices, batch_results(self.conn, reqs, batch_size=self.batch_size)):
+                self.specs[i] = self.c.parse_token_spec(r)
+
+        r = read_specs(self.c, self.conn, self.contract_address, self.token_id, start=start, sender_address=self.sender_address, batch_size=self.batch_size, height=self.height)
+        self.specs += r
+        self.index(changed)
+        return len(r)
+
+
+    def total(self):
+        if len(self.cumulative) == 0:
+            return 0
+        return self.cumulative[-1]
+
+
+    def stale(self, super_index):
+        """Return True if the counts must be read again to find the batch of super_index.
+        """
+        if super_index >= self.total():
+            return True
+        if self.open != None:
+            # the counts of unbounded batches grow with every mint, and move the batches after them
+            return super_index >= self.cumulative[self.open] - self.specs[self.open].count
+        return False
+
+
+    def batch_of(self, super_index):
+        """Return the batch that holds the token at super_index, counting across all batches in order.
+
+        Raises ValueError if super_index is beyond the last batch.
+        """
+        return self.batches_of([super_index])[0]
+
+
+    def batches_of(self, super_indices):
+        """Return the batch of each of super_indices, as batch_of.
+
+        The counts are read again at most once.
+        """
+        r = []
+        refreshed = False
+        for super_index in super_indices:
+            if super_index < 0:
+                raise ValueError(super_index)
+            if not refreshed and self.stale(super_index):
+                self.refresh()
+                refreshed = True
+            i = bisect.bisect_right(self.cumulative, super_index)
+            if i == len(self.cumulative):
+                raise ValueError(super_index)
+            r.append(i)
+        return r
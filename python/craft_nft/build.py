@@ -0,0 +1,97 @@
+"""Generate the artifact module of precomputed method selectors, event topics and bytecode from the contract build files
+
+.. moduleauthor:: Louis Holbrook <dev@holbrook.no>
+.. pgp:: 0826EDA1702D1E87C6E2875121D2E7BB88C2A746
+
+"""
+
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# standard imports
+import os
+import sys
+import json
+import argparse
+import logging
+
+# external imports
+from chainlib.hash import keccak256_string_to_hex
+
+logg = logging.getLogger(__name__)
+
+moddir = os.path.dirname(__file__)
+datadir = os.path.join(moddir, 'data')
+
+ARTIFACT_FILE = os.path.join(moddir, 'artifact.py')
+BYTECODE_LINE_SIZE = 128
+
+
+def signature(entry):
+    return '{}({})'.format(entry['name'], ','.join([v['type'] for v in entry['inputs']]))
+
+
+def selectors(abi):
+    r = {}
+    for entry in abi:
+        if entry['type'] == 'function':
+            s = signature(entry)
+            r[s] = keccak256_string_to_hex(s)[:8]
+    return r
+
+
+def topics(abi):
+    r = {}
+    for entry in abi:
+        if entry['type'] == 'event':
+            s = signature(entry)
+            r[s] = keccak256_string_to_hex(s)
+    return r
+
+
+def render(abi, bytecode):
+    s = '# generated by craft_nft.build from data/CraftNFT.json and data/CraftNFT.bin, do not edit\n\n'
+
+    s += 'SELECTORS = {\n'
+    for (k, v) in sorted(selectors(abi).items()):
+        s += "    '{}': '{}',\n".format(k, v)
+    s += '    }\n\n'
+
+    s += 'TOPICS = {\n'
+    for (k, v) in sorted(topics(abi).items()):
+        s += "    '{}': '{}',\n".format(k, v)
+    s += '    }\n\n'
+
+    bytecode = bytecode.strip()
+    s += 'BYTECODE = (\n'
+    for i in range(0, len(bytecode), BYTECODE_LINE_SIZE):
+        s += "    '{}'\n".format(bytecode[i:i+BYTECODE_LINE_SIZE])
+    s += '    )\n'
+    return s
+
+
+def render_files(abi_path, bytecode_path):
+    f = open(abi_path, 'r')
+    abi = json.load(f)
+    f.close()
+    f = open(bytecode_path, 'r')
+    bytecode = f.read()
+    f.close()
+    return render(abi, bytecode)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description='Generate the contract artifact module of the python package')
+    argparser.add_argument('--abi', type=str, default=os.path.join(datadir, 'CraftNFT.json'), help='Contract ABI file')
+    argparser.add_argument('--bytecode', type=str, default=os.path.join(datadir, 'CraftNFT.bin'), help='Contract bytecode file')
+    argparser.add_argument('-o', '--output', type=str, default=ARTIFACT_FILE, help='Module file to write (default: {})'.format(ARTIFACT_FILE))
+    args = argparser.parse_args()
+
+    s = render_files(args.abi, args.bytecode)
+    f = open(args.output, 'w')
+    f.write(s)
+    f.close()
+    sys.stderr.write('wrote {}\n'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+# standard imports
+import csv
+import json
+import logging
+from collections import deque
+
+# external imports
+from hexathon import strip_0x
+from hexathon import add_0x
+from chainlib.eth.address import to_checksum_address
+from chainlib.eth.error import RevertEthException
+from chainlib.error import RPCException
+
+# local imports
+from .batch import BatchTracker
+
+logg = logging.getLogger(__name__)
+
+MANIFEST_FIELDS = [
+    'recipient',
+    'token_id',
+    'batch',
+    'index',
+    ]
+
+DEFAULT_IN_FLIGHT = 16
+
+STATUS_SIGNED = 'signed'
+STATUS_SENT = 'sent'
+STATUS_SUCCESS = 'success'
+STATUS_REVERT = 'revert'
+STATUS_ERROR = 'error'
+
+
+class ManifestEntry:
+    """A token to mint, from the given line of a manifest.
+
+    If batch is None, the first batch with tokens left is used. If index is None, the next index of the batch is minted.
+    """
+
+    def __init__(self, line, recipient, token_id, batch=None, index=None):
+        self.line = line
+        self.recipient = recipient
+        self.token_id = token_id
+        self.batch = batch
+        self.index = index
+
+
+    def to_dict(self):
+        return {
+            'line': self.line,
+            'recipient': self.recipient,
+            'token_id': self.token_id,
+            'batch': self.batch,
+            'index': self.index,
+            }
+
+
+def _manifest_int(v):
+    if v == None or v == '':
+        return None
+    return int(v)
+
+
+def parse_manifest_entry(line, d, token_id=None):
+    """Return a ManifestEntry from a dict of manifest fields.
+
+    token_id is used for entries that do not specify one.
+    """
+    recipient = d.get('recipient')
+    if recipient == None or recipient == '':
+        raise ValueError('manifest line {}: recipient missing'.format(line))
+    recipient = add_0x(to_checksum_address(add_0x(recipient)))
+
+    v = d.get('token_id')
+    if v == None or v == '':
+        v = token_id
+    if v == None:
+        raise ValueError('manifest line {}: token id missing'.format(line))
+    v = strip_0x(v)
+    if len(bytes.fromhex(v)) != 32:
+        raise ValueError('manifest line {}: token id must be 32 bytes'.format(line))
+
+    batch = _manifest_int(d.get('batch'))
+    index = _manifest_int(d.get('index'))
+    if index != None and batch == None:
+        raise ValueError('manifest line {}: index given without batch'.format(line))
+
+    return ManifestEntry(line, recipient, v, batch=batch, index=index)
+
+
+def manifest_rows(f, fields=MANIFEST_FIELDS):
+    """Yield the line number and the dict of fields of every entry of a manifest, read from the file object f.
+
+    Each line is either a json object or csv. Csv lines hold the given fields in that order, unless the first csv line is a header naming the fields, which must include recipient. Empty lines and lines starting with # are skipped.
+    """
+    header = None
+    for (i, line) in enumerate(f):
+        line = line.strip()
+        if len(line) == 0 or line[0] == '#':
+            continue
+
+        if line[0] == '{':
+            d = json.loads(line)
+        else:
+            row = next(csv.reader([line]))
+            row = [v.strip() for v in row]
+            if header == None:
+                if 'recipient' in row:
+                    header = row
+                    continue
+                header = fields
+            d = dict(zip(header, row))
+
+        yield (i + 1, d,)
+
+
+def read_manifest(f, token_id=None):
+    """Yield the entries of a manifest of tokens to mint, read from the file object f.
+
+    Csv lines hold the fields recipient, token_id, batch and index in that order, unless the first csv line is a header naming the fields. Only the recipient is required, and token_id if it is not given.
+
+    The manifest is read one line at a time.
+    """
+    for (line, d) in manifest_rows(f):
+        yield parse_manifest_entry(line, d, token_id=token_id)
+
+
+def read_results(f):
+    """Return the manifest lines that a transaction has been sent for, from an earlier results file.
+
+    Lines whose last transaction was reverted are not included, so that they are minted again.
+    """
+    r = set()
+    for line in f:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        o = json.loads(line)
+        if o['status'] == STATUS_REVERT:
+            r.discard(o['line'])
+        elif o.get('tx_hash') != None and o['status'] != STATUS_SIGNED:
+            r.add(o['line'])
+    return r
+
+
+def tx_nonce(tx_raw):
+    """Return the nonce of a signed raw transaction, given in hex.
+    """
+    # the rlp module is a dependency of chainlib's transaction stack
+    import rlp
+    fields = rlp.decode(bytes.fromhex(strip_0x(tx_raw)))
+    return int.from_bytes(fields[0], byteorder='big')
+
+
+class BulkMinter:
+    """Mints the tokens of manifest entries, signing with the nonce oracle of the CraftNFT object c, which assigns nonces locally in sequence.
+
+    At most in_flight transactions are sent without having been confirmed. When the limit is reached, the oldest one is waited for.
+
+    A result is written to w as a line of json for every transaction signed, sent and confirmed. If send is not set, the signed transactions are written to the results, and not sent.
+
+    If a transaction cannot be sent, the transactions already sent are waited for, and the error is raised. Since the nonce of the failed transaction is not used, the transactions after it cannot be sent before it.
+    """
+
+    def __init__(self, c, conn, contract_address, sender_address, in_flight=DEFAULT_IN_FLIGHT, send=True, w=None):
+        self.c = c
+        self.conn = conn
+        self.contract_address = contract_address
+        self.sender_address = sender_address
+        self.in_flight = max(in_flight, 1)
+        self.send = send
+        self.w = w
+        self.pending = deque()
+        self.trackers = {}
+        self.count = 0
+
+
+    def write(self, entry, status, **kwargs):
+        o = entry.to_dict()
+        o['status'] = status
+        o.update(kwargs)
+        if self.w != None:
+            self.w.write(json.dumps(o) + '\n')
+            self.w.flush()
+
+
+    def tracker(self, token_id):
+        """Return the batch tracker of token_id.
+
+        The mints sent are waited for before the specs of the tracker are read, so that they are counted.
+        """
+        tracker = self.trackers.get(token_id)
+        if tracker == None:
+            tracker = BatchTracker(self.c, self.conn, self.contract_address, token_id, sender_address=self.sender_address)
+            self.trackers[token_id] = tracker
+        if tracker.specs == None:
+            self.drain()
+            tracker.sync()
+        return tracker
+
+
+    def select_batch(self, token_id):
+        """Return the first batch of token_id that has tokens left to mint, counting the mints that are not yet confirmed.
+        """
+        return self.tracker(token_id).select()
+
+
+    def mint(self, entry):
+        batch = entry.batch
+        if batch == None:
+            batch = self.select_batch(entry.token_id)
+            if batch == None and len(self.pending) > 0:
+                # a mint sent that fails leaves a token that was counted as minted
+                self.drain()
+                batch = self.select_batch(entry.token_id)
+            if batch == None:
+                self.write(entry, STATUS_ERROR, error='no batch of token has tokens left to mint')
+                raise ValueError('no batch of token {} has tokens left to mint'.format(entry.token_id))
+
+        (tx_hash_hex, o) = self.c.mint_to(
+                self.contract_address,
+                self.sender_address,
+                entry.recipient,
+                entry.token_id,
+                batch,
+                index=entry.index,
+                )
+        tx_raw = o['params'][0]
+        nonce = tx_nonce(tx_raw)
+        self.count += 1
+
+        tracker = self.trackers.get(entry.token_id)
+        if tracker != None:
+            tracker.issue(batch, index=entry.index)
+
+        if not self.send:
+            self.write(entry, STATUS_SIGNED, batch=batch, nonce=nonce, tx_hash=tx_hash_hex, tx=tx_raw)
+            return tx_hash_hex
+
+        try:
+            self.conn.do(o)
+        except RPCException as e:
+            self.write(entry, STATUS_ERROR, batch=batch, nonce=nonce, error=str(e))
+            self.drain()
+            raise
+        self.write(entry, STATUS_SENT, batch=batch, nonce=nonce, tx_hash=tx_hash_hex)
+
+        self.pending.append((entry, batch, nonce, tx_hash_hex,))
+        while len(self.pending) >= self.in_flight:
+            self.confirm()
+        return tx_hash_hex
+
+
+    def confirm(self):
+        """Wait for the oldest transaction sent, and write its result.
+        """
+        (entry, batch, nonce, tx_hash_hex) = self.pending.popleft()
+        status = STATUS_SUCCESS
+        try:
+            r = self.conn.wait(tx_hash_hex)
+            v = r['status']
+            if isinstance(v, str):
+                v = int(v, 16)
+            if v == 0:
+                status = STATUS_REVERT
+        except RevertEthException:
+            status = STATUS_REVERT
+        if status == STATUS_REVERT:
+            tracker = self.trackers.get(entry.token_id)
+            if tracker != None:
+                tracker.invalidate()
+        self.write(entry, status, batch=batch, nonce=nonce, tx_hash=tx_hash_hex)
+        return status
+
+
+    def drain(self):
+        while len(self.pending) > 0:
+            self.confirm()
+
+
+    def mint_all(self, entries, skip=None):
+        """Mint the tokens of all entries, except those whose manifest line is in skip, and wait for all of them to be confirmed.
+
+        Returns the number of transactions signed.
+        """
+        for entry in entries:
+            if skip != None and entry.line in skip:
+                logg.debug('skipping manifest line {}, already sent'.format(entry.line))
+                continue
+            self.mint(entry)
+        self.drain()
+        return self.count
@@ -0,0 +1,191 @@
+# standard imports
+import logging
+import threading
+import sqlite3
+import json
+import time
+from collections import OrderedDict
+
+# external imports
+from hexathon import strip_0x
+
+logg = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_TTL = 12.0
+
+# block tags whose state changes as new blocks arrive
+MOVING_BLOCK_TAGS = [
+    'latest',
+    'pending',
+    'safe',
+    'finalized',
+    ]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS call (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    expires REAL
+);
+"""
+
+COMMIT_INTERVAL = 100
+
+
+def call_key(o):
+    """Return the cache key of an eth_call or eth_getStorageAt query, and whether the query is made against a fixed block.
+
+    Returns None as the key if the query is neither.
+    """
+    method = o.get('method')
+    if method == 'eth_call':
+        height_param = 1
+    elif method == 'eth_getStorageAt':
+        height_param = 2
+    else:
+        return (None, False,)
+
+    height = 'latest'
+    if len(o['params']) > height_param:
+        height = o['params'][height_param]
+    if isinstance(height, dict):
+        height = height['blockHash']
+    pinned = height not in MOVING_BLOCK_TAGS
+
+    if method == 'eth_getStorageAt':
+        key = 'storage:{}:{}:{}'.format(
+                strip_0x(o['params'][0]).lower(),
+                int(o['params'][1], 16),
+                height,
+                )
+        return (key, pinned,)
+
+    tx = o['params'][0]
+    key = '{}:{}:{}:{}'.format(
+            strip_0x(tx['to']).lower(),
+            strip_0x(tx['data']).lower(),
+            strip_0x(tx.get('from', '')).lower(),
+            height,
+            )
+    return (key, pinned,)
+
+
+class CachingConnection:
+    """Read-through cache of eth_call and eth_getStorageAt results, wrapping a json-rpc connection.
+
+    Results are kept in memory in a least recently used list of at most size entries. If path is given, results are also kept in an sqlite database file, which outlives the connection.
+
+    Results of queries made against a block number or hash never expire. Results of queries against the latest block expire after ttl seconds. Failed queries are not cached.
+
+    All other queries are passed to the wrapped connection.
+    """
+
+    def __init__(self, conn, size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_TTL, path=None):
+        self.conn = conn
+        self.size = size
+        self.ttl = ttl
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        self.writes = 0
+        if path != None:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.executescript(SCHEMA)
+
+
+    def __getattr__(self, k):
+        return getattr(self.conn, k)
+
+
+    def close(self):
+        with self.lock:
+            if self.db != None:
+                self.db.commit()
+                self.db.close()
+                self.db = None
+
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            v = self.cache.get(key)
+            if v == None and self.db != None:
+                r = self.db.execute('SELECT result, expires FROM call WHERE key = ?', (key,)).fetchone()
+                if r != None:
+                    v = (json.loads(r[0]), r[1],)
+                    self.__put_memory(key, v)
+            if v != None:
+                (result, expires) = v
+                if expires == None or expires > now:
+                    self.cache.move_to_end(key)
+                    self.hits += 1
+                    return (True, result,)
+                del self.cache[key]
+            self.misses += 1
+        return (False, None,)
+
+
+    def put(self, key, result, pinned):
+        expires = None
+        if not pinned:
+            if self.ttl <= 0:
+                return
+            expires = time.time() + self.ttl
+        v = (result, expires,)
+        with self.lock:
+            self.__put_memory(key, v)
+            if self.db != None:
+                self.db.execute('INSERT OR REPLACE INTO call (key, result, expires) VALUES (?, ?, ?)', (key, json.dumps(result), expires,))
+                self.writes += 1
+                if self.writes % COMMIT_INTERVAL == 0:
+                    self.db.commit()
+
+
+    def __put_memory(self, key, v):
+        self.cache[key] = v
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.size:
+            self.cache.popitem(last=False)
+
+
+    def do(self, o, **kwargs):
+        if isinstance(o, list):
+            return self.__do_batch(o, **kwargs)
+
+        (key, pinned) = call_key(o)
+        if key == None:
+            return self.conn.do(o, **kwargs)
+
+        (found, r) = self.get(key)
+        if found:
+            return r
+        r = self.conn.do(o, **kwargs)
+        self.put(key, r, pinned)
+        return r
+
+
+    def __do_batch(self, o, **kwargs):
+        results = [None] * len(o)
+        missing = []
+        for (i, v) in enumerate(o):
+            (key, pinned) = call_key(v)
+            if key != None:
+                (found, r) = self.get(key)
+                if found:
+                    results[i] = r
+                    continue
+            missing.append((i, key, pinned,))
+
+        if len(missing) == 1:
+            r = [self.conn.do(o[missing[0][0]], **kwargs)]
+        elif len(missing) > 1:
+            r = self.conn.do([o[v[0]] for v in missing], **kwargs)
+
+        for (j, (i, key, pinned)) in enumerate(missing):
+            results[i] = r[j]
+            if key != None:
+                self.put(key, r[j], pinned)
+        return results
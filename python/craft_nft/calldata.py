@@ -0,0 +1,56 @@
+# standard imports
+import logging
+
+# external imports
+from hexathon import strip_0x
+from hexathon import pad
+from chainlib.hash import keccak256_string_to_hex
+
+# local imports
+from .artifact import SELECTORS
+
+logg = logging.getLogger(__name__)
+
+_selectors = dict(SELECTORS)
+
+
+def method_selector(signature):
+    """Return the method selector of the given method signature, in hex.
+
+    Selectors of the contract methods are generated at build time. Others are only calculated the first time they are requested.
+    """
+    s = _selectors.get(signature)
+    if s == None:
+        s = keccak256_string_to_hex(signature)[:8]
+        _selectors[signature] = s
+    return s
+
+
+def word_uint(v):
+    return int(v).to_bytes(32, 'big').hex()
+
+
+def word_bytes32(v):
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        if len(v) > 32:
+            raise ValueError('value too long ({})'.format(len(v) * 2))
+        return bytes(v).rjust(32, b'\x00').hex()
+    v = strip_0x(v)
+    if len(v) > 64:
+        raise ValueError('value too long ({})'.format(len(v)))
+    return pad(v, 32)
+
+
+def word_address(v):
+    v = strip_0x(v)
+    if len(v) != 40:
+        raise ValueError('value wrong size; expected 20 bytes, got {}'.format(len(v)))
+    return pad(v, 32)
+
+
+def calldata(signature, *words):
+    """Build contract input data for methods whose arguments are all fixed size, from pre-encoded 32 byte argument words.
+
+    The result is the same as that of chainlib.eth.contract.ABIContractEncoder for the same method and arguments.
+    """
+    return method_selector(signature) + ''.join(words)
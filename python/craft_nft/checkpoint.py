@@ -0,0 +1,38 @@
+# standard imports
+import os
+import json
+import logging
+
+logg = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """Keeps the state of an interrupted token dump in a json file, so that it can be resumed.
+
+    The file is replaced atomically on every save, so a crash leaves either the previous or the new state.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+
+    def load(self):
+        try:
+            f = open(self.path, 'r')
+        except FileNotFoundError:
+            return None
+        state = json.load(f)
+        f.close()
+        logg.debug('loaded checkpoint {}: {}'.format(self.path, state))
+        return state
+
+
+    def save(self, state):
+        tmp_path = self.path + '.tmp'
+        f = open(tmp_path, 'w')
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp_path, self.path)
+        logg.debug('saved checkpoint {}: {}'.format(self.path, state))
@@ -0,0 +1,176 @@
+# standard imports
+import logging
+
+# external imports
+from hexathon import strip_0x
+
+# local imports
+from .nft import TokenSpec
+from .nft import MintedToken
+from .nft import FLAG_SINGLE
+
+logg = logging.getLogger(__name__)
+
+WORD_SIZE = 32
+TOKEN_SPEC_SIZE = WORD_SIZE * 4
+
+# the capped word of token spec results from contracts that do not return it
+CAPPED_WORD = '0' * 63 + '1'
+
+# numpy takes long to import, so it is only imported when first used
+numpy = None
+__numpy_checked = False
+
+
+def have_numpy():
+    global numpy
+    global __numpy_checked
+    if not __numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        __numpy_checked = True
+    return numpy != None
+
+
+def _to_buffer(values, size, pad_capped=False):
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return bytes(values)
+
+    # hexathon.strip_0x validates every value, which is too slow for this
+    s = []
+    length = size * 2
+    short_length = length - len(CAPPED_WORD)
+    for v in values:
+        if v[:2] == '0x':
+            v = v[2:]
+        if len(v) != length:
+            if pad_capped and len(v) == short_length:
+                v += CAPPED_WORD
+            else:
+                # such as the empty result of a call to an address without the contract
+                raise ValueError('result must be {} bytes, got {}'.format(size, len(v) // 2))
+        s.append(v)
+    return bytes.fromhex(''.join(s))
+
+
+def decode_tokens(values, use_numpy=True):
+    """Decode many raw mintedToken results at once.
+
+    values may be a sequence of results in hex, or a buffer of the results concatenated.
+
+    Returns a dict of columns, one row per result:
+
+    * minted: whether the token has been minted
+    * single: whether the token is a unique token
+    * content: the 8 bytes of the token content stored with a batch token, as int
+    * owner: the 20 byte owner address
+
+    If numpy is installed and use_numpy is set, the columns are numpy arrays, with the owner column as an array of 20 byte rows. Otherwise they are lists, with owner as hex.
+    """
+    b = _to_buffer(values, WORD_SIZE)
+    if len(b) % WORD_SIZE > 0:
+        raise ValueError('token results must be {} bytes each'.format(WORD_SIZE))
+
+    if use_numpy and have_numpy():
+        a = numpy.frombuffer(b, dtype=numpy.uint8).reshape(-1, WORD_SIZE)
+        return {
+            'minted': a.any(axis=1),
+            'single': (a[:, 0] & FLAG_SINGLE) > 0,
+            'content': a[:, 1:9].copy().view('>u8').reshape(-1).astype(numpy.uint64),
+            'owner': a[:, 12:],
+            }
+
+    r = {
+        'minted': [],
+        'single': [],
+        'content': [],
+        'owner': [],
+        }
+    for i in range(0, len(b), WORD_SIZE):
+        w = b[i:i+WORD_SIZE]
+        r['minted'].append(any(w))
+        r['single'].append(w[0] & FLAG_SINGLE > 0)
+        r['content'].append(int.from_bytes(w[1:9], 'big'))
+        r['owner'].append(w[12:].hex())
+    return r
+
+
+def decode_token_specs(values, use_numpy=True):
+    """Decode many raw token spec results at once.
+
+    values may be a sequence of results in hex, or a buffer of the results concatenated, in which case each must include the capped word.
+
+    Returns a dict of columns, one row per result: count, cursor, sparse and capped.
+
+    If numpy is installed and use_numpy is set, the columns are numpy arrays. Otherwise they are lists.
+    """
+    b = _to_buffer(values, TOKEN_SPEC_SIZE, pad_capped=True)
+    if len(b) % TOKEN_SPEC_SIZE > 0:
+        raise ValueError('token spec results must be {} bytes each'.format(TOKEN_SPEC_SIZE))
+
+    if use_numpy and have_numpy():
+        a = numpy.frombuffer(b, dtype=numpy.uint8).reshape(-1, 4, WORD_SIZE)
+        return {
+            'count': a[:, 0, 24:].copy().view('>u8').reshape(-1).astype(numpy.uint64),
+            'cursor': a[:, 1, 24:].copy().view('>u8').reshape(-1).astype(numpy.uint64),
+            'sparse': a[:, 2, :].any(axis=1),
+            'capped': a[:, 3, :].any(axis=1),
+            }
+
+    r = {
+        'count': [],
+        'cursor': [],
+        'sparse': [],
+        'capped': [],
+        }
+    for i in range(0, len(b), TOKEN_SPEC_SIZE):
+        w = b[i:i+TOKEN_SPEC_SIZE]
+        r['count'].append(int.from_bytes(w[24:32], 'big'))
+        r['cursor'].append(int.from_bytes(w[56:64], 'big'))
+        r['sparse'].append(any(w[64:96]))
+        r['capped'].append(any(w[96:128]))
+    return r
+
+
+def parse_tokens(values, token_ids, use_numpy=True):
+    """Bulk version of CraftNFT.parse_token, returning a MintedToken for each result and corresponding token id.
+
+    The token ids may be given in hex, or as 32 byte keys.
+    """
+    d = decode_tokens(values, use_numpy=use_numpy)
+    r = []
+    for i, token_id in enumerate(token_ids):
+        if not d['minted'][i]:
+            r.append(MintedToken())
+            continue
+
+        owner = d['owner'][i]
+        if not isinstance(owner, str):
+            owner = owner.tobytes().hex()
+
+        if isinstance(token_id, str):
+            token_id = strip_0x(token_id)
+        else:
+            token_id = bytes(token_id).hex()
+        if d['single'][i]:
+            r.append(MintedToken(owner, token_id=token_id, batched=True, minted=True))
+            continue
+
+        o = MintedToken(owner, minted=True)
+        o.batch = int(token_id[48:52], 16)
+        o.index = int(token_id[52:64], 16)
+        o.token_id = token_id[:48] + int(d['content'][i]).to_bytes(8, 'big').hex()
+        r.append(o)
+    return r
+
+
+def parse_token_specs(values, use_numpy=True):
+    """Bulk version of CraftNFT.parse_token_spec, returning a TokenSpec for each result.
+    """
+    d = decode_token_specs(values, use_numpy=use_numpy)
+    r = []
+    for i in range(len(d['count'])):
+        r.append(TokenSpec(int(d['count'][i]), int(d['cursor'][i]), bool(d['sparse'][i]), bool(d['capped'][i])))
+    return r
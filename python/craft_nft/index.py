@@ -0,0 +1,204 @@
+# standard imports
+import logging
+
+# external imports
+from hexathon import strip_0x
+from hexathon import add_0x
+from chainlib.jsonrpc import JSONRPCRequest
+from chainlib.eth.block import block_latest
+from chainlib.eth.block import block_by_hash
+
+# local imports
+from .nft import TokenSpec
+from .nft import MintedToken
+from .nft import BatchSpec
+from .rpc import batch_results
+from .artifact import TOPICS
+
+logg = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_CHUNK = 10000
+
+TOPIC_ALLOCATE = TOPICS['Allocate(address,uint48,bool,bytes32)']
+TOPIC_MINT = TOPICS['Mint(address,address,uint256)']
+TOPIC_TRANSFER = TOPICS['Transfer(address,address,uint256)']
+
+
+def get_logs(contract_address, from_block, to_block, topics=None, id_generator=None):
+    j = JSONRPCRequest(id_generator)
+    o = j.template()
+    o['method'] = 'eth_getLogs'
+    q = {
+        'address': add_0x(contract_address),
+        'fromBlock': hex(from_block),
+        'toBlock': hex(to_block),
+        }
+    if topics != None:
+        q['topics'] = topics
+    o['params'].append(q)
+    o = j.finalize(o)
+    return o
+
+
+def block_height(conn):
+    o = block_latest()
+    r = conn.do(o)
+    return int(strip_0x(r), 16)
+
+
+def block_number(conn, block_hash):
+    o = block_by_hash(add_0x(block_hash), include_tx=False)
+    r = conn.do(o)
+    if isinstance(r['number'], int):
+        return r['number']
+    return int(strip_0x(r['number']), 16)
+
+
+def iter_logs(conn, contract_address, from_block, to_block, topics=None, chunk_size=DEFAULT_BLOCK_CHUNK, batch_size=1):
+    """Yield the event logs of the contract between from_block and to_block, both inclusive, querying chunk_size blocks at a time.
+    """
+    reqs = []
+    for i in range(from_block, to_block + 1, chunk_size):
+        reqs.append(get_logs(contract_address, i, min(i + chunk_size - 1, to_block), topics=topics))
+    logg.debug('get logs for block {} to {} in {} chunks'.format(from_block, to_block, len(reqs)))
+
+    for r in batch_results(conn, reqs, batch_size=batch_size):
+        yield from r
+
+
+def iter_index_logs(conn, contract_address, from_block, to_block, chunk_size=DEFAULT_BLOCK_CHUNK, batch_size=1):
+    """Yield the Allocate, Mint and Transfer event logs of the contract between from_block and to_block, both inclusive.
+    """
+    topics = [[
+        add_0x(TOPIC_ALLOCATE),
+        add_0x(TOPIC_MINT),
+        add_0x(TOPIC_TRANSFER),
+        ]]
+    return iter_logs(conn, contract_address, from_block, to_block, topics=topics, chunk_size=chunk_size, batch_size=batch_size)
+
+
+class TokenIndex:
+    """Token, batch and owner tables rebuilt from the Allocate, Mint and Transfer events of a token contract.
+
+    The contract does not emit an event when an unbounded batch is capped. The count of such a batch will be the number of tokens minted, as if it were still unbounded.
+    """
+
+    def __init__(self, from_block=0):
+        self.next_block = from_block
+        self.tokens = []
+        self.specs = {}
+        self.prefixes = {}
+        self.keys = {}
+        self.mints = {}
+        self.owners = {}
+
+
+    def sync(self, conn, contract_address, to_block=None, chunk_size=DEFAULT_BLOCK_CHUNK, batch_size=1):
+        if to_block == None:
+            to_block = block_height(conn)
+        if to_block < self.next_block:
+            return
+
+        for log in iter_index_logs(conn, contract_address, self.next_block, to_block, chunk_size=chunk_size, batch_size=batch_size):
+            self.add_log(log)
+        self.next_block = to_block + 1
+
+
+    def add_log(self, log):
+        topics = log['topics']
+        topic = strip_0x(topics[0])
+        if topic == TOPIC_ALLOCATE:
+            count = int(strip_0x(topics[2]), 16)
+            capped = int(strip_0x(topics[3]), 16) > 0
+            self.add_allocate(strip_0x(log['data'])[:64], count, capped)
+        elif topic == TOPIC_MINT:
+            self.add_mint(strip_0x(log['data'])[:64], strip_0x(topics[2])[24:])
+        elif topic == TOPIC_TRANSFER:
+            self.add_transfer(strip_0x(topics[3]), strip_0x(topics[2])[24:])
+
+
+    def add_allocate(self, token_id, count, capped):
+        specs = self.specs.get(token_id)
+        if specs == None:
+            specs = []
+            self.specs[token_id] = specs
+            self.tokens.append(token_id)
+            self.prefixes[token_id[:48]] = token_id
+            self.keys[token_id] = []
+        specs.append(TokenSpec(count, 0, False, capped))
+
+
+    def add_mint(self, key, owner):
+        specs = self.specs.get(key)
+        if specs != None and specs[0].count == 0 and specs[0].capped:
+            # a unique token, whose key is the token id. the key of the first token of a batch is the same as the token id if it ends with eight zero bytes
+            specs[0].cursor += 1
+            token = MintedToken(owner, token_id=key, batched=True, minted=True)
+            token_id = key
+        else:
+            token_id = self.prefixes.get(key[:48])
+            if token_id == None:
+                logg.warning('mint of key {} without matching allocation, skipping'.format(key))
+                return
+            token = MintedToken(owner, token_id=token_id, minted=True)
+            token.batch = int(key[48:52], 16)
+            token.index = int(key[52:64], 16)
+            spec = self.specs[token_id][token.batch]
+            if token.index != spec.cursor:
+                spec.sparse = True
+            spec.cursor += 1
+            if not spec.capped:
+                spec.count += 1
+
+        self.mints[key] = token
+        self.keys[token_id].append(key)
+        self.__add_owner(owner, key)
+
+
+    def add_transfer(self, key, owner):
+        token = self.mints.get(key)
+        if token == None:
+            logg.warning('transfer of unknown key {}, skipping'.format(key))
+            return
+        self.owners[token.owner].discard(key)
+        token.owner = owner
+        self.__add_owner(owner, key)
+
+
+    def __add_owner(self, owner, key):
+        keys = self.owners.get(owner)
+        if keys == None:
+            keys = set()
+            self.owners[owner] = keys
+        keys.add(key)
+
+
+    def token_ids(self):
+        return list(self.tokens)
+
+
+    def tokens_of(self, owner):
+        owner = strip_0x(owner).lower()
+        return sorted(self.owners.get(owner, []))
+
+
+    def minted(self, token_id=None):
+        if token_id == None:
+            token_ids = self.tokens
+        else:
+            token_ids = [strip_0x(token_id)]
+
+        for token_id in token_ids:
+            for key in sorted(self.keys.get(token_id, [])):
+                yield self.mints[key]
+
+
+    def iter_specs(self, token_id=None):
+        if token_id == None:
+            token_ids = self.tokens
+        else:
+            token_ids = [strip_0x(token_id)]
+
+        for token_id in token_ids:
+            for (i, spec) in enumerate(self.specs.get(token_id, [])):
+                yield BatchSpec(token_id, i, spec)
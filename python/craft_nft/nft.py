@@ -1,5 +1,6 @@
 # standard imports
 import os
+import json
 import logging
 
 # external imports
@@ -14,16 +15,25 @@ from chainlib.jsonrpc import JSONRPCRequest
 from chainlib.eth.constant import ZERO_ADDRESS
 from chainlib.eth.constant import ZERO_CONTENT
 from chainlib.eth.address import to_checksum_address
+from chainlib.error import JSONRPCException
 
 # local imports
 from .error import InvalidBatchError
 from .eth import ABIContractType
+from .calldata import calldata
+from .calldata import word_uint
+from .calldata import word_bytes32
+from .calldata import word_address
+from .artifact import BYTECODE
 
 moddir = os.path.dirname(__file__)
 datadir = os.path.join(moddir, 'data')
 
 INVALID_BATCH = (2**256)-1
 
+# set in the first byte of the minted token word of a unique token
+FLAG_SINGLE = 0x40
+
 logg = logging.getLogger(__name__)
 
 
@@ -37,12 +47,64 @@ def to_batch_key(token_id, batch, index):
         return token_id
 
 
+def to_batch_key_bytes(token_id, batch, index):
+    if len(token_id) != 32:
+        raise ValueError('token id must be 32 bytes')
+    return bytes(token_id[:24]) + batch.to_bytes(2, byteorder='big') + index.to_bytes(6, byteorder='big')
+
+
+def batch_keys(token_id, batch, indices):
+    """Yield the keys of the given indices in a token batch, as bytes.
+
+    The token id may be bytes, bytearray or memoryview.
+    """
+    if len(token_id) != 32:
+        raise ValueError('token id must be 32 bytes')
+    if batch < 0 or batch >= 1 << 16:
+        raise OverflowError('batch {} out of range'.format(batch))
+    prefix = (int.from_bytes(token_id[:24], byteorder='big') << 64) | (batch << 48)
+    for index in indices:
+        if index < 0 or index >= 1 << 48:
+            raise OverflowError('index {} out of range'.format(index))
+        yield (prefix | index).to_bytes(32, byteorder='big')
+
+
+def parse_token_word(v, token_id):
+    """Bytes version of CraftNFT.parse_token, taking the raw 32 byte mintedToken word and the 32 byte key it was queried with.
+    """
+    if not any(v):
+        return MintedToken()
+
+    owner = bytes(v[12:]).hex()
+    if v[0] & FLAG_SINGLE > 0:
+        return MintedToken(owner, token_id=bytes(token_id).hex(), batched=True, minted=True)
+
+    o = MintedToken(owner, minted=True)
+    o.batch = int.from_bytes(token_id[24:26], byteorder='big')
+    o.index = int.from_bytes(token_id[26:32], byteorder='big')
+    o.token_id = bytes(token_id[:24]).hex() + bytes(v[1:9]).hex()
+    return o
+
+
+def to_block_param(height):
+    if height == None:
+        return 'latest'
+    if isinstance(height, int):
+        return hex(height)
+    if len(strip_0x(height)) == 64:
+        return {
+            'blockHash': add_0x(height),
+            }
+    return height
+
+
 class TokenSpec:
 
-    def __init__(self, count, cursor, sparse):
+    def __init__(self, count, cursor, sparse, capped=True):
         self.count = count
         self.cursor = cursor
         self.sparse = sparse
+        self.capped = capped
 
 
     def __str__(self):
@@ -60,6 +122,23 @@ class MintedToken:
         self.token_id = token_id
 
 
+    def key(self):
+        if self.batched:
+            return self.token_id
+        return to_batch_key(self.token_id, self.batch, self.index)
+
+
+    def to_dict(self):
+        return {
+            'key': self.key(),
+            'token_id': self.token_id,
+            'batched': self.batched,
+            'batch': self.batch,
+            'index': self.index,
+            'owner': add_0x(to_checksum_address(self.owner)),
+            }
+
+
     def __str__(self):
         owner = to_checksum_address(self.owner)
         if self.batched:
@@ -67,9 +146,8 @@ class MintedToken:
                     self.token_id,
                     owner,
                     )
-        token_key = to_batch_key(self.token_id, self.batch, self.index)
         return '{} owned by {} - (id {} batch {} index {})'.format(
-                token_key,
+                self.key(),
                 owner,
                 self.token_id,
                 self.batch,
@@ -77,10 +155,39 @@ class MintedToken:
                 )
 
 
+class BatchSpec:
+    """The spec of a batch of a token, as yielded by CraftNFT.iter_specs.
+    """
+
+    def __init__(self, token_id, batch, spec):
+        self.token_id = token_id
+        self.batch = batch
+        self.spec = spec
+
+
+    def to_dict(self):
+        return {
+            'token_id': self.token_id,
+            'batch': self.batch,
+            'count': self.spec.count,
+            'cursor': self.spec.cursor,
+            'sparse': self.spec.sparse,
+            'capped': self.spec.capped,
+            }
+
+
+    def __str__(self):
+        return '{} batch {} minted {}'.format(self.token_id, self.batch, self.spec)
+
+
 class CraftNFT(ERC721):
 
     __abi = None
-    __bytecode = None
+
+    def __init__(self, *args, **kwargs):
+        super(CraftNFT, self).__init__(*args, **kwargs)
+        self.batch_indices = {}
+
 
     @staticmethod
     def abi():
@@ -93,11 +200,7 @@ class CraftNFT(ERC721):
 
     @staticmethod
     def bytecode(version=None):
-        if CraftNFT.__bytecode == None:
-            f = open(os.path.join(datadir, 'CraftNFT.bin'))
-            CraftNFT.__bytecode = f.read()
-            f.close()
-        return CraftNFT.__bytecode
+        return BYTECODE
 
 
     @staticmethod
@@ -125,108 +228,106 @@ class CraftNFT(ERC721):
 
     
     def allocate(self, contract_address, sender_address, token_id, amount=0, tx_format=TxFormat.JSONRPC):
-        enc = ABIContractEncoder()
-        enc.method('allocate')
-        enc.typ(ABIContractType.BYTES32)
-        enc.typ_literal('int48')
-        enc.bytes32(token_id)
         if amount < 0:
-            enc.bytes32('ff' * 32)
+            amount_word = word_bytes32('ff' * 32)
         else:
-            enc.uintn(amount, 48)
-        data = enc.get()
+            amount_word = word_uint(amount)
+        data = calldata('allocate(bytes32,int48)', word_bytes32(token_id), amount_word)
         tx = self.template(sender_address, contract_address, use_nonce=True)
         tx = self.set_code(tx, data)
         tx = self.finalize(tx, tx_format)
         return tx
 
 
-    def token_at(self, contract_address, idx, sender_address=ZERO_ADDRESS, id_generator=None):
+    def token_at(self, contract_address, idx, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
-        enc = ABIContractEncoder()
-        enc.method('tokens')
-        enc.typ(ABIContractType.UINT256)
-        enc.uint256(idx)
-        data = add_0x(enc.get())
+        data = add_0x(calldata('tokens(uint256)', word_uint(idx)))
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
     
-    def batch_of(self, conn, contract_address, token_id, super_index, sender_address=ZERO_ADDRESS, id_generator=None):
-        i = 0
-        c = 0
+    def batch_of(self, conn, contract_address, token_id, super_index, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
+        """Return the batch that holds the token at super_index, counting across all batches of token_id in order.
 
-        while True:
-            o = self.get_token_spec(contract_address, token_id, i, sender_address=sender_address)
-            try:
-                r = conn.do(o)
-            except:
-                break
-            spec = self.parse_token_spec(r)
-            c += spec.count
-            if super_index < c:
-                return i
-            i += 1
+        The cumulative batch counts of the token are kept between calls, and are only read again when needed. If height is set, they are read at that block for this call only.
 
-        raise ValueError(super_index)
+        Raises ValueError if super_index is beyond the last batch.
+        """
+        # imported here, since the batch module depends on this one
+        from .batch import BatchIndex
 
+        if height != None:
+            idx = BatchIndex(self, conn, contract_address, token_id, sender_address=sender_address, height=height)
+            return idx.batch_of(super_index)
 
-    
-    def get_token_spec(self, contract_address, token_id, batch, sender_address=ZERO_ADDRESS, id_generator=None):
+        k = (contract_address, token_id, sender_address,)
+        idx = self.batch_indices.get(k)
+        if idx == None or idx.conn != conn:
+            idx = BatchIndex(self, conn, contract_address, token_id, sender_address=sender_address)
+            self.batch_indices[k] = idx
+        return idx.batch_of(super_index)
+
+
+    def get_token_spec(self, contract_address, token_id, batch, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
-        enc = ABIContractEncoder()
-        enc.method('token')
-        enc.typ(ABIContractType.BYTES32)
-        enc.typ(ABIContractType.UINT256)
-        enc.bytes32(token_id)
-        enc.uint256(batch)
-        data = add_0x(enc.get())
+        data = add_0x(calldata('token(bytes32,uint256)', word_bytes32(token_id), word_uint(batch)))
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
 
-    def get_token(self, contract_address, token_id, sender_address=ZERO_ADDRESS, id_generator=None):
+    def get_token(self, contract_address, token_id, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
-        enc = ABIContractEncoder()
-        enc.method('mintedToken')
-        enc.typ(ABIContractType.BYTES32)
-        enc.bytes32(token_id)
-        data = add_0x(enc.get())
+        data = add_0x(calldata('mintedToken(bytes32)', word_bytes32(token_id)))
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
 
-    def get_digest(self, contract_address, token_id, sender_address=ZERO_ADDRESS, id_generator=None):
+    def iter_minted(self, conn, contract_address, token_id=None, after=None, sender_address=ZERO_ADDRESS, **kwargs):
+        # imported here, as the scanner module depends on this one
+        from .scan import Scanner
+        scanner = Scanner(self, conn, contract_address, sender_address=sender_address, **kwargs)
+        try:
+            yield from scanner.minted(token_id=token_id, after=after)
+        finally:
+            scanner.close()
+
+
+    def iter_specs(self, conn, contract_address, token_id=None, sender_address=ZERO_ADDRESS, **kwargs):
+        from .scan import Scanner
+        scanner = Scanner(self, conn, contract_address, sender_address=sender_address, **kwargs)
+        try:
+            yield from scanner.specs(token_id=token_id)
+        finally:
+            scanner.close()
+
+
+    def get_digest(self, contract_address, token_id, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
-        enc = ABIContractEncoder()
-        enc.method('getDigest')
-        enc.typ(ABIContractType.BYTES32)
-        enc.bytes32(token_id)
-        data = add_0x(enc.get())
+        data = add_0x(calldata('getDigest(bytes32)', word_bytes32(token_id)))
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
@@ -244,22 +345,14 @@ class CraftNFT(ERC721):
 
 
     def set_cap(self, contract_address, sender_address, token_id, batch, amount, tx_format=TxFormat.JSONRPC):
-        enc = ABIContractEncoder()
-        enc.method('setCap')
-        enc.typ(ABIContractType.BYTES32)
-        enc.typ(ABIContractType.UINT16)
-        enc.typ_literal('uint48')
-        enc.bytes32(token_id)
-        enc.uintn(batch, 16)
-        enc.uintn(amount, 48)
-        data = enc.get()
+        data = calldata('setCap(bytes32,uint16,uint48)', word_bytes32(token_id), word_uint(batch), word_uint(amount))
         tx = self.template(sender_address, contract_address, use_nonce=True)
         tx = self.set_code(tx, data)
         tx = self.finalize(tx, tx_format)
         return tx
 
 
-    def to_uri(self, contract_address, token_id, sender_address=ZERO_ADDRESS, id_generator=None):
+    def to_uri(self, contract_address, token_id, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
@@ -272,12 +365,12 @@ class CraftNFT(ERC721):
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
 
-    def to_url(self, contract_address, token_id, sender_address=ZERO_ADDRESS, id_generator=None):
+    def to_url(self, contract_address, token_id, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
@@ -289,51 +382,29 @@ class CraftNFT(ERC721):
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
 
-    def token_uri(self, contract_address, token_num_id, sender_address=ZERO_ADDRESS, id_generator=None):
+    def token_uri(self, contract_address, token_num_id, sender_address=ZERO_ADDRESS, height=None, id_generator=None):
         j = JSONRPCRequest(id_generator)
         o = j.template()
         o['method'] = 'eth_call'
-        enc = ABIContractEncoder()
-        enc.method('tokenURI')
-        enc.typ(ABIContractType.UINT256)
-        enc.uint256(token_num_id)
-        data = add_0x(enc.get())
+        data = add_0x(calldata('tokenURI(uint256)', word_uint(token_num_id)))
         tx = self.template(sender_address, contract_address)
         tx = self.set_code(tx, data)
         o['params'].append(self.normalize(tx))
-        o['params'].append('latest')
+        o['params'].append(to_block_param(height))
         o = j.finalize(o)
         return o
 
 
     def mint_to(self, contract_address, sender_address, recipient, token_id, batch=0, index=None, tx_format=TxFormat.JSONRPC):
-        enc = ABIContractEncoder()
-
         if index != None:
-            enc.method('mintExactFromBatchTo')
-            enc.typ(ABIContractType.ADDRESS)
-            enc.typ(ABIContractType.BYTES32)
-            enc.typ(ABIContractType.UINT16)
-            enc.typ(ABIContractType.UINT48)
-            enc.address(recipient)
-            enc.bytes32(token_id)
-            enc.uintn(batch, 16)
-            enc.uintn(index, 48)
-            data = enc.get()
+            data = calldata('mintExactFromBatchTo(address,bytes32,uint16,uint48)', word_address(recipient), word_bytes32(token_id), word_uint(batch), word_uint(index))
         else:
-            enc.method('mintFromBatchTo')
-            enc.typ(ABIContractType.ADDRESS)
-            enc.typ(ABIContractType.BYTES32)
-            enc.typ(ABIContractType.UINT16)
-            enc.address(recipient)
-            enc.bytes32(token_id)
-            enc.uintn(batch, 16)
-            data = enc.get()
+            data = calldata('mintFromBatchTo(address,bytes32,uint16)', word_address(recipient), word_bytes32(token_id), word_uint(batch))
 
         tx = self.template(sender_address, contract_address, use_nonce=True)
         tx = self.set_code(tx, data)
@@ -359,8 +430,11 @@ class CraftNFT(ERC721):
         d.val(v[:64])
         d.val(v[64:128])
         d.val(v[128:192])
+        if len(v) >= 256:
+            d.typ(ABIContractType.BOOLEAN)
+            d.val(v[192:256])
         r = d.decode()
-        return TokenSpec(r[0], r[1], r[2])
+        return TokenSpec(*r)
 
     @classmethod
     def parse_token(self, v, token_id):
@@ -371,7 +445,7 @@ class CraftNFT(ERC721):
         token_id = strip_0x(token_id)
         c = v[:2]
         addr = v[24:]
-        if int(c, 16) & 0x40 > 0:
+        if int(c, 16) & FLAG_SINGLE > 0:
             return MintedToken(addr, token_id=token_id, batched=True, minted=True)
 
         o = MintedToken(addr, minted=True)
@@ -0,0 +1,98 @@
+# standard imports
+import logging
+
+# external imports
+from chainlib.error import JSONRPCException
+
+logg = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def batch_results(conn, reqs, batch_size=DEFAULT_BATCH_SIZE, until_error=False):
+    """Execute json-rpc queries as batch arrays of batch_size queries each, and yield the results in order of the queries.
+
+    The queries may be any iterable, also an unbounded generator. Queries are only generated for one batch at a time.
+
+    If batch_size is 1 or less, each query is sent on its own.
+
+    If a batch fails, the queries in the batch are retried one by one, so that an error is raised (or, with until_error, iteration ends) at the exact query that failed.
+    """
+    if batch_size < 1:
+        batch_size = 1
+
+    it = iter(reqs)
+    while True:
+        batch = []
+        for o in it:
+            batch.append(o)
+            if len(batch) == batch_size:
+                break
+        if len(batch) == 0:
+            return
+
+        r = None
+        if len(batch) > 1:
+            try:
+                r = conn.do(batch)
+            except Exception as e:
+                logg.debug('batch of {} failed, retrying one by one: {}'.format(len(batch), e))
+
+        if r == None:
+            r = []
+            err = None
+            for o in batch:
+                try:
+                    r.append(conn.do(o))
+                except JSONRPCException as e:
+                    err = e
+                    break
+            yield from r
+            if err != None:
+                if until_error:
+                    logg.debug('ending batch iteration on error: {}'.format(err))
+                    return
+                raise err
+        else:
+            yield from r
+
+        if len(batch) < batch_size:
+            return
+
+
+def find_length(conn, req, start=0):
+    """Find the number of elements in a contract array, or in any list of values queried by index, where the query for an index beyond the last element fails.
+
+    req is a function returning the query for the element at the given index. If start is set, the elements before start are assumed to exist.
+
+    The index is doubled until a query fails, after which the length is found by binary search between the last existing and the first missing index. The number of queries is logarithmic to the length.
+    """
+    def exists(i):
+        try:
+            conn.do(req(i))
+        except JSONRPCException:
+            return False
+        return True
+
+    if not exists(start):
+        return start
+
+    n = start + 1
+    step = 1
+    while True:
+        i = n - 1 + step
+        if not exists(i):
+            break
+        n = i + 1
+        step *= 2
+
+    missing = i
+    while missing > n:
+        i = (n + missing) // 2
+        if exists(i):
+            n = i + 1
+        else:
+            missing = i
+
+    logg.debug('found length {}'.format(n))
+    return n
@@ -15,6 +15,7 @@ import argparse
 import logging
 import time
 import hashlib
+import itertools
 from enum import Enum
 
 # external imports
@@ -34,6 +35,18 @@ from hexathon import strip_0x
 
 # local imports
 from craft_nft import CraftNFT
+from craft_nft.sign import read_plan
+from craft_nft.asset import iter_asset_paths
+from craft_nft.asset import read_asset_list
+from craft_nft.asset import hash_files
+from craft_nft.asset import asset_allocations
+from craft_nft.asset import is_allocated
+from craft_nft.asset import write_asset_manifest
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
 
 logg = logging.getLogger()
 
@@ -41,8 +54,23 @@ logg = logging.getLogger()
 def process_config_local(config, arg, args, flags):
     if config.get('_EXEC_ADDRESS') == None:
         raise ValueError('exec address required')
-    token_id = strip_0x(config.get('_POSARG'))
-    bytes.fromhex(token_id)
+
+    assets = args.assets
+    if assets == None:
+        assets = []
+    config.add(assets, '_ASSETS', False)
+    config.add(args.asset_list, '_ASSET_LIST', False)
+    config.add(args.manifest, '_MANIFEST', False)
+    config.add(args.workers, '_WORKERS', False)
+
+    token_id = None
+    if config.get('_POSARG') != None:
+        if len(assets) > 0 or args.asset_list != None:
+            raise ValueError('token id cannot be given with assets')
+        token_id = strip_0x(config.get('_POSARG'))
+        bytes.fromhex(token_id)
+    elif len(assets) == 0 and args.asset_list == None:
+        raise ValueError('token id required')
     config.add(token_id, '_TOKEN_ID', False)
 
     if args.nolimit:
@@ -56,33 +84,64 @@ def process_config_local(config, arg, args, flags):
 
     return config
 
-arg_flags = ArgFlag()
-arg = Arg(arg_flags)
-flags = arg_flags.STD_WRITE | arg_flags.VALUE | arg_flags.TAB | arg_flags.EXEC
 
-argparser = chainlib.eth.cli.ArgumentParser()
-argparser = process_args(argparser, arg, flags)
-argparser.add_argument('--nolimit', action='store_true', help='Unbounded token batch')
-argparser.add_argument('--count', default=0, type=int, help='Amount of tokens in batch')
-argparser.add_argument('token_id', type=str, nargs='*', help='token id: sha256 sum of token data, in hex')
-args = argparser.parse_args(sys.argv[1:])
+def process_cli(argv=None):
+    if argv == None:
+        argv = sys.argv[1:]
+
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+    flags = arg_flags.STD_WRITE | arg_flags.VALUE | arg_flags.TAB | arg_flags.EXEC
+
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    argparser.add_argument('--nolimit', action='store_true', help='Unbounded token batch')
+    argparser.add_argument('--count', default=0, type=int, help='Amount of tokens in batch')
+    argparser.add_argument('--assets', type=str, action='append', help='Allocate a token for every file in this directory or of this file, with the sha256 sum of its contents as token id. May be given more than once')
+    argparser.add_argument('--asset-list', dest='asset_list', type=str, help='Allocate a token for every file or directory listed in this file, one per line, or - for standard input')
+    argparser.add_argument('--manifest', type=str, help='Write a json line with the path, token id and count of every asset allocation sent, or with -w mined, to this file. If the file exists, the assets in it are skipped, and the new ones are appended to it')
+    argparser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of asset hashing processes (default: number of cores)')
+    argparser.add_argument('token_id', type=str, nargs='*', help='token id: sha256 sum of token data, in hex')
+    args = argparser.parse_args(argv)
+
+    process_log(args, logg)
+
+    config = Config()
+    config = process_config(config, arg, args, flags, positional_name='token_id')
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
+
+    settings = ChainSettings()
+    settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
 
-logg = process_log(args, logg)
 
-config = Config()
-config = process_config(config, arg, args, flags, positional_name='token_id')
-config = process_config_local(config, arg, args, flags)
-logg.debug('config loaded:\n{}'.format(config))
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
 
-settings = ChainSettings()
-settings = process_settings(settings, config)
-logg.debug('settings loaded:\n{}'.format(settings))
+    try:
+        if config.get('_TOKEN_ID') == None:
+            allocate_assets(config, settings)
+        else:
+            allocate(config, settings)
+    finally:
+        report_stats(settings, config)
 
 
-def main():
+def allocate(config, settings):
     token_id = config.get('_TOKEN_ID')
     token_count = config.get('_TOKEN_COUNT')
     conn = settings.get('CONN')
+    stats = settings.get('STATS')
 
     c = CraftNFT(
             settings.get('CHAIN_SPEC'),
@@ -91,17 +150,20 @@ def main():
             nonce_oracle=settings.get('NONCE_ORACLE')
             )
 
-    (tx_hash_hex, o) = c.allocate(
-            settings.get('EXEC'),
-            settings.get('SENDER_ADDRESS'),
-            token_id,
-            token_count,
-            )
+    with phase(stats, 'build'):
+        (tx_hash_hex, o) = c.allocate(
+                settings.get('EXEC'),
+                settings.get('SENDER_ADDRESS'),
+                token_id,
+                token_count,
+                )
 
     if config.get('_RPC_SEND'):
-        conn.do(o)
+        with phase(stats, 'send'):
+            conn.do(o)
         if config.true('_WAIT'):
-            r = conn.wait(tx_hash_hex)
+            with phase(stats, 'wait'):
+                r = conn.wait(tx_hash_hex)
             if r['status'] == 0:
                 sys.stderr.write('EVM revert while deploying contract. Wish I had more to tell you')
                 sys.exit(1)
@@ -110,5 +172,107 @@ def main():
     else:
         print(o)
 
+
+def asset_paths(config):
+    paths = config.get('_ASSETS')
+    path = config.get('_ASSET_LIST')
+    if path == None:
+        yield from iter_asset_paths(paths)
+        return
+
+    f = sys.stdin
+    if path != '-':
+        f = open(path, 'r')
+    try:
+        yield from iter_asset_paths(itertools.chain(paths, read_asset_list(f)))
+    finally:
+        if f != sys.stdin:
+            f.close()
+
+
+def allocate_assets(config, settings):
+    conn = settings.get('CONN')
+    stats = settings.get('STATS')
+
+    c = CraftNFT(
+            settings.get('CHAIN_SPEC'),
+            signer=settings.get('SIGNER'),
+            gas_oracle=settings.get('FEE_ORACLE'),
+            nonce_oracle=settings.get('NONCE_ORACLE')
+            )
+
+    # assets in the manifest of an earlier run, and those allocated on chain, are not allocated again
+    manifest = set()
+    line = 0
+    w = None
+    path = config.get('_MANIFEST')
+    if path != None:
+        if os.path.exists(path):
+            f = open(path, 'r')
+            for entry in read_plan(f):
+                manifest.add(entry.token_id)
+                line = entry.line
+            f.close()
+            logg.info('skipping {} assets in manifest {}'.format(len(manifest), path))
+        if config.get('_RPC_SEND'):
+            w = open(path, 'a')
+        else:
+            logg.warning('allocations are not sent, so none are written to manifest {}'.format(path))
+
+    def allocated(token_id):
+        if token_id in manifest:
+            return True
+        return is_allocated(c, conn, settings.get('EXEC'), token_id, sender_address=settings.get('SENDER_ADDRESS'))
+
+    send = config.get('_RPC_SEND')
+    wait = send and config.true('_WAIT')
+
+    # files are hashed ahead in the pool while the transactions of those before them are signed and sent
+    count = 0
+    sent = []
+    reverted = 0
+    try:
+        with phase(stats, 'allocate'):
+            digests = hash_files(asset_paths(config), workers=config.get('_WORKERS'))
+            for entry in asset_allocations(digests, amount=config.get('_TOKEN_COUNT'), allocated=allocated, line=line):
+                (tx_hash_hex, o) = c.allocate(
+                        settings.get('EXEC'),
+                        settings.get('SENDER_ADDRESS'),
+                        entry.token_id,
+                        entry.amount,
+                        )
+                if not send:
+                    print(o)
+                    count += 1
+                    continue
+
+                conn.do(o)
+                print(tx_hash_hex)
+                count += 1
+                # an allocation is only written to the manifest once it has been sent, or with wait, once it has been mined
+                if wait:
+                    sent.append((entry, tx_hash_hex,))
+                elif w != None:
+                    write_asset_manifest(w, entry)
+        logg.info('allocated {} tokens from assets'.format(count))
+
+        # transactions are mined in nonce order, so all but the first are usually mined when waited for
+        if wait:
+            with phase(stats, 'wait'):
+                for (entry, tx_hash_hex) in sent:
+                    r = conn.wait(tx_hash_hex)
+                    if r['status'] == 0:
+                        logg.error('EVM revert in allocation of {}'.format(entry.path))
+                        reverted += 1
+                    elif w != None:
+                        write_asset_manifest(w, entry)
+    finally:
+        if w != None:
+            w.close()
+
+    if reverted > 0:
+        sys.stderr.write('EVM revert in {} allocations. Wish I had more to tell you'.format(reverted))
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()
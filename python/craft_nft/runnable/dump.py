@@ -14,6 +14,7 @@ import json
 import argparse
 import logging
 import time
+import csv
 from enum import Enum
 
 # external imports
@@ -21,6 +22,7 @@ import chainlib.eth.cli
 from chainlib.chain import ChainSpec
 from chainlib.eth.constant import ZERO_ADDRESS
 from chainlib.settings import ChainSettings
+from chainlib.settings import process_settings as base_process_settings
 from chainlib.eth.settings import process_settings
 from chainlib.eth.cli.arg import Arg
 from chainlib.eth.cli.arg import ArgFlag
@@ -33,10 +35,32 @@ from hexathon import add_0x
 
 # local imports
 from craft_nft import CraftNFT
-from craft_nft.nft import to_batch_key
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
 
 logg = logging.getLogger()
 
+CSV_FIELDS = [
+    'key',
+    'token_id',
+    'batched',
+    'batch',
+    'index',
+    'owner',
+    ]
+
+SPEC_CSV_FIELDS = [
+    'token_id',
+    'batch',
+    'count',
+    'cursor',
+    'sparse',
+    'capped',
+    ]
+
 def process_config_local(config, arg, args, flags):
     contract = None
     try:
@@ -61,81 +85,259 @@ def process_config_local(config, arg, args, flags):
         bytes.fromhex(token_id)
     config.add(token_id, '_TOKEN_ID', False)
 
-    return config
-
-
-arg_flags = ArgFlag()
-arg = Arg(arg_flags)
-
-flags = arg_flags.STD_READ | arg_flags.EXEC | arg_flags.TAB
+    config.add(args.batch_size, '_BATCH_SIZE', False)
+    config.add(args.workers, '_WORKERS', False)
+    config.add(args.unordered, '_UNORDERED', False)
+    config.add(args.source, '_SOURCE', False)
+    config.add(args.from_block, '_FROM_BLOCK', False)
+    config.add(args.block_chunk_size, '_BLOCK_CHUNK_SIZE', False)
+    config.add(args.store, '_STORE', False)
+    config.add(args.state_dump, '_STATE_DUMP', False)
+    config.add(args.format, '_FORMAT', False)
+    config.add(args.specs, '_SPECS', False)
+    config.add(args.output, '_OUTPUT', False)
+
+    height = config.get('_HEIGHT')
+    if height == 'latest':
+        height = None
+    elif height != None:
+        try:
+            height = int(height)
+        except ValueError:
+            height = strip_0x(height)
+            bytes.fromhex(height)
+    config.add(height, '_SNAPSHOT_HEIGHT', False)
+    config.add(args.snapshot, '_SNAPSHOT', False)
+
+    cache_size = args.cache_size
+    if cache_size == None and args.cache_file != None:
+        from craft_nft.cache import DEFAULT_CACHE_SIZE
+        cache_size = DEFAULT_CACHE_SIZE
+    config.add(cache_size, '_CACHE_SIZE', False)
+    config.add(args.cache_file, '_CACHE_FILE', False)
+    config.add(args.cache_ttl, '_CACHE_TTL', False)
+
+    if args.checkpoint != None:
+        if args.store != None or args.state_dump != None or args.source == 'log':
+            raise ValueError('checkpoint can only be used when retrieving tokens from the network by contract calls or storage reads')
+        if args.unordered:
+            raise ValueError('checkpoint cannot be used with unordered output')
+        if args.specs:
+            raise ValueError('checkpoint cannot be used with batch spec output')
+    config.add(args.checkpoint, '_CHECKPOINT', False)
+    config.add(args.checkpoint_interval, '_CHECKPOINT_INTERVAL', False)
 
-argparser = chainlib.eth.cli.ArgumentParser()
-argparser = process_args(argparser, arg, flags)
-argparser.add_argument('--token-id', dest='token_id', type=str, help='List mints for this token id only')
-argparser.add_argument('contract_address', type=str, help='Token contract address (may also be specified by -e)')
-args = argparser.parse_args()
+    return config
 
-logg = process_log(args, logg)
 
-config = Config()
-config = process_config(config, arg, args, flags, positional_name='contract_address')
-config = process_config_local(config, arg, args, flags)
-logg.debug('config loaded:\n{}'.format(config))
+def process_settings_offline(settings, config):
+    """Process settings for dumps from a token store or a state dump, which are read without connecting to a node, and so without a wallet or any oracles.
+    """
+    settings = base_process_settings(settings, config)
+    settings.set('CONN', None)
+    settings.set('GAS_ORACLE', None)
+    settings.set('SENDER_ADDRESS', ZERO_ADDRESS)
+    return settings
+
+
+def process_cli(argv=None):
+    # the modules of each token source are only imported when the source is used, except for the defaults of their options
+    from craft_nft.index import DEFAULT_BLOCK_CHUNK
+    from craft_nft.cache import DEFAULT_CACHE_SIZE
+    from craft_nft.cache import DEFAULT_TTL
+
+    if argv == None:
+        argv = sys.argv[1:]
+
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+
+    flags = arg_flags.STD_READ | arg_flags.EXEC | arg_flags.TAB
+
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    argparser.add_argument('--token-id', dest='token_id', type=str, help='List mints for this token id only')
+    argparser.add_argument('--batch-size', dest='batch_size', type=int, default=1, help='Send queries as json-rpc batches of this size (default: 1, no batching)')
+    argparser.add_argument('--workers', type=int, default=1, help='Number of parallel query workers (default: 1)')
+    argparser.add_argument('--unordered', action='store_true', help='Output tokens as soon as they are retrieved, instead of in token order')
+    argparser.add_argument('--source', type=str, choices=['call', 'storage', 'log'], default='call', help='Retrieve tokens by contract calls, by reading contract storage directly, or rebuild them from contract event logs (default: call)')
+    argparser.add_argument('--from-block', dest='from_block', type=int, default=0, help='Block to start reading event logs from (default: 0)')
+    argparser.add_argument('--block-chunk-size', dest='block_chunk_size', type=int, default=DEFAULT_BLOCK_CHUNK, help='Number of blocks to read event logs for in each query (default: {})'.format(DEFAULT_BLOCK_CHUNK))
+    argparser.add_argument('--store', type=str, help='Read tokens from a token index database file kept up to date by craftnft-sync, instead of from the network')
+    argparser.add_argument('--state-dump', dest='state_dump', type=str, help='Read tokens from a dump of the contract storage, for example debug_storageRangeAt results, instead of from the network')
+    argparser.add_argument('--specs', action='store_true', help='List the spec of every token batch instead of the minted tokens')
+    argparser.add_argument('--format', type=str, choices=['text', 'ndjson', 'csv'], default='text', help='Output format (default: text)')
+    argparser.add_argument('--snapshot', action='store_true', help='Read all token state at the block that is latest when the dump starts. Requires a node that keeps the state of past blocks for the duration of the dump')
+    argparser.add_argument('--cache-size', dest='cache_size', type=int, help='Cache up to this many contract call results in memory (default: no cache, or {} with --cache-file)'.format(DEFAULT_CACHE_SIZE))
+    argparser.add_argument('--cache-file', dest='cache_file', type=str, help='Also cache contract call results in this database file, to be reused by later dumps')
+    argparser.add_argument('--cache-ttl', dest='cache_ttl', type=float, default=DEFAULT_TTL, help='Seconds to cache call results for the latest block. Results for a fixed block height never expire (default: {})'.format(DEFAULT_TTL))
+    argparser.add_argument('--output', type=str, help='Write output to file instead of standard output')
+    argparser.add_argument('--checkpoint', type=str, help='Save progress to this file, and resume from it if it exists')
+    argparser.add_argument('--checkpoint-interval', dest='checkpoint_interval', type=int, default=100, help='Number of tokens to output between each checkpoint save (default: 100)')
+    argparser.add_argument('contract_address', type=str, help='Token contract address (may also be specified by -e)')
+    args = argparser.parse_args(argv)
+    if args.store != None or args.state_dump != None:
+        # no wallet is needed to read tokens offline, so do not prompt for its passphrase
+        args.z = True
+
+    process_log(args, logg)
+
+    config = Config()
+    config = process_config(config, arg, args, flags, positional_name='contract_address')
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
+
+    settings = ChainSettings()
+    if config.get('_STORE') != None or config.get('_STATE_DUMP') != None:
+        settings = process_settings_offline(settings, config)
+    else:
+        settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
+
+
+def render_tokens_text(tokens, w=sys.stdout, label='token'):
+    for token in tokens:
+        w.write('{} {}\n'.format(label, token))
+
+
+def render_tokens_ndjson(tokens, w=sys.stdout):
+    for token in tokens:
+        w.write(json.dumps(token.to_dict()) + '\n')
+
+
+def render_tokens_csv(tokens, w=sys.stdout, header=True, fields=CSV_FIELDS):
+    writer = csv.DictWriter(w, fieldnames=fields)
+    if header:
+        writer.writeheader()
+    for token in tokens:
+        writer.writerow(token.to_dict())
+
+
+def render_tokens(tokens, fmt, w=sys.stdout, header=True):
+    if fmt == 'ndjson':
+        render_tokens_ndjson(tokens, w=w)
+    elif fmt == 'csv':
+        render_tokens_csv(tokens, w=w, header=header)
+    else:
+        render_tokens_text(tokens, w=w)
+
+
+def render_specs(specs, fmt, w=sys.stdout):
+    if fmt == 'ndjson':
+        render_tokens_ndjson(specs, w=w)
+    elif fmt == 'csv':
+        render_tokens_csv(specs, w=w, fields=SPEC_CSV_FIELDS)
+    else:
+        render_tokens_text(specs, w=w, label='spec')
+
+
+def checkpoint_tokens(tokens, checkpoint, state, interval, w):
+    for token in tokens:
+        yield token
+
+        # the token has been rendered when the next one is requested
+        state['token_id'] = token.token_id
+        state['batch'] = None
+        state['index'] = None
+        if not token.batched:
+            state['batch'] = token.batch
+            state['index'] = token.index
+        state['count'] += 1
+        if state['count'] % interval == 0:
+            w.flush()
+            if state['offset'] != None:
+                state['offset'] = w.tell()
+            checkpoint.save(state)
+
+    w.flush()
+    if state['offset'] != None:
+        state['offset'] = w.tell()
+
+
+def open_checkpoint(path, token_address, token_id, fmt, output):
+    from craft_nft.checkpoint import Checkpoint
+    checkpoint = Checkpoint(path)
+    state = checkpoint.load()
+    if state == None:
+        state = {
+            'contract': strip_0x(token_address).lower(),
+            'filter': token_id,
+            'format': fmt,
+            'token_id': None,
+            'batch': None,
+            'index': None,
+            'count': 0,
+            'offset': None,
+            'done': False,
+            'height': None,
+            }
+        if output != None:
+            state['offset'] = 0
+        return (checkpoint, state,)
+
+    if state['contract'] != strip_0x(token_address).lower() or state['filter'] != token_id or state['format'] != fmt:
+        raise ValueError('checkpoint {} is for a different dump'.format(path))
+    if (state['offset'] == None) != (output == None):
+        raise ValueError('checkpoint {} was not saved for the same output'.format(path))
+    return (checkpoint, state,)
+
+
+def snapshot_height(conn, config):
+    height = config.get('_SNAPSHOT_HEIGHT')
+    if height == None and config.true('_SNAPSHOT'):
+        from craft_nft.index import block_height
+        height = block_height(conn)
+        logg.info('reading token state at block {}'.format(height))
+    return height
+
+
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
 
-settings = ChainSettings()
-settings = process_settings(settings, config)
-logg.debug('settings loaded:\n{}'.format(settings))
+    try:
+        dump_cached(config, settings)
+    finally:
+        report_stats(settings, config)
 
 
-def render_token_batches(c, conn, token_address, token_id, w=sys.stdout):
-    i = 0
-    while True:
-        o = c.get_token_spec(token_address, token_id, i)
-        r = None
+def dump_cached(config, settings):
+    conn = settings.get('CONN')
+    if conn != None and config.get('_CACHE_SIZE') != None:
+        from craft_nft.cache import CachingConnection
+        conn = CachingConnection(
+                conn,
+                size=config.get('_CACHE_SIZE'),
+                ttl=config.get('_CACHE_TTL'),
+                path=config.get('_CACHE_FILE'),
+                )
         try:
-            r = conn.do(o)
-        except:
-            break
-        spec = c.parse_token_spec(r)
-
-        if spec.sparse:
-            logg.info('sparse token issuance detected. Will iterate through {} tokens, may take a while'.format(spec.count))
-            for j in range(spec.count):
-                token_id_indexed = to_batch_key(token_id, i, j)
-                try:
-                    render_token_mint(c, conn, token_address, token_id_indexed, w=w)
-                except:
-                    pass
-        else:
-            for j in range(spec.cursor):
-                token_id_indexed = to_batch_key(token_id, i, j)
-                render_token_mint(c, conn, token_address, token_id_indexed, w=w)
-
-        i += 1
-
-
-def render_token_mint(c, conn, token_address, token_id, w=sys.stdout):
-    o = c.get_token(token_address, token_id)
-    r = conn.do(o)
-    token = c.parse_token(r, token_id)
-    if token.minted:
-        w.write('token {}\n'.format(token))
+            dump(conn, config, settings)
+        finally:
+            logg.debug('call cache hits {} misses {}'.format(conn.hits, conn.misses))
+            conn.close()
+        return
 
+    dump(conn, config, settings)
 
-def render_token(c, conn, token_address, token_id, w=sys.stdout):
-    token_id = strip_0x(token_id)
-    o = c.get_token_spec(token_address, token_id, 0)
-    r = conn.do(o)
-    spec = c.parse_token_spec(r)
-    if spec.count > 0:
-        return render_token_batches(c, conn, token_address, token_id, w=sys.stdout)
 
-    return render_token_mint(c, conn, token_address, token_id, w=w)
+def iter_minted(c, conn, config, *args, **kwargs):
+    if config.get('_SOURCE') == 'storage':
+        from craft_nft import storage
+        return storage.iter_minted(c, conn, *args, **kwargs)
+    return c.iter_minted(conn, *args, **kwargs)
 
 
-def main():
+def dump(conn, config, settings):
     token_address = config.get('_CONTRACT')
-    conn = settings.get('CONN')
     c = CraftNFT(
             chain_spec=settings.get('CHAIN_SPEC'),
             gas_oracle=settings.get('GAS_ORACLE'),
@@ -143,21 +345,145 @@ def main():
 
     outkeys = config.get('_OUTARG')
 
-    i = 0
+    if config.get('_CHECKPOINT') != None:
+        dump_checkpointed(c, conn, token_address, config, settings.get('SENDER_ADDRESS'), stats=settings.get('STATS'))
+        return
 
-    if config.get('_TOKEN_ID') != None:
-        render_token(c, conn, token_address, config.get('_TOKEN_ID'))
+    specs = config.true('_SPECS')
+    store = None
+    if config.get('_STORE') != None:
+        from craft_nft.store import TokenStore
+        store = TokenStore(config.get('_STORE'))
+        if store.next_block(token_address) == None:
+            store.close()
+            raise ValueError('token contract {} has not been synced to {}'.format(token_address, config.get('_STORE')))
+        if specs:
+            tokens = store.iter_specs(token_address, token_id=config.get('_TOKEN_ID'))
+        else:
+            tokens = store.minted(token_address, token_id=config.get('_TOKEN_ID'))
+    elif config.get('_STATE_DUMP') != None:
+        from craft_nft.statedump import load_state_dump
+        with phase(settings.get('STATS'), 'load'):
+            idx = load_state_dump(config.get('_STATE_DUMP'), contract_address=token_address)
+        if specs:
+            tokens = idx.iter_specs(token_id=config.get('_TOKEN_ID'))
+        else:
+            tokens = idx.minted(token_id=config.get('_TOKEN_ID'))
+    elif config.get('_SOURCE') == 'log':
+        height = snapshot_height(conn, config)
+        if height != None and not isinstance(height, int):
+            raise ValueError('event logs can only be read to a block number')
+        from craft_nft.index import TokenIndex
+        idx = TokenIndex(from_block=config.get('_FROM_BLOCK'))
+        with phase(settings.get('STATS'), 'sync'):
+            idx.sync(
+                    conn,
+                    token_address,
+                    to_block=height,
+                    chunk_size=config.get('_BLOCK_CHUNK_SIZE'),
+                    batch_size=config.get('_BATCH_SIZE'),
+                    )
+        if specs:
+            tokens = idx.iter_specs(token_id=config.get('_TOKEN_ID'))
+        else:
+            tokens = idx.minted(token_id=config.get('_TOKEN_ID'))
+    elif specs:
+        # batch specs are always read by contract calls
+        tokens = c.iter_specs(
+                conn,
+                token_address,
+                token_id=config.get('_TOKEN_ID'),
+                batch_size=config.get('_BATCH_SIZE'),
+                workers=config.get('_WORKERS'),
+                ordered=not config.true('_UNORDERED'),
+                height=snapshot_height(conn, config),
+                sender_address=settings.get('SENDER_ADDRESS'),
+                )
+    else:
+        tokens = iter_minted(
+                c,
+                conn,
+                config,
+                token_address,
+                token_id=config.get('_TOKEN_ID'),
+                batch_size=config.get('_BATCH_SIZE'),
+                workers=config.get('_WORKERS'),
+                ordered=not config.true('_UNORDERED'),
+                from_block=config.get('_FROM_BLOCK'),
+                block_chunk_size=config.get('_BLOCK_CHUNK_SIZE'),
+                height=snapshot_height(conn, config),
+                sender_address=settings.get('SENDER_ADDRESS'),
+                )
+
+    w = sys.stdout
+    if config.get('_OUTPUT') != None:
+        w = open(config.get('_OUTPUT'), 'w')
+    try:
+        with phase(settings.get('STATS'), 'dump'):
+            if specs:
+                render_specs(tokens, config.get('_FORMAT'), w=w)
+            else:
+                render_tokens(tokens, config.get('_FORMAT'), w=w)
+    finally:
+        if store != None:
+            store.close()
+        if w != sys.stdout:
+            w.close()
+
+
+def dump_checkpointed(c, conn, token_address, config, sender_address=ZERO_ADDRESS, stats=None):
+    (checkpoint, state) = open_checkpoint(
+            config.get('_CHECKPOINT'),
+            token_address,
+            config.get('_TOKEN_ID'),
+            config.get('_FORMAT'),
+            config.get('_OUTPUT'),
+            )
+    if state['done']:
+        logg.info('dump in checkpoint {} is already complete'.format(config.get('_CHECKPOINT')))
         return
 
-    while True:
-        o = c.token_at(token_address, i)
-        r = None
-        try:
-            r = conn.do(o)
-        except:
-            break
-        render_token(c, conn, token_address, r)
-        i += 1
+    if state['token_id'] == None:
+        state['height'] = snapshot_height(conn, config)
+    elif state.get('height') != None:
+        logg.info('resuming dump at block {}'.format(state['height']))
+
+    after = None
+    if state['token_id'] != None:
+        after = (state['token_id'], state['batch'], state['index'],)
+        logg.info('resuming dump after {} tokens'.format(state['count']))
+
+    w = sys.stdout
+    if config.get('_OUTPUT') != None:
+        # anything written after the last checkpoint is discarded, and written again
+        w = open(config.get('_OUTPUT'), 'a+')
+        w.truncate(state['offset'])
+        w.seek(state['offset'])
+
+    tokens = iter_minted(
+            c,
+            conn,
+            config,
+            token_address,
+            token_id=config.get('_TOKEN_ID'),
+            after=after,
+            batch_size=config.get('_BATCH_SIZE'),
+            workers=config.get('_WORKERS'),
+            from_block=config.get('_FROM_BLOCK'),
+            block_chunk_size=config.get('_BLOCK_CHUNK_SIZE'),
+            height=state.get('height'),
+            sender_address=sender_address,
+            )
+    tokens = checkpoint_tokens(tokens, checkpoint, state, config.get('_CHECKPOINT_INTERVAL'), w)
+    try:
+        with phase(stats, 'dump'):
+            render_tokens(tokens, config.get('_FORMAT'), w=w, header=state['count'] == 0)
+    finally:
+        if w != sys.stdout:
+            w.close()
+
+    state['done'] = True
+    checkpoint.save(state)
 
 
 if __name__ == '__main__':
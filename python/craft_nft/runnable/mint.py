@@ -35,15 +35,33 @@ from hexathon import strip_0x
 
 # local imports
 from craft_nft import CraftNFT
+from craft_nft.batch import BatchTracker
+from craft_nft.bulk import BulkMinter
+from craft_nft.bulk import read_manifest
+from craft_nft.bulk import read_results
+from craft_nft.bulk import DEFAULT_IN_FLIGHT
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
 
 logg = logging.getLogger()
 
 
 def process_config_local(config, arg, args, flags):
-    token_id = strip_0x(args.token_id)
-    bytes.fromhex(token_id)
+    token_id = args.token_id
+    if token_id != None:
+        token_id = strip_0x(token_id)
+        bytes.fromhex(token_id)
+    elif args.manifest == None:
+        raise ValueError('token id required')
     config.add(token_id, '_TOKEN_ID', False)
 
+    config.add(args.manifest, '_MANIFEST', False)
+    config.add(args.results, '_RESULTS', False)
+    config.add(args.in_flight, '_IN_FLIGHT', False)
+
     config.add(args.batch, '_TOKEN_BATCH', False)
     config.add(args.index, '_TOKEN_INDEX', False)
 
@@ -62,60 +80,80 @@ def process_settings_local(settings, config):
 
     settings.set('TOKEN_INDEX', config.get('_TOKEN_INDEX'))
 
+    # batches of manifest entries are selected when minting
+    if config.get('_MANIFEST') != None:
+        return settings
+
     if (config.get('_TOKEN_BATCH') != None):
         settings.set('TOKEN_BATCH', config.get('_TOKEN_BATCH'))
         return settings
 
-    conn = settings.get('CONN')
     c = CraftNFT(settings.get('CHAIN_SPEC'))
-    i = 0
-    while True:
-        o = c.get_token_spec(
-                settings.get('EXEC'),
-                settings.get('TOKEN_ID'),
-                i,
-                )
-        r = conn.do(o)
-        spec = c.parse_token_spec(r)
-        if spec.count == 0:
-            if spec.cursor == 0:
-                settings.set('TOKEN_BATCH', 0)
-                return settings
-        if spec.cursor < spec.count:
-            settings.set('TOKEN_BATCH', i)
-            return settings
-
-        i += 1
-
-
-arg_flags = ArgFlag()
-arg = Arg(arg_flags)
-flags = arg_flags.STD_WRITE | arg_flags.WALLET | arg_flags.VALUE | arg_flags.TAB | arg_flags.EXEC
-
-argparser = chainlib.eth.cli.ArgumentParser()
-argparser = process_args(argparser, arg, flags)
-argparser.add_argument('--token-id', type=str, required=True, help='Token id to mint from')
-argparser.add_argument('--check', action='store_true', help='Only check whether a token can be minted')
-argparser.add_argument('--batch', type=int, default=0, help='Mint from the given batch. If not specified, the first mintable batch will be used')
-argparser.add_argument('--index', type=int, help='Index of token in batch to mint. If not specified, will mint next available index.')
-argparser.add_argument('token_recipient', type=str, nargs='*', help='Recipient address')
-args = argparser.parse_args(sys.argv[1:])
-
-logg = process_log(args, logg)
-
-config = Config()
-config = process_config(config, arg, args, flags, positional_name='token_recipient')
-config = process_config_local(config, arg, args, flags)
-logg.debug('config loaded:\n{}'.format(config))
-
-settings = ChainSettings()
-settings = process_settings(settings, config)
-settings = process_settings_local(settings, config)
-logg.debug('settings loaded:\n{}'.format(settings))
-
-
-def main():
+    tracker = BatchTracker(c, settings.get('CONN'), settings.get('EXEC'), settings.get('TOKEN_ID'))
+    batch = tracker.select()
+    if batch == None:
+        raise ValueError('no batch of token {} has tokens left to mint'.format(settings.get('TOKEN_ID')))
+    settings.set('TOKEN_BATCH', batch)
+    return settings
+
+
+def process_cli(argv=None):
+    if argv == None:
+        argv = sys.argv[1:]
+
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+    flags = arg_flags.STD_WRITE | arg_flags.WALLET | arg_flags.VALUE | arg_flags.TAB | arg_flags.EXEC
+
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    argparser.add_argument('--token-id', type=str, help='Token id to mint from. Required unless a manifest is given, where it is used for entries without a token id')
+    argparser.add_argument('--check', action='store_true', help='Only check whether a token can be minted')
+    argparser.add_argument('--batch', type=int, help='Mint from the given batch. If not specified, the first mintable batch will be used')
+    argparser.add_argument('--index', type=int, help='Index of token in batch to mint. If not specified, will mint next available index.')
+    argparser.add_argument('--manifest', type=str, help='Mint a token for every entry of this csv or ndjson file of recipient, token id, and optional batch and index')
+    argparser.add_argument('--results', type=str, help='Write a json line for each manifest entry signed, sent and confirmed to this file, instead of standard output. Entries already sent according to an existing file are skipped')
+    argparser.add_argument('--in-flight', dest='in_flight', type=int, default=DEFAULT_IN_FLIGHT, help='Maximum number of manifest transactions sent but not yet confirmed (default: {})'.format(DEFAULT_IN_FLIGHT))
+    argparser.add_argument('token_recipient', type=str, nargs='*', help='Recipient address')
+    args = argparser.parse_args(argv)
+
+    process_log(args, logg)
+
+    config = Config()
+    config = process_config(config, arg, args, flags, positional_name='token_recipient')
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
+
+    settings = ChainSettings()
+    settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    settings = process_settings_local(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
+
+
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
+
+    try:
+        if config.get('_MANIFEST') != None:
+            mint_manifest(config, settings)
+        else:
+            mint(config, settings)
+    finally:
+        report_stats(settings, config)
+
+
+def mint(config, settings):
     conn = settings.get('CONN')
+    stats = settings.get('STATS')
 
     c = CraftNFT(
             settings.get('CHAIN_SPEC'),
@@ -124,19 +162,22 @@ def main():
             nonce_oracle=settings.get('NONCE_ORACLE')
             )
 
-    (tx_hash_hex, o) = c.mint_to(
-            settings.get('EXEC'),
-            settings.get('SENDER_ADDRESS'),
-            settings.get('RECIPIENT'),
-            settings.get('TOKEN_ID'),
-            settings.get('TOKEN_BATCH'),
-            index=settings.get('TOKEN_INDEX'),
-            )
+    with phase(stats, 'build'):
+        (tx_hash_hex, o) = c.mint_to(
+                settings.get('EXEC'),
+                settings.get('SENDER_ADDRESS'),
+                settings.get('RECIPIENT'),
+                settings.get('TOKEN_ID'),
+                settings.get('TOKEN_BATCH'),
+                index=settings.get('TOKEN_INDEX'),
+                )
 
     if config.get('_RPC_SEND'):
-        conn.do(o)
+        with phase(stats, 'send'):
+            conn.do(o)
         if config.true('_WAIT'):
-            r = conn.wait(tx_hash_hex)
+            with phase(stats, 'wait'):
+                r = conn.wait(tx_hash_hex)
             if r['status'] == 0:
                 sys.stderr.write('EVM revert while deploying contract. Wish I had more to tell you')
                 sys.exit(1)
@@ -144,5 +185,46 @@ def main():
     else:
         print(o)
 
+
+def mint_manifest(config, settings):
+    c = CraftNFT(
+            settings.get('CHAIN_SPEC'),
+            signer=settings.get('SIGNER'),
+            gas_oracle=settings.get('FEE_ORACLE'),
+            nonce_oracle=settings.get('NONCE_ORACLE')
+            )
+
+    skip = None
+    w = sys.stdout
+    path = config.get('_RESULTS')
+    if path != None:
+        if os.path.exists(path):
+            f = open(path, 'r')
+            skip = read_results(f)
+            f.close()
+            logg.info('{} manifest entries already sent according to {}'.format(len(skip), path))
+        w = open(path, 'a')
+
+    minter = BulkMinter(
+            c,
+            settings.get('CONN'),
+            settings.get('EXEC'),
+            settings.get('SENDER_ADDRESS'),
+            in_flight=config.get('_IN_FLIGHT'),
+            send=config.true('_RPC_SEND'),
+            w=w,
+            )
+    f = open(config.get('_MANIFEST'), 'r')
+    try:
+        with phase(settings.get('STATS'), 'mint'):
+            entries = read_manifest(f, token_id=config.get('_TOKEN_ID'))
+            count = minter.mint_all(entries, skip=skip)
+    finally:
+        f.close()
+        if w != sys.stdout:
+            w.close()
+    logg.info('signed {} mint transactions from manifest {}'.format(count, config.get('_MANIFEST')))
+
+
 if __name__ == '__main__':
     main()
@@ -34,6 +34,11 @@ from hexathon import strip_0x
 
 # local imports
 from craft_nft import CraftNFT
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
 
 logg = logging.getLogger()
 
@@ -59,34 +64,58 @@ def process_config_local(config, arg, args, flags):
 
     return config
 
-arg_flags = ArgFlag()
-arg = Arg(arg_flags)
-flags = arg_flags.STD_WRITE | arg_flags.WALLET | arg_flags.VALUE | arg_flags.TAB
 
-argparser = chainlib.eth.cli.ArgumentParser()
-argparser.add_argument('--name', type=str, required=True, help='Token name')
-argparser.add_argument('--symbol', type=str, required=True, help='Token symbol')
-#argparser.add_argument('--declaration-file', dest='declaration_file', type=str, help='File describing the purpose and terms of the token')
-argparser = process_args(argparser, arg, flags)
-args = argparser.parse_args(sys.argv[1:])
+def process_cli(argv=None):
+    if argv == None:
+        argv = sys.argv[1:]
 
-logg = process_log(args, logg)
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+    flags = arg_flags.STD_WRITE | arg_flags.WALLET | arg_flags.VALUE | arg_flags.TAB
 
-config = Config()
-config = process_config(config, arg, args, flags)
-config = process_config_local(config, arg, args, flags)
-logg.debug('config loaded:\n{}'.format(config))
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser.add_argument('--name', type=str, required=True, help='Token name')
+    argparser.add_argument('--symbol', type=str, required=True, help='Token symbol')
+    #argparser.add_argument('--declaration-file', dest='declaration_file', type=str, help='File describing the purpose and terms of the token')
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    args = argparser.parse_args(argv)
 
-settings = ChainSettings()
-settings = process_settings(settings, config)
-logg.debug('settings loaded:\n{}'.format(settings))
+    process_log(args, logg)
 
+    config = Config()
+    config = process_config(config, arg, args, flags)
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
 
-def main():
+    settings = ChainSettings()
+    settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
+
+
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
+
+    try:
+        publish(config, settings)
+    finally:
+        report_stats(settings, config)
+
+
+def publish(config, settings):
     token_name = config.get('_TOKEN_NAME')
     token_symbol = config.get('_TOKEN_SYMBOL')
     #token_declaration = config.get('_TOKEN_DECLARATION̈́')
     conn = settings.get('CONN')
+    stats = settings.get('STATS')
 
     c = CraftNFT(
             settings.get('CHAIN_SPEC'),
@@ -95,17 +124,20 @@ def main():
             nonce_oracle=settings.get('NONCE_ORACLE')
             )
 
-    (tx_hash_hex, o) = c.constructor(
-            settings.get('SENDER_ADDRESS'),
-            token_name,
-            token_symbol,
-            #token_declaration,
-            #enumeration=True,
-            )
+    with phase(stats, 'build'):
+        (tx_hash_hex, o) = c.constructor(
+                settings.get('SENDER_ADDRESS'),
+                token_name,
+                token_symbol,
+                #token_declaration,
+                #enumeration=True,
+                )
     if config.get('_RPC_SEND'):
-        conn.do(o)
+        with phase(stats, 'send'):
+            conn.do(o)
         if config.true('_WAIT'):
-            r = conn.wait(tx_hash_hex)
+            with phase(stats, 'wait'):
+                r = conn.wait(tx_hash_hex)
             if r['status'] == 0:
                 sys.stderr.write('EVM revert while deploying contract. Wish I had more to tell you')
                 sys.exit(1)
@@ -118,5 +150,6 @@ def main():
     else:
         print(o)
 
+
 if __name__ == '__main__':
     main()
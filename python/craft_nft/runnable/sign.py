@@ -0,0 +1,182 @@
+"""Signs the allocate and mint transactions of a plan offline, and broadcasts them
+
+.. moduleauthor:: Louis Holbrook <dev@holbrook.no>
+.. pgp:: 0826EDA1702D1E87C6E2875121D2E7BB88C2A746
+
+"""
+
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# standard imports
+import sys
+import os
+import argparse
+import logging
+import time
+
+# external imports
+import chainlib.eth.cli
+from chainlib.settings import ChainSettings
+from chainlib.eth.settings import process_settings
+from chainlib.eth.cli.arg import Arg
+from chainlib.eth.cli.arg import ArgFlag
+from chainlib.eth.cli.arg import process_args
+from chainlib.eth.cli.log import process_log
+from chainlib.eth.cli.config import Config
+from chainlib.eth.cli.config import process_config
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.sign import SigningPool
+from craft_nft.sign import read_plan
+from craft_nft.sign import build_txs
+from craft_nft.sign import write_signed
+from craft_nft.sign import broadcast
+from craft_nft.sign import DEFAULT_CHUNK_SIZE
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
+
+logg = logging.getLogger()
+
+
+def process_config_local(config, arg, args, flags):
+    if args.replay == None:
+        if args.plan == None:
+            raise ValueError('plan or replay file required')
+        if config.get('_EXEC_ADDRESS') == None:
+            raise ValueError('exec address required')
+
+    token_id = args.token_id
+    if token_id != None:
+        token_id = strip_0x(token_id)
+        bytes.fromhex(token_id)
+    config.add(token_id, '_TOKEN_ID', False)
+
+    config.add(args.plan, '_PLAN', False)
+    config.add(args.replay, '_REPLAY', False)
+    config.add(args.output, '_OUTPUT', False)
+    config.add(args.results, '_RESULTS', False)
+    config.add(args.workers, '_WORKERS', False)
+    config.add(args.chunk_size, '_CHUNK_SIZE', False)
+
+    if args.fee_limit == None:
+        config.add(200000, '_FEE_LIMIT', True)
+
+    return config
+
+
+def process_cli(argv=None):
+    if argv == None:
+        argv = sys.argv[1:]
+
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+    flags = arg_flags.STD_WRITE | arg_flags.WALLET | arg_flags.TAB | arg_flags.EXEC
+
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    argparser.add_argument('--plan', type=str, help='Sign a transaction for every entry of this csv or ndjson file of mints, and of allocations with method "allocate"')
+    argparser.add_argument('--token-id', type=str, help='Token id for plan entries without a token id')
+    argparser.add_argument('--output', type=str, help='Write the signed transactions to this file in nonce order, one per line, instead of standard output')
+    argparser.add_argument('--results', type=str, help='Write a json line for each plan entry signed to this file')
+    argparser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of signing processes (default: number of cores)')
+    argparser.add_argument('--chunk-size', dest='chunk_size', type=int, default=DEFAULT_CHUNK_SIZE, help='Number of transactions sent to a signing process at a time (default: {})'.format(DEFAULT_CHUNK_SIZE))
+    argparser.add_argument('--replay', type=str, help='Instead of signing, send the signed transactions of this file in order')
+    args = argparser.parse_args(argv)
+
+    process_log(args, logg)
+
+    config = Config()
+    config = process_config(config, arg, args, flags)
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
+
+    settings = ChainSettings()
+    settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
+
+
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
+
+    try:
+        if config.get('_REPLAY') != None:
+            replay(config, settings)
+        else:
+            sign(config, settings)
+    finally:
+        report_stats(settings, config)
+
+
+def sign(config, settings):
+    c = CraftNFT(
+            settings.get('CHAIN_SPEC'),
+            gas_oracle=settings.get('FEE_ORACLE'),
+            nonce_oracle=settings.get('NONCE_ORACLE')
+            )
+    pool = SigningPool(
+            settings.get('CHAIN_SPEC'),
+            settings.get('SIGNER'),
+            workers=config.get('_WORKERS'),
+            chunk_size=config.get('_CHUNK_SIZE'),
+            )
+
+    w = sys.stdout
+    if config.get('_OUTPUT') != None:
+        w = open(config.get('_OUTPUT'), 'w')
+    results = None
+    if config.get('_RESULTS') != None:
+        results = open(config.get('_RESULTS'), 'w')
+    f = open(config.get('_PLAN'), 'r')
+    try:
+        with phase(settings.get('STATS'), 'sign'):
+            entries = read_plan(f, token_id=config.get('_TOKEN_ID'))
+            txs = build_txs(c, settings.get('EXEC'), settings.get('SENDER_ADDRESS'), entries)
+            count = write_signed(w, pool.sign(txs), results=results)
+    finally:
+        pool.close()
+        f.close()
+        if results != None:
+            results.close()
+        if w != sys.stdout:
+            w.close()
+    logg.info('signed {} transactions from plan {}'.format(count, config.get('_PLAN')))
+
+
+def replay(config, settings):
+    conn = settings.get('CONN')
+    stats = settings.get('STATS')
+
+    tx_hash_hex = None
+    f = open(config.get('_REPLAY'), 'r')
+    try:
+        with phase(stats, 'send'):
+            for tx_hash_hex in broadcast(conn, f, id_generator=settings.get('RPC_ID_GENERATOR')):
+                print(tx_hash_hex)
+    finally:
+        f.close()
+
+    # transactions are mined in nonce order, so the last one is mined after all others
+    if tx_hash_hex != None and config.true('_WAIT'):
+        with phase(stats, 'wait'):
+            r = conn.wait(tx_hash_hex)
+        if r['status'] == 0:
+            sys.stderr.write('EVM revert in last transaction of {}\n'.format(config.get('_REPLAY')))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Synchronize a local token index database with the events of a token contract
+
+.. moduleauthor:: Louis Holbrook <dev@holbrook.no>
+.. pgp:: 0826EDA1702D1E87C6E2875121D2E7BB88C2A746 
+
+"""
+
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# standard imports
+import sys
+import os
+import time
+import logging
+
+# external imports
+import chainlib.eth.cli
+from chainlib.settings import ChainSettings
+from chainlib.eth.settings import process_settings
+from chainlib.eth.cli.arg import Arg
+from chainlib.eth.cli.arg import ArgFlag
+from chainlib.eth.cli.arg import process_args
+from chainlib.eth.cli.log import process_log
+from chainlib.eth.cli.config import Config
+from chainlib.eth.cli.config import process_config
+from hexathon import add_0x
+
+# local imports
+from craft_nft.store import TokenStore
+from craft_nft.index import DEFAULT_BLOCK_CHUNK
+from craft_nft.stats import process_args_stats
+from craft_nft.stats import process_config_stats
+from craft_nft.stats import process_settings_stats
+from craft_nft.stats import report_stats
+from craft_nft.stats import phase
+
+logg = logging.getLogger()
+
+
+def process_config_local(config, arg, args, flags):
+    contract = None
+    try:
+        contract = config.get('_EXEC_ADDRESS')
+    except KeyError:
+        pass
+
+    if contract == None:
+        address = config.get('_POSARG')
+        if address:
+            contract = add_0x(address)
+        else:
+            raise ValueError('contract address required')
+
+    config.add(contract, '_CONTRACT', False)
+    config.add(args.store, '_STORE', False)
+    config.add(args.from_block, '_FROM_BLOCK', False)
+    config.add(args.to_block, '_TO_BLOCK', False)
+    config.add(args.block_chunk_size, '_BLOCK_CHUNK_SIZE', False)
+    config.add(args.batch_size, '_BATCH_SIZE', False)
+
+    return config
+
+
+def process_cli(argv=None):
+    if argv == None:
+        argv = sys.argv[1:]
+
+    arg_flags = ArgFlag()
+    arg = Arg(arg_flags)
+    flags = arg_flags.STD_READ | arg_flags.EXEC
+
+    argparser = chainlib.eth.cli.ArgumentParser()
+    argparser = process_args(argparser, arg, flags)
+    argparser = process_args_stats(argparser)
+    argparser.add_argument('--store', type=str, required=True, help='Path to token index database file. Will be created if it does not exist')
+    argparser.add_argument('--from-block', dest='from_block', type=int, default=0, help='Block to start reading event logs from, if the token contract has not been synced before')
+    argparser.add_argument('--to-block', dest='to_block', type=int, help='Last block to read event logs for (default: latest block)')
+    argparser.add_argument('--block-chunk-size', dest='block_chunk_size', type=int, default=DEFAULT_BLOCK_CHUNK, help='Number of blocks to read event logs for in each query (default: {})'.format(DEFAULT_BLOCK_CHUNK))
+    argparser.add_argument('--batch-size', dest='batch_size', type=int, default=1, help='Send queries as json-rpc batches of this size (default: 1, no batching)')
+    argparser.add_argument('contract_address', type=str, help='Token contract address (may also be specified by -e)')
+    args = argparser.parse_args(argv)
+
+    process_log(args, logg)
+
+    config = Config()
+    config = process_config(config, arg, args, flags, positional_name='contract_address')
+    config = process_config_local(config, arg, args, flags)
+    config = process_config_stats(config, args)
+    logg.debug('config loaded:\n{}'.format(config))
+
+    settings = ChainSettings()
+    settings = process_settings(settings, config)
+    settings = process_settings_stats(settings, config)
+    logg.debug('settings loaded:\n{}'.format(settings))
+
+    return (config, settings,)
+
+
+def main(argv=None):
+    t = time.perf_counter()
+    (config, settings) = process_cli(argv)
+    stats = settings.get('STATS')
+    if stats != None:
+        stats.add_phase('setup', time.perf_counter() - t)
+
+    try:
+        sync(config, settings)
+    finally:
+        report_stats(settings, config)
+
+
+def sync(config, settings):
+    token_address = config.get('_CONTRACT')
+    conn = settings.get('CONN')
+
+    store = TokenStore(config.get('_STORE'))
+    try:
+        with phase(settings.get('STATS'), 'sync'):
+            idx = store.sync(
+                    conn,
+                    token_address,
+                    from_block=config.get('_FROM_BLOCK'),
+                    to_block=config.get('_TO_BLOCK'),
+                    chunk_size=config.get('_BLOCK_CHUNK_SIZE'),
+                    batch_size=config.get('_BATCH_SIZE'),
+                    )
+    finally:
+        store.close()
+
+    logg.info('synced {} new tokens and {} new or changed mints to block {}'.format(len(idx.tokens), len(idx.mints), idx.next_block - 1))
+
+
+if __name__ == '__main__':
+    main()
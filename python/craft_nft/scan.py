@@ -0,0 +1,312 @@
+# standard imports
+import logging
+import itertools
+import threading
+import bisect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+
+# external imports
+from hexathon import strip_0x
+from hexathon import add_0x
+from chainlib.eth.constant import ZERO_ADDRESS
+from chainlib.error import JSONRPCException
+
+# local imports
+from .nft import to_batch_key
+from .nft import batch_keys
+from .nft import BatchSpec
+from .rpc import batch_results
+from .rpc import find_length
+from .index import iter_logs
+from .index import block_height
+from .index import block_number
+from .index import TOPIC_MINT
+from .index import DEFAULT_BLOCK_CHUNK
+from .snapshot import Snapshot
+from .decode import parse_tokens
+from .decode import parse_token_specs
+
+logg = logging.getLogger(__name__)
+
+# below this many results the numpy decoders are not faster, and importing numpy is not worth it
+NUMPY_MIN_ROWS = 256
+
+
+def pool_map(executor, fn, items, ordered=True, max_pending=2):
+    """Apply fn to every item using the given executor, and yield the results.
+
+    At most max_pending items are submitted to the executor at any time, so items may be an unbounded generator.
+
+    If ordered is set, results are yielded in the order of the items. Otherwise they are yielded as soon as they complete.
+
+    If executor is None, fn is applied sequentially in the calling thread.
+    """
+    if executor == None:
+        for v in items:
+            yield fn(v)
+        return
+
+    pending = deque()
+    try:
+        for v in items:
+            pending.append(executor.submit(fn, v))
+            while len(pending) >= max_pending:
+                yield from _pool_collect(pending, ordered)
+        while len(pending) > 0:
+            yield from _pool_collect(pending, ordered)
+    finally:
+        for f in pending:
+            f.cancel()
+
+
+def _pool_collect(pending, ordered):
+    if ordered:
+        f = pending.popleft()
+        return [f.result()]
+
+    (done, not_done) = wait(pending, return_when=FIRST_COMPLETED)
+    r = []
+    for f in done:
+        pending.remove(f)
+        r.append(f.result())
+    return r
+
+
+class Scanner:
+    """Retrieves all minted tokens of a token contract by contract calls.
+
+    The minted tokens of sparse batches are found by their Mint events, starting at from_block. If the node cannot serve event logs, or mint_logs is not set, every index of sparse batches is queried instead.
+
+    If height is set, all queries are made against the state at that block number or hash. c may also be a Snapshot.
+    """
+
+    def __init__(self, c, conn, contract_address, batch_size=1, workers=1, ordered=True, sender_address=ZERO_ADDRESS, mint_logs=True, from_block=0, block_chunk_size=DEFAULT_BLOCK_CHUNK, height=None):
+        if height != None:
+            c = Snapshot(c, height=height)
+        self.c = c
+        self.conn = conn
+        self.contract_address = contract_address
+        self.sender_address = sender_address
+        self.batch_size = batch_size
+        self.chunk_size = max(batch_size, 1)
+        self.ordered = ordered
+        self.max_pending = max(workers, 1) * 2
+        self.mint_logs = mint_logs
+        self.from_block = from_block
+        self.block_chunk_size = block_chunk_size
+        self.minted_indices = None
+        self.minted_indices_lock = threading.Lock()
+        self.executor = None
+        if workers > 1:
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+
+
+    def close(self):
+        if self.executor != None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+
+    def token_count(self):
+        return find_length(self.conn, lambda i: self.c.token_at(self.contract_address, i, sender_address=self.sender_address))
+
+
+    def token_ids_at(self, indices):
+        reqs = []
+        for i in indices:
+            reqs.append(self.c.token_at(self.contract_address, i, sender_address=self.sender_address))
+        return [strip_0x(r) for r in batch_results(self.conn, reqs, batch_size=self.batch_size)]
+
+
+    def token_ids(self):
+        count = self.token_count()
+        chunks = (range(i, min(i + self.chunk_size, count)) for i in range(0, count, self.chunk_size))
+
+        # the tokens array holds one entry per allocated batch, so the same token id may appear more than once
+        seen = set()
+        for token_ids in pool_map(self.executor, self.token_ids_at, chunks, max_pending=self.max_pending):
+            for token_id in token_ids:
+                if token_id in seen:
+                    continue
+                seen.add(token_id)
+                yield token_id
+
+
+    def __load_minted_indices(self):
+        minted_indices = {}
+        to_block = getattr(self.c, 'height', None)
+        if to_block == None:
+            to_block = block_height(self.conn)
+        elif not isinstance(to_block, int):
+            # the logs are queried by block number, so a snapshot pinned to a block hash is bounded by the number of that block
+            to_block = block_number(self.conn, to_block)
+        topics = [add_0x(TOPIC_MINT)]
+        for log in iter_logs(self.conn, self.contract_address, self.from_block, to_block, topics=topics, chunk_size=self.block_chunk_size, batch_size=self.batch_size):
+            key = strip_0x(log['data'])[:64]
+            prefix = key[:52]
+            indices = minted_indices.get(prefix)
+            if indices == None:
+                indices = set()
+                minted_indices[prefix] = indices
+            indices.add(int(key[52:], 16))
+        return minted_indices
+
+
+    def batch_minted_indices(self, token_id, batch):
+        """Return the sorted indices of the batch that have been minted, according to Mint events.
+
+        Returns None if the Mint events are not available. Mints before from_block are not included.
+        """
+        if not self.mint_logs:
+            return None
+
+        with self.minted_indices_lock:
+            if self.minted_indices == None:
+                try:
+                    self.minted_indices = self.__load_minted_indices()
+                except JSONRPCException as e:
+                    logg.warning('could not retrieve mint events, falling back to querying all token indices: {}'.format(e))
+                    self.mint_logs = False
+                    return None
+
+        prefix = to_batch_key(token_id, batch, 0)[:52]
+        return sorted(self.minted_indices.get(prefix, []))
+
+
+    def token_specs(self, token_id):
+        """Return the specs of all batches of token_id.
+
+        Only the first spec is returned for a unique token.
+        """
+        o = self.c.get_token_spec(self.contract_address, token_id, 0, sender_address=self.sender_address)
+        r = self.conn.do(o)
+        spec = self.c.parse_token_spec(r)
+        if spec.count == 0 and spec.capped:
+            return [spec]
+
+        specs = [spec]
+        count = find_length(self.conn, lambda i: self.c.get_token_spec(self.contract_address, token_id, i, sender_address=self.sender_address), start=1)
+        reqs = []
+        for i in range(1, count):
+            reqs.append(self.c.get_token_spec(self.contract_address, token_id, i, sender_address=self.sender_address))
+        r = list(batch_results(self.conn, reqs, batch_size=self.batch_size))
+        specs += parse_token_specs(r, use_numpy=len(r) >= NUMPY_MIN_ROWS)
+        return specs
+
+
+    def token_batches(self, token_id):
+        specs = self.token_specs(token_id)
+        if len(specs) == 0:
+            return []
+        if specs[0].count == 0 and specs[0].capped:
+            return [(token_id, None, range(1))]
+
+        batches = []
+        for i, spec in enumerate(specs):
+            if spec.sparse:
+                indices = self.batch_minted_indices(token_id, i)
+                if indices != None and len(indices) < spec.cursor:
+                    # the cursor counts every mint, so some were made before the mint events were read from
+                    logg.warning('only {} of {} mints of token {} batch {} found in mint events from block {}'.format(len(indices), spec.cursor, token_id, i, self.from_block))
+                    indices = None
+                if indices == None:
+                    logg.info('sparse token issuance detected. Will iterate through {} tokens, may take a while'.format(spec.count))
+                    indices = range(spec.count)
+                batches.append((token_id, i, indices,))
+            else:
+                batches.append((token_id, i, range(spec.cursor),))
+        return batches
+
+
+    def token_chunks(self, batches):
+        for (token_id, batch, indices) in batches:
+            for i in range(0, len(indices), self.chunk_size):
+                yield (token_id, batch, indices[i:i + self.chunk_size],)
+
+
+    def read_tokens(self, token_ids):
+        """Return the raw mintedToken results of the given keys.
+        """
+        reqs = []
+        for v in token_ids:
+            reqs.append(self.c.get_token(self.contract_address, v, sender_address=self.sender_address))
+        return list(batch_results(self.conn, reqs, batch_size=self.batch_size))
+
+
+    def mints(self, chunk):
+        (token_id, batch, indices) = chunk
+        token_id = bytes.fromhex(strip_0x(token_id))
+        if batch == None:
+            token_ids = [token_id]
+        else:
+            token_ids = list(batch_keys(token_id, batch, indices))
+
+        r = self.read_tokens(token_ids)
+        tokens = []
+        for token in parse_tokens(r, token_ids, use_numpy=len(r) >= NUMPY_MIN_ROWS):
+            if token.minted:
+                tokens.append(token)
+        return tokens
+
+
+    def minted(self, token_id=None, after=None):
+        """Yield all minted tokens, or only those of token_id.
+
+        If after is set, it must be a tuple of token id, batch and index of a token yielded by an earlier ordered scan. The scan is then resumed after this token. The batch is None for a unique token.
+        """
+        if token_id == None:
+            token_ids = self.token_ids()
+        else:
+            token_ids = [strip_0x(token_id)]
+        if after != None:
+            after = (strip_0x(after[0]).lower(), after[1], after[2],)
+            token_ids = self.__token_ids_from(token_ids, after[0])
+
+        batches = pool_map(self.executor, self.token_batches, token_ids, ordered=self.ordered, max_pending=self.max_pending)
+        batches = itertools.chain.from_iterable(batches)
+        if after != None:
+            batches = self.__batches_after(batches, after)
+        chunks = self.token_chunks(batches)
+        for tokens in pool_map(self.executor, self.mints, chunks, ordered=self.ordered, max_pending=self.max_pending):
+            yield from tokens
+
+
+    def batch_specs(self, token_id):
+        return [BatchSpec(token_id, i, spec) for (i, spec) in enumerate(self.token_specs(token_id))]
+
+
+    def specs(self, token_id=None):
+        """Yield a BatchSpec for every batch of all tokens, or only of token_id.
+        """
+        if token_id == None:
+            token_ids = self.token_ids()
+        else:
+            token_ids = [strip_0x(token_id)]
+        for specs in pool_map(self.executor, self.batch_specs, token_ids, ordered=self.ordered, max_pending=self.max_pending):
+            yield from specs
+
+
+    def __token_ids_from(self, token_ids, token_id):
+        found = False
+        for v in token_ids:
+            if not found:
+                if v != token_id:
+                    continue
+                found = True
+            yield v
+        if not found:
+            raise ValueError('token {} to resume after not found'.format(token_id))
+
+
+    def __batches_after(self, batches, after):
+        (after_token_id, after_batch, after_index) = after
+        for (token_id, batch, indices) in batches:
+            if token_id == after_token_id:
+                if batch == None or after_batch == None or batch < after_batch:
+                    continue
+                if batch == after_batch:
+                    indices = indices[bisect.bisect_right(indices, after_index):]
+            yield (token_id, batch, indices,)
@@ -0,0 +1,224 @@
+# standard imports
+import os
+import json
+import logging
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+# external imports
+from hexathon import strip_0x
+from hexathon import add_0x
+from chainlib.eth.tx import TxFactory
+from chainlib.eth.tx import TxFormat
+from chainlib.eth.tx import raw
+
+# local imports
+from .bulk import manifest_rows
+from .bulk import parse_manifest_entry
+from .bulk import STATUS_SIGNED
+from .scan import pool_map
+
+logg = logging.getLogger(__name__)
+
+METHOD_MINT = 'mint_to'
+METHOD_ALLOCATE = 'allocate'
+
+# transactions sent to a signing worker at a time
+DEFAULT_CHUNK_SIZE = 64
+
+# transaction factory of a signing worker process
+_factory = None
+
+
+class AllocationEntry:
+    """A token batch to allocate, from the given line of a plan.
+
+    An amount of 0 allocates a unique token, and a negative amount an unbounded batch. path is the file the token id is the digest of, if any.
+    """
+
+    def __init__(self, line, token_id, amount=0, path=None):
+        self.line = line
+        self.token_id = token_id
+        self.amount = amount
+        self.path = path
+
+
+    def to_dict(self):
+        o = {
+            'line': self.line,
+            'method': METHOD_ALLOCATE,
+            'token_id': self.token_id,
+            'amount': self.amount,
+            }
+        if self.path != None:
+            o['path'] = self.path
+        return o
+
+
+def parse_allocation_entry(line, d, token_id=None):
+    """Return an AllocationEntry from a dict of plan fields.
+
+    token_id is used for entries that do not specify one.
+    """
+    v = d.get('token_id')
+    if v == None or v == '':
+        v = token_id
+    if v == None:
+        raise ValueError('plan line {}: token id missing'.format(line))
+    v = strip_0x(v)
+    if len(bytes.fromhex(v)) != 32:
+        raise ValueError('plan line {}: token id must be 32 bytes'.format(line))
+
+    amount = d.get('amount')
+    if amount == None or amount == '':
+        amount = 0
+    amount = int(amount)
+    if amount >= 2**48:
+        raise ValueError('plan line {}: amount must be less than 2^48'.format(line))
+
+    return AllocationEntry(line, v, amount=amount, path=d.get('path'))
+
+
+def read_plan(f, token_id=None):
+    """Yield the entries of a plan of transactions to sign, read from the file object f.
+
+    A plan is a mint manifest, as read by craft_nft.bulk.read_manifest, in which json lines may also have a method. Lines with the method allocate hold a token_id and an optional amount, and yield an AllocationEntry. All other lines yield a ManifestEntry.
+
+    The plan is read one line at a time.
+    """
+    for (line, d) in manifest_rows(f):
+        method = d.get('method')
+        if method == None or method == '' or method == METHOD_MINT:
+            yield parse_manifest_entry(line, d, token_id=token_id)
+        elif method == METHOD_ALLOCATE:
+            yield parse_allocation_entry(line, d, token_id=token_id)
+        else:
+            raise ValueError('plan line {}: unknown method {}'.format(line, method))
+
+
+def build_txs(c, contract_address, sender_address, entries):
+    """Yield every plan entry with its unsigned transaction, in order.
+
+    Nonces are assigned in sequence by the nonce oracle of the CraftNFT object c, and fees by its gas oracle.
+
+    Since the chain is not read, a mint entry without a batch is minted from batch 0.
+    """
+    for entry in entries:
+        if isinstance(entry, AllocationEntry):
+            tx = c.allocate(
+                    contract_address,
+                    sender_address,
+                    entry.token_id,
+                    amount=entry.amount,
+                    tx_format=TxFormat.DICT,
+                    )
+        else:
+            batch = entry.batch
+            if batch == None:
+                batch = 0
+            tx = c.mint_to(
+                    contract_address,
+                    sender_address,
+                    entry.recipient,
+                    entry.token_id,
+                    batch,
+                    index=entry.index,
+                    tx_format=TxFormat.DICT,
+                    )
+        yield (entry, tx,)
+
+
+def _init_signer(chain_spec, signer):
+    global _factory
+    _factory = TxFactory(chain_spec, signer=signer)
+
+
+def _sign_chunk(chunk):
+    r = []
+    for (entry, tx) in chunk:
+        nonce = tx['nonce']
+        (tx_hash_hex, tx_raw_hex) = _factory.build_raw(tx)
+        r.append((entry, nonce, tx_hash_hex, tx_raw_hex,))
+    return r
+
+
+def _chunks(items, chunk_size):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+class SigningPool:
+    """Signs transactions across a pool of worker processes.
+
+    workers is the number of processes, by default one per core. With a single worker, transactions are signed in the calling process.
+
+    Transactions are sent to the workers in chunks of chunk_size, and at most two chunks per worker are pending at any time.
+    """
+
+    def __init__(self, chain_spec, signer, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        if workers == None:
+            workers = os.cpu_count() or 1
+        self.workers = max(workers, 1)
+        self.chunk_size = max(chunk_size, 1)
+        self.max_pending = self.workers * 2
+        self.executor = None
+        if self.workers > 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_signer, initargs=(chain_spec, signer,))
+        else:
+            _init_signer(chain_spec, signer)
+
+
+    def sign(self, txs):
+        """Sign the unsigned transactions of (entry, tx) pairs, as yielded by build_txs, and yield (entry, nonce, tx_hash, tx_raw) for each, in the order given.
+        """
+        chunks = _chunks(txs, self.chunk_size)
+        for r in pool_map(self.executor, _sign_chunk, chunks, ordered=True, max_pending=self.max_pending):
+            yield from r
+
+
+    def close(self):
+        if self.executor != None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def write_signed(w, signed, results=None):
+    """Write the raw transactions of signed, as yielded by SigningPool.sign, to w, one per line in hex.
+
+    If results is set, a json line is written to it for each transaction, in the format of the results of craft_nft.bulk.BulkMinter.
+
+    Returns the number of transactions written.
+    """
+    count = 0
+    for (entry, nonce, tx_hash_hex, tx_raw_hex) in signed:
+        w.write(add_0x(tx_raw_hex) + '\n')
+        if results != None:
+            o = entry.to_dict()
+            o['status'] = STATUS_SIGNED
+            o['nonce'] = nonce
+            o['tx_hash'] = tx_hash_hex
+            results.write(json.dumps(o) + '\n')
+        count += 1
+    return count
+
+
+def read_signed(f):
+    """Yield the raw transactions of a file written by write_signed, in hex.
+    """
+    for line in f:
+        line = line.strip()
+        if len(line) == 0 or line[0] == '#':
+            continue
+        yield add_0x(line)
+
+
+def broadcast(conn, f, id_generator=None):
+    """Send the raw transactions of a file written by write_signed, in the order of the file, and yield the hash of each.
+    """
+    for tx_raw_hex in read_signed(f):
+        o = raw(tx_raw_hex, id_generator=id_generator)
+        yield conn.do(o)
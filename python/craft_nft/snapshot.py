@@ -0,0 +1,43 @@
+# standard imports
+import logging
+
+# local imports
+from .index import block_height
+
+logg = logging.getLogger(__name__)
+
+READ_METHODS = [
+    'token_at',
+    'batch_of',
+    'get_token_spec',
+    'get_token',
+    'get_digest',
+    'to_uri',
+    'to_url',
+    'token_uri',
+    ]
+
+
+class Snapshot:
+    """Wraps a CraftNFT object so that all of its read queries are made against the state of the same block.
+
+    height may be a block number or a block hash. If it is not set, the current block number is retrieved with conn, and used for the lifetime of the snapshot.
+
+    Apart from the read queries, which can no longer be passed a height, the snapshot can be used in place of the wrapped object.
+    """
+
+    def __init__(self, c, conn=None, height=None):
+        if height == None:
+            height = block_height(conn)
+            logg.debug('snapshot pinned to block {}'.format(height))
+        self.c = c
+        self.height = height
+
+
+    def __getattr__(self, k):
+        v = getattr(self.c, k)
+        if k in READ_METHODS:
+            def read(*args, **kwargs):
+                return v(*args, height=self.height, **kwargs)
+            return read
+        return v
@@ -0,0 +1,251 @@
+# standard imports
+import json
+import bisect
+import logging
+
+# external imports
+from hexathon import strip_0x
+
+# local imports
+from .nft import parse_token_word
+from .index import TokenIndex
+from .storage import SLOT_TOKENS
+from .storage import SLOT_TOKEN_BY_INDEX
+from .storage import SLOT_DEFAULT_DIGEST_ENCODING
+from .storage import array_element_slot
+from .storage import token_spec_count_slot
+from .storage import minted_token_slot
+from .storage import parse_token_spec_word
+
+logg = logging.getLogger(__name__)
+
+# batch numbers are 16 bits wide in token keys
+MAX_BATCHES = 1 << 16
+
+# upper bound of the length of the tokens and tokenByIndex arrays, to match their element slots without knowing their lengths
+MAX_ARRAY_LENGTH = 1 << 64
+
+
+def _hex_int(v):
+    if v[:2] == '0x':
+        v = v[2:]
+    if len(v) == 0:
+        return 0
+    return int(v, 16)
+
+
+def _storage_items(storage):
+    for (k, v) in storage.items():
+        if isinstance(v, dict):
+            # debug_storageRangeAt entries are keyed by slot hash, with the slot itself as key if the node has its preimage
+            yield (v.get('key'), v.get('value'),)
+        else:
+            yield (k, v,)
+
+
+def _document_entries(o, contract_address):
+    if 'result' in o:
+        o = o['result']
+    if o == None:
+        return
+
+    if 'accounts' in o:
+        # whole state dump, keyed by account address
+        for (address, account) in o['accounts'].items():
+            yield from _document_entries(dict(account, address=address), contract_address)
+        return
+
+    if 'address' in o and contract_address != None:
+        if strip_0x(o['address']).lower() != contract_address:
+            return
+
+    if 'storage' in o:
+        yield from _storage_items(o['storage'])
+    elif 'value' in o:
+        yield (o.get('slot', o.get('key')), o['value'],)
+
+
+def iter_storage_entries(f, contract_address=None):
+    """Yield the (slot, value) entries of a contract storage dump read from the file object f, with slot and value as int.
+
+    Accepted formats, one item per line, which may be mixed:
+
+    * results of debug_storageRangeAt, one page per line, with or without the json-rpc response envelope
+    * accounts of a state dump, as output by geth dump --iterative, of which only those of contract_address are read if it is set
+    * objects with a slot (or key) and value
+    * a slot and a value in hex, separated by whitespace
+
+    A file that holds a single json document spanning more than one line is read as a whole, and is not streamed.
+
+    Entries without the slot, such as debug_storageRangeAt entries of slots whose preimage is not known to the node, are skipped.
+    """
+    if contract_address != None:
+        contract_address = strip_0x(contract_address).lower()
+
+    skipped = 0
+    first = True
+    for line in f:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+
+        if line[0] == '{':
+            try:
+                o = json.loads(line)
+            except json.JSONDecodeError:
+                if not first:
+                    raise
+                logg.warning('storage dump is not line delimited, reading it as a single json document')
+                o = json.loads(line + f.read())
+            entries = _document_entries(o, contract_address)
+        else:
+            entries = [line.split()[:2]]
+        first = False
+
+        for (slot, value) in entries:
+            if slot == None:
+                skipped += 1
+                continue
+            yield (_hex_int(slot), _hex_int(value),)
+
+    if skipped > 0:
+        logg.warning('skipped {} storage dump entries without slot preimage'.format(skipped))
+
+
+class StateDump:
+    """Rebuilds the token, batch and owner tables of a CraftNFT contract from a dump of its storage, without any json-rpc queries.
+
+    The dump is read twice: first for the tokens and tokenByIndex arrays, then for the batch specs of the tokens and the mintedToken values of the minted keys. Only the slots needed are kept in memory, so memory use follows the number of tokens, not the size of the dump.
+
+    path is the dump file, in any of the formats read by iter_storage_entries. If the dump holds the state of more than one contract, contract_address must be given.
+    """
+
+    def __init__(self, path, contract_address=None):
+        self.path = path
+        self.contract_address = contract_address
+
+
+    def entries(self):
+        f = open(self.path, 'r')
+        try:
+            yield from iter_storage_entries(f, contract_address=self.contract_address)
+        finally:
+            f.close()
+
+
+    def read_arrays(self):
+        """Return the token ids of the tokens array, and the keys of the tokenByIndex array, in order, both as 32 byte values.
+        """
+        tokens_base = array_element_slot(SLOT_TOKENS, 0)
+        token_by_index_base = array_element_slot(SLOT_TOKEN_BY_INDEX, 0)
+        values = {}
+        tokens = {}
+        token_by_index = {}
+        for (slot, value) in self.entries():
+            if slot <= SLOT_DEFAULT_DIGEST_ENCODING:
+                values[slot] = value
+            elif slot >= tokens_base and slot - tokens_base < MAX_ARRAY_LENGTH:
+                tokens[slot - tokens_base] = value
+            elif slot >= token_by_index_base and slot - token_by_index_base < MAX_ARRAY_LENGTH:
+                token_by_index[slot - token_by_index_base] = value
+
+        token_ids = []
+        for i in range(values.get(SLOT_TOKENS, 0)):
+            token_ids.append(tokens.get(i, 0).to_bytes(32, byteorder='big'))
+        keys = []
+        for i in range(values.get(SLOT_TOKEN_BY_INDEX, 0)):
+            keys.append(token_by_index.get(i, 0).to_bytes(32, byteorder='big'))
+        return (token_ids, keys,)
+
+
+    def read_tokens(self, token_ids, keys):
+        """Return the spec values of each batch of the given token ids, and the mintedToken values of the given keys.
+        """
+        count_slots = {}
+        spec_bases = []
+        for token_id in token_ids:
+            slot = token_spec_count_slot(token_id)
+            count_slots[slot] = token_id
+            spec_bases.append((array_element_slot(slot, 0), token_id,))
+        spec_bases.sort()
+        bases = [v[0] for v in spec_bases]
+        minted_slots = {}
+        for key in keys:
+            minted_slots[minted_token_slot(key)] = key
+
+        counts = {}
+        specs = {}
+        words = {}
+        for (slot, value) in self.entries():
+            if slot in count_slots:
+                counts[count_slots[slot]] = value
+            elif slot in minted_slots:
+                words[minted_slots[slot]] = value
+            else:
+                i = bisect.bisect_right(bases, slot) - 1
+                if i < 0 or slot - bases[i] >= MAX_BATCHES:
+                    continue
+                token_id = spec_bases[i][1]
+                token_specs = specs.get(token_id)
+                if token_specs == None:
+                    token_specs = {}
+                    specs[token_id] = token_specs
+                token_specs[slot - bases[i]] = value
+
+        r = {}
+        for token_id in token_ids:
+            token_specs = specs.get(token_id, {})
+            r[token_id] = [token_specs.get(i, 0) for i in range(counts.get(token_id, 0))]
+        return (r, words,)
+
+
+    def load(self, height=None):
+        """Return a TokenIndex of the state in the dump.
+
+        If height is set, it is the block of the state dumped, and the index is marked as synced up to it.
+
+        The tokens of each owner are indexed from the owners of the mintedToken values. The owner enumeration mappings of the contract are not read.
+        """
+        (token_ids, keys) = self.read_arrays()
+
+        # the tokens array holds one entry per allocated batch, so the same token id may appear more than once
+        seen = set()
+        unique_token_ids = []
+        for token_id in token_ids:
+            if token_id in seen:
+                continue
+            seen.add(token_id)
+            unique_token_ids.append(token_id)
+
+        (specs, words) = self.read_tokens(unique_token_ids, keys)
+
+        idx = TokenIndex()
+        if height != None:
+            idx.next_block = height + 1
+        for token_id in unique_token_ids:
+            token_id_hex = token_id.hex()
+            idx.tokens.append(token_id_hex)
+            idx.specs[token_id_hex] = [parse_token_spec_word(v) for v in specs[token_id]]
+            idx.prefixes[token_id_hex[:48]] = token_id_hex
+            idx.keys[token_id_hex] = []
+
+        for key in keys:
+            token = parse_token_word(words.get(key, 0).to_bytes(32, byteorder='big'), key)
+            key = key.hex()
+            if not token.minted or token.token_id not in idx.keys:
+                logg.warning('minted key {} has no token in the storage dump, skipping'.format(key))
+                continue
+            idx.mints[key] = token
+            idx.keys[token.token_id].append(key)
+            owned = idx.owners.get(token.owner)
+            if owned == None:
+                owned = set()
+                idx.owners[token.owner] = owned
+            owned.add(key)
+
+        logg.debug('loaded {} tokens and {} mints from storage dump {}'.format(len(idx.tokens), len(idx.mints), self.path))
+        return idx
+
+
+def load_state_dump(path, contract_address=None, height=None):
+    return StateDump(path, contract_address=contract_address).load(height=height)
@@ -0,0 +1,289 @@
+# standard imports
+import sys
+import time
+import json
+import logging
+import threading
+import contextlib
+from collections import OrderedDict
+
+# external imports
+from hexathon import strip_0x
+
+# local imports
+from .artifact import SELECTORS
+
+logg = logging.getLogger(__name__)
+
+# upper bounds of the latency histogram buckets, in seconds. The last bucket holds all slower queries
+DEFAULT_BUCKETS = [
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    ]
+
+# rpc methods whose first parameter is a transaction object with contract input data
+CALL_METHODS = [
+    'eth_call',
+    'eth_estimateGas',
+    ]
+
+__signatures = None
+
+
+def signature_of(selector):
+    """Return the signature of the contract method with the given selector, or None if it is not a method of the contract.
+    """
+    global __signatures
+    if __signatures == None:
+        __signatures = {}
+        for (k, v) in SELECTORS.items():
+            __signatures[v] = k
+    return __signatures.get(selector)
+
+
+def __raw_tx_data(v):
+    # the rlp module is a dependency of chainlib's transaction stack
+    import rlp
+    fields = rlp.decode(bytes.fromhex(strip_0x(v)))
+    return fields[5].hex()
+
+
+def query_key(o):
+    """Return the key to record a json-rpc query under.
+
+    Contract calls and transactions are recorded under the rpc method followed by the contract method signature, decoded from the input data selector. All other queries are recorded under the rpc method only.
+    """
+    method = o.get('method')
+    data = None
+    try:
+        if method in CALL_METHODS:
+            data = o['params'][0].get('data')
+        elif method == 'eth_sendRawTransaction':
+            data = __raw_tx_data(o['params'][0])
+    except Exception as e:
+        logg.debug('could not decode input data of {} query: {}'.format(method, e))
+
+    if data == None:
+        return method
+    selector = strip_0x(data)[:8]
+    signature = signature_of(selector)
+    if signature == None:
+        if len(selector) == 0:
+            return method
+        signature = selector
+    return '{} {}'.format(method, signature)
+
+
+class MethodStats:
+    """Counters of the queries recorded under a single key.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.time = 0.0
+        self.histogram = [0] * (len(buckets) + 1)
+
+
+    def add(self, latency, sent, received, error=None):
+        self.count += 1
+        if error != None:
+            self.errors += 1
+        self.bytes_sent += sent
+        self.bytes_received += received
+        self.time += latency
+        i = 0
+        for v in self.buckets:
+            if latency <= v:
+                break
+            i += 1
+        self.histogram[i] += 1
+
+
+    def to_dict(self):
+        histogram = OrderedDict()
+        for (i, v) in enumerate(self.buckets):
+            histogram['le_{}'.format(v)] = self.histogram[i]
+        histogram['inf'] = self.histogram[-1]
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'time': round(self.time, 6),
+            'histogram': histogram,
+            }
+
+
+class Stats:
+    """Per query key counters, and wall clock timings of named phases of a run.
+
+    Hooks added with add_hook are called for every recorded query, with the key, latency in seconds, bytes sent, bytes received and the exception raised by the query or None. They can be used to feed the same counters to other monitoring.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.methods = OrderedDict()
+        self.phases = OrderedDict()
+        self.roundtrips = 0
+        self.hooks = []
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+
+    def add_hook(self, fn):
+        self.hooks.append(fn)
+
+
+    def record(self, key, latency, sent, received, error=None):
+        with self.lock:
+            v = self.methods.get(key)
+            if v == None:
+                v = MethodStats(buckets=self.buckets)
+                self.methods[key] = v
+            v.add(latency, sent, received, error=error)
+        for fn in self.hooks:
+            fn(key, latency, sent, received, error)
+
+
+    def add_phase(self, name, seconds):
+        with self.lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+
+    def phase(self, name):
+        return Phase(self, name)
+
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'started': self.started,
+                'roundtrips': self.roundtrips,
+                'phases': OrderedDict([(k, round(v, 6)) for (k, v) in self.phases.items()]),
+                'methods': OrderedDict([(k, v.to_dict()) for (k, v) in self.methods.items()]),
+                }
+
+
+    def write(self, w=sys.stderr):
+        json.dump(self.to_dict(), w, indent=2)
+        w.write('\n')
+
+
+def phase(stats, name):
+    """Return a context manager timing a phase of stats, which does nothing if stats is None.
+    """
+    if stats == None:
+        return contextlib.nullcontext()
+    return stats.phase(name)
+
+
+class Phase:
+    """Context manager adding the time spent in its block to a phase of a Stats object.
+    """
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.t = None
+
+
+    def __enter__(self):
+        self.t = time.perf_counter()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stats.add_phase(self.name, time.perf_counter() - self.t)
+
+
+class StatsConnection:
+    """Records counts, latency, sizes and errors of all queries made through a json-rpc connection.
+
+    The queries of a json-rpc batch share its latency equally. Sizes are those of the queries and results serialized as json.
+    """
+
+    def __init__(self, conn, stats=None):
+        self.conn = conn
+        if stats == None:
+            stats = Stats()
+        self.stats = stats
+
+
+    def __getattr__(self, k):
+        return getattr(self.conn, k)
+
+
+    def do(self, o, **kwargs):
+        with self.stats.lock:
+            self.stats.roundtrips += 1
+
+        batch = isinstance(o, list)
+        queries = o
+        if not batch:
+            queries = [o]
+
+        error = None
+        r = None
+        t = time.perf_counter()
+        try:
+            r = self.conn.do(o, **kwargs)
+            return r
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            latency = (time.perf_counter() - t) / max(len(queries), 1)
+            results = r
+            if not batch:
+                results = [r]
+            for (i, v) in enumerate(queries):
+                received = 0
+                if error == None:
+                    received = len(json.dumps(results[i]))
+                self.stats.record(query_key(v), latency, len(json.dumps(v)), received, error=error)
+
+
+def process_args_stats(argparser):
+    argparser.add_argument('--stats', action='store_true', help='Print query and timing statistics as json to standard error when done')
+    argparser.add_argument('--stats-file', dest='stats_file', type=str, help='Write query and timing statistics as json to this file when done')
+    return argparser
+
+
+def process_config_stats(config, args):
+    config.add(args.stats or args.stats_file != None, '_STATS', False)
+    config.add(args.stats_file, '_STATS_FILE', False)
+    return config
+
+
+def process_settings_stats(settings, config):
+    """If statistics are enabled, wrap the connection in the settings in a StatsConnection, and add its Stats object to the settings as STATS.
+    """
+    stats = None
+    if config.true('_STATS'):
+        conn = StatsConnection(settings.get('CONN'))
+        settings.set('CONN', conn)
+        stats = conn.stats
+    settings.set('STATS', stats)
+    return settings
+
+
+def report_stats(settings, config):
+    stats = settings.get('STATS')
+    if stats == None:
+        return
+    if config.get('_STATS_FILE') != None:
+        f = open(config.get('_STATS_FILE'), 'w')
+        stats.write(f)
+        f.close()
+    else:
+        stats.write(sys.stderr)
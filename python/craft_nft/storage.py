@@ -0,0 +1,234 @@
+# standard imports
+import logging
+
+# external imports
+from hexathon import strip_0x
+from hexathon import add_0x
+from chainlib.jsonrpc import JSONRPCRequest
+from chainlib.hash import keccak256
+
+# local imports
+from .nft import TokenSpec
+from .nft import to_block_param
+from .rpc import batch_results
+from .scan import Scanner
+
+logg = logging.getLogger(__name__)
+
+# storage slots of the state variables of CraftNFT.sol, in order of declaration
+SLOT_OWNER = 0
+SLOT_WRITER = 1
+SLOT_OWNER_FINAL = 2
+SLOT_TOKENS = 3
+SLOT_TOKEN = 4
+SLOT_MINTED_TOKEN = 5
+SLOT_TOKEN_BY_INDEX = 6
+SLOT_TOKEN_ALLOWANCE = 7
+SLOT_TOKEN_OPERATOR = 8
+SLOT_NAME = 9
+SLOT_SYMBOL = 10
+SLOT_BASE_URL = 11
+SLOT_TOKEN_OF_OWNER_BY_INDEX = 12
+SLOT_OWNER_INDEX_REVERSE = 13
+SLOT_BALANCE = 14
+SLOT_MULTI_HASH = 15
+SLOT_CURRENT_MSG = 16
+SLOT_DEFAULT_DIGEST_ENCODING = 17
+
+# a tokenSpec struct is packed in a single slot, starting at the lowest order bytes
+UINT48_MASK = (1 << 48) - 1
+TOKEN_SPEC_CURSOR_SHIFT = 48
+TOKEN_SPEC_SPARSE_SHIFT = 96
+TOKEN_SPEC_CAPPED_SHIFT = 104
+
+
+def to_word(v):
+    """Return a storage key or value as 32 bytes.
+
+    v may be an int, bytes, or hex. Shorter values are left padded.
+    """
+    if isinstance(v, int):
+        return v.to_bytes(32, byteorder='big')
+    if isinstance(v, str):
+        v = strip_0x(v)
+        if len(v) % 2 > 0:
+            v = '0' + v
+        v = bytes.fromhex(v)
+    if len(v) > 32:
+        raise ValueError('value too long ({})'.format(len(v) * 2))
+    return bytes(v).rjust(32, b'\x00')
+
+
+def mapping_slot(key, slot):
+    """Return the storage slot of the value of key in the mapping at the given slot.
+    """
+    return int.from_bytes(keccak256(to_word(key) + to_word(slot)), byteorder='big')
+
+
+def array_element_slot(slot, idx):
+    """Return the storage slot of the element at idx in the dynamic array whose length is stored at the given slot.
+
+    Only valid for arrays of elements that take a whole slot each.
+    """
+    return int.from_bytes(keccak256(to_word(slot)), byteorder='big') + idx
+
+
+def tokens_slot(idx):
+    return array_element_slot(SLOT_TOKENS, idx)
+
+
+def token_spec_count_slot(token_id):
+    return mapping_slot(token_id, SLOT_TOKEN)
+
+
+def token_spec_slot(token_id, batch):
+    return array_element_slot(token_spec_count_slot(token_id), batch)
+
+
+def minted_token_slot(token_id):
+    return mapping_slot(token_id, SLOT_MINTED_TOKEN)
+
+
+def token_by_index_slot(idx):
+    return array_element_slot(SLOT_TOKEN_BY_INDEX, idx)
+
+
+def token_of_owner_by_index_slot(address, idx):
+    return mapping_slot(idx, mapping_slot(address, SLOT_TOKEN_OF_OWNER_BY_INDEX))
+
+
+def balance_slot(address):
+    return mapping_slot(address, SLOT_BALANCE)
+
+
+def get_storage_at(contract_address, slot, height=None, id_generator=None):
+    j = JSONRPCRequest(id_generator)
+    o = j.template()
+    o['method'] = 'eth_getStorageAt'
+    o['params'].append(add_0x(contract_address))
+    o['params'].append(hex(slot))
+    o['params'].append(to_block_param(height))
+    o = j.finalize(o)
+    return o
+
+
+def token_count(contract_address, height=None, id_generator=None):
+    """Query the length of the tokens array, which holds one entry per allocated batch.
+    """
+    return get_storage_at(contract_address, SLOT_TOKENS, height=height, id_generator=id_generator)
+
+
+def token_at(contract_address, idx, height=None, id_generator=None):
+    return get_storage_at(contract_address, tokens_slot(idx), height=height, id_generator=id_generator)
+
+
+def token_spec_count(contract_address, token_id, height=None, id_generator=None):
+    """Query the number of batches allocated for token_id.
+    """
+    return get_storage_at(contract_address, token_spec_count_slot(token_id), height=height, id_generator=id_generator)
+
+
+def get_token_spec(contract_address, token_id, batch, height=None, id_generator=None):
+    return get_storage_at(contract_address, token_spec_slot(token_id, batch), height=height, id_generator=id_generator)
+
+
+def get_token(contract_address, token_id, height=None, id_generator=None):
+    return get_storage_at(contract_address, minted_token_slot(token_id), height=height, id_generator=id_generator)
+
+
+def total_supply(contract_address, height=None, id_generator=None):
+    return get_storage_at(contract_address, SLOT_TOKEN_BY_INDEX, height=height, id_generator=id_generator)
+
+
+def token_by_index(contract_address, idx, height=None, id_generator=None):
+    return get_storage_at(contract_address, token_by_index_slot(idx), height=height, id_generator=id_generator)
+
+
+def token_of_owner_by_index(contract_address, address, idx, height=None, id_generator=None):
+    return get_storage_at(contract_address, token_of_owner_by_index_slot(address, idx), height=height, id_generator=id_generator)
+
+
+def balance_of(contract_address, address, height=None, id_generator=None):
+    return get_storage_at(contract_address, balance_slot(address), height=height, id_generator=id_generator)
+
+
+def parse_word(v):
+    """Return an eth_getStorageAt result as 64 hex characters.
+
+    Nodes may return the value without leading zeros.
+    """
+    v = strip_0x(v)
+    if len(v) > 64:
+        raise ValueError('storage value too long ({})'.format(len(v)))
+    return v.rjust(64, '0')
+
+
+def parse_uint(v):
+    return int(parse_word(v), 16)
+
+
+def parse_token_spec_word(v):
+    """Decode a packed tokenSpec storage value, given as int, bytes or hex.
+    """
+    if not isinstance(v, int):
+        v = int.from_bytes(to_word(v), byteorder='big')
+    return TokenSpec(
+            v & UINT48_MASK,
+            (v >> TOKEN_SPEC_CURSOR_SHIFT) & UINT48_MASK,
+            (v >> TOKEN_SPEC_SPARSE_SHIFT) & 0xff > 0,
+            (v >> TOKEN_SPEC_CAPPED_SHIFT) & 0xff > 0,
+            )
+
+
+class StorageScanner(Scanner):
+    """Retrieves all minted tokens of a token contract by reading its storage directly with eth_getStorageAt, instead of by contract calls.
+
+    Every query reads a single storage slot. The lengths of the token and batch arrays are read from storage too, where the Scanner has to search for them.
+
+    The slots are those of the storage layout of CraftNFT.sol. It cannot be used with contracts of a different layout.
+
+    Arguments are those of the Scanner, except that no sender address is needed.
+    """
+
+    def __init__(self, c, conn, contract_address, height=None, **kwargs):
+        kwargs.pop('sender_address', None)
+        super(StorageScanner, self).__init__(c, conn, contract_address, height=height, **kwargs)
+        self.height = height
+
+
+    def token_count(self):
+        r = self.conn.do(token_count(self.contract_address, height=self.height))
+        return parse_uint(r)
+
+
+    def token_ids_at(self, indices):
+        reqs = []
+        for i in indices:
+            reqs.append(token_at(self.contract_address, i, height=self.height))
+        return [parse_word(r) for r in batch_results(self.conn, reqs, batch_size=self.batch_size)]
+
+
+    def token_specs(self, token_id):
+        r = self.conn.do(token_spec_count(self.contract_address, token_id, height=self.height))
+        count = parse_uint(r)
+        reqs = []
+        for i in range(count):
+            reqs.append(get_token_spec(self.contract_address, token_id, i, height=self.height))
+        return [parse_token_spec_word(r) for r in batch_results(self.conn, reqs, batch_size=self.batch_size)]
+
+
+    def read_tokens(self, token_ids):
+        reqs = []
+        for v in token_ids:
+            reqs.append(get_token(self.contract_address, v, height=self.height))
+        return [parse_word(r) for r in batch_results(self.conn, reqs, batch_size=self.batch_size)]
+
+
+def iter_minted(c, conn, contract_address, token_id=None, after=None, **kwargs):
+    """Storage reading version of CraftNFT.iter_minted.
+    """
+    scanner = StorageScanner(c, conn, contract_address, **kwargs)
+    try:
+        yield from scanner.minted(token_id=token_id, after=after)
+    finally:
+        scanner.close()
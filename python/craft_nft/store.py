@@ -0,0 +1,263 @@
+# standard imports
+import logging
+import sqlite3
+
+# external imports
+from hexathon import strip_0x
+
+# local imports
+from .nft import TokenSpec
+from .nft import MintedToken
+from .nft import BatchSpec
+from .index import TokenIndex
+from .index import DEFAULT_BLOCK_CHUNK
+from .index import TOPIC_ALLOCATE
+from .index import TOPIC_MINT
+from .index import TOPIC_TRANSFER
+from .index import block_height
+from .index import iter_index_logs
+
+logg = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync (
+    contract TEXT PRIMARY KEY,
+    next_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS token (
+    contract TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (contract, token_id)
+);
+CREATE TABLE IF NOT EXISTS batch (
+    contract TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    batch INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    cursor INTEGER NOT NULL,
+    sparse INTEGER NOT NULL,
+    capped INTEGER NOT NULL,
+    PRIMARY KEY (contract, token_id, batch)
+);
+CREATE TABLE IF NOT EXISTS mint (
+    contract TEXT NOT NULL,
+    key TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    batched INTEGER NOT NULL,
+    batch INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    owner TEXT NOT NULL,
+    PRIMARY KEY (contract, key)
+);
+CREATE INDEX IF NOT EXISTS mint_owner ON mint (contract, owner);
+"""
+
+
+def _contract_key(contract_address):
+    return strip_0x(contract_address).lower()
+
+
+def _add_stored_token(idx, token_id, specs):
+    idx.specs[token_id] = specs
+    idx.prefixes[token_id[:48]] = token_id
+    idx.keys[token_id] = []
+
+
+def _add_stored_mint(idx, key, token_id, batched, batch, index, owner):
+    token = MintedToken(owner, token_id=token_id, batched=batched > 0, minted=True)
+    token.batch = batch
+    token.index = index
+    idx.mints[key] = token
+    keys = idx.keys.get(token_id)
+    if keys != None:
+        keys.append(key)
+    owned = idx.owners.get(owner)
+    if owned == None:
+        owned = set()
+        idx.owners[owner] = owned
+    owned.add(key)
+
+
+class TokenStore:
+    """Persists the state of a TokenIndex in an SQLite database file, so that it can be synced incrementally.
+
+    A single database may hold the indexes of several token contracts.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+
+    def close(self):
+        self.db.close()
+
+
+    def next_block(self, contract_address):
+        contract = _contract_key(contract_address)
+        r = self.db.execute('SELECT next_block FROM sync WHERE contract = ?', (contract,)).fetchone()
+        if r == None:
+            return None
+        return r[0]
+
+
+    def load(self, contract_address, from_block=0):
+        contract = _contract_key(contract_address)
+        next_block = self.next_block(contract)
+        if next_block == None:
+            return TokenIndex(from_block=from_block)
+
+        idx = TokenIndex(from_block=next_block)
+        for (token_id,) in self.db.execute('SELECT token_id FROM token WHERE contract = ? ORDER BY position', (contract,)):
+            idx.tokens.append(token_id)
+            _add_stored_token(idx, token_id, [])
+
+        for (token_id, count, cursor, sparse, capped) in self.db.execute('SELECT token_id, count, cursor, sparse, capped FROM batch WHERE contract = ? ORDER BY token_id, batch', (contract,)):
+            idx.specs[token_id].append(TokenSpec(count, cursor, sparse > 0, capped > 0))
+
+        for (key, token_id, batched, batch, index, owner) in self.db.execute('SELECT key, token_id, batched, batch, idx, owner FROM mint WHERE contract = ?', (contract,)):
+            _add_stored_mint(idx, key, token_id, batched, batch, index, owner)
+
+        logg.debug('loaded {} tokens and {} mints up to block {} from {}'.format(len(idx.tokens), len(idx.mints), next_block, self.path))
+        return idx
+
+
+    def save(self, contract_address, idx, position=0):
+        """Write the tokens, batches and mints of idx to the store.
+
+        The tokens in idx.tokens are stored in order from position. The batches of tokens that are in idx.specs only are written, but not their position.
+        """
+        contract = _contract_key(contract_address)
+        tokens = []
+        for (i, token_id) in enumerate(idx.tokens):
+            tokens.append((contract, token_id, position + i,))
+
+        batches = []
+        for (token_id, specs) in idx.specs.items():
+            for (j, spec) in enumerate(specs):
+                batches.append((contract, token_id, j, spec.count, spec.cursor, int(spec.sparse), int(spec.capped),))
+
+        mints = []
+        for (key, token) in idx.mints.items():
+            mints.append((contract, key, token.token_id, int(token.batched), token.batch, token.index, token.owner,))
+
+        with self.db:
+            self.db.executemany('INSERT OR REPLACE INTO token (contract, token_id, position) VALUES (?, ?, ?)', tokens)
+            self.db.executemany('INSERT OR REPLACE INTO batch (contract, token_id, batch, count, cursor, sparse, capped) VALUES (?, ?, ?, ?, ?, ?, ?)', batches)
+            self.db.executemany('INSERT OR REPLACE INTO mint (contract, key, token_id, batched, batch, idx, owner) VALUES (?, ?, ?, ?, ?, ?, ?)', mints)
+            self.db.execute('INSERT OR REPLACE INTO sync (contract, next_block) VALUES (?, ?)', (contract, idx.next_block,))
+        logg.debug('saved {} tokens, {} batches and {} mints up to block {} to {}'.format(len(tokens), len(batches), len(mints), idx.next_block, self.path))
+
+
+    def __read_token(self, idx, contract, token_id):
+        if idx.specs.get(token_id) != None:
+            return
+        specs = []
+        for (count, cursor, sparse, capped) in self.db.execute('SELECT count, cursor, sparse, capped FROM batch WHERE contract = ? AND token_id = ? ORDER BY batch', (contract, token_id,)):
+            specs.append(TokenSpec(count, cursor, sparse > 0, capped > 0))
+        if len(specs) > 0:
+            _add_stored_token(idx, token_id, specs)
+
+
+    def __read_token_by_prefix(self, idx, contract, prefix):
+        if idx.prefixes.get(prefix) != None:
+            return
+        r = self.db.execute('SELECT token_id FROM token WHERE contract = ? AND token_id BETWEEN ? AND ?', (contract, prefix + '0' * 16, prefix + 'f' * 16,)).fetchone()
+        if r != None:
+            self.__read_token(idx, contract, r[0])
+
+
+    def __read_mint(self, idx, contract, key):
+        if idx.mints.get(key) != None:
+            return
+        r = self.db.execute('SELECT token_id, batched, batch, idx, owner FROM mint WHERE contract = ? AND key = ?', (contract, key,)).fetchone()
+        if r != None:
+            _add_stored_mint(idx, key, *r)
+
+
+    def read_changes(self, contract_address, logs, next_block):
+        """Return a TokenIndex from next_block holding only the stored tokens and mints that the event logs in logs change.
+
+        The tokens in the index are read with all their batches, but are not added to idx.tokens, which is left for tokens allocated after next_block.
+        """
+        contract = _contract_key(contract_address)
+        idx = TokenIndex(from_block=next_block)
+        for log in logs:
+            topics = log['topics']
+            topic = strip_0x(topics[0])
+            if topic == TOPIC_ALLOCATE:
+                self.__read_token(idx, contract, strip_0x(log['data'])[:64])
+            elif topic == TOPIC_MINT:
+                key = strip_0x(log['data'])[:64]
+                self.__read_token(idx, contract, key)
+                self.__read_token_by_prefix(idx, contract, key[:48])
+            elif topic == TOPIC_TRANSFER:
+                self.__read_mint(idx, contract, strip_0x(topics[3]))
+        return idx
+
+
+    def sync(self, conn, contract_address, from_block=0, to_block=None, chunk_size=DEFAULT_BLOCK_CHUNK, batch_size=1):
+        """Add the events of the contract since the last sync to the store, and return a TokenIndex of the tokens and mints that changed.
+
+        Only the rows that the new events change are read from the store, and written back to it. The first sync of a contract reads its events from from_block.
+        """
+        contract = _contract_key(contract_address)
+        next_block = self.next_block(contract)
+        if next_block == None:
+            idx = TokenIndex(from_block=from_block)
+            idx.sync(conn, contract_address, to_block=to_block, chunk_size=chunk_size, batch_size=batch_size)
+            self.save(contract_address, idx)
+            return idx
+
+        if to_block == None:
+            to_block = block_height(conn)
+        if to_block < next_block:
+            return TokenIndex(from_block=next_block)
+
+        logs = list(iter_index_logs(conn, contract_address, next_block, to_block, chunk_size=chunk_size, batch_size=batch_size))
+        idx = self.read_changes(contract_address, logs, next_block)
+        for log in logs:
+            idx.add_log(log)
+        idx.next_block = to_block + 1
+
+        (position,) = self.db.execute('SELECT COUNT(*) FROM token WHERE contract = ?', (contract,)).fetchone()
+        self.save(contract_address, idx, position=position)
+        return idx
+
+
+    def minted(self, contract_address, token_id=None):
+        contract = _contract_key(contract_address)
+        q = 'SELECT mint.key, mint.token_id, mint.batched, mint.batch, mint.idx, mint.owner FROM mint JOIN token ON token.contract = mint.contract AND token.token_id = mint.token_id WHERE mint.contract = ?'
+        params = [contract]
+        if token_id != None:
+            q += ' AND mint.token_id = ?'
+            params.append(strip_0x(token_id))
+        q += ' ORDER BY token.position, mint.key'
+
+        for (key, token_id, batched, batch, index, owner) in self.db.execute(q, params):
+            token = MintedToken(owner, token_id=token_id, batched=batched > 0, minted=True)
+            token.batch = batch
+            token.index = index
+            yield token
+
+
+    def iter_specs(self, contract_address, token_id=None):
+        contract = _contract_key(contract_address)
+        q = 'SELECT batch.token_id, batch.batch, batch.count, batch.cursor, batch.sparse, batch.capped FROM batch JOIN token ON token.contract = batch.contract AND token.token_id = batch.token_id WHERE batch.contract = ?'
+        params = [contract]
+        if token_id != None:
+            q += ' AND batch.token_id = ?'
+            params.append(strip_0x(token_id))
+        q += ' ORDER BY token.position, batch.batch'
+
+        for (token_id, batch, count, cursor, sparse, capped) in self.db.execute(q, params):
+            yield BatchSpec(token_id, batch, TokenSpec(count, cursor, sparse > 0, capped > 0))
+
+
+    def tokens_of(self, contract_address, owner):
+        contract = _contract_key(contract_address)
+        owner = strip_0x(owner).lower()
+        r = self.db.execute('SELECT key FROM mint WHERE contract = ? AND owner = ? ORDER BY key', (contract, owner,))
+        return [v[0] for v in r]
@@ -0,0 +1,168 @@
+# standard imports
+import logging
+from array import array
+
+# external imports
+from hexathon import strip_0x
+
+# local imports
+from .nft import MintedToken
+from .nft import to_batch_key_bytes
+
+logg = logging.getLogger(__name__)
+
+FLAG_MINTED = 0x01
+FLAG_BATCHED = 0x02
+
+KEY_SIZE = 32
+ADDRESS_SIZE = 20
+
+
+class TokenRow:
+    """Read-only view of a row in a TokenTable, usable in place of a MintedToken.
+
+    It does not inherit from MintedToken, which keeps its fields in an instance dict, so that a view holds no more than its table and row.
+    """
+
+    __slots__ = ('table', 'row',)
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+
+    @property
+    def minted(self):
+        return self.table.flags[self.row] & FLAG_MINTED > 0
+
+
+    @property
+    def batched(self):
+        return self.table.flags[self.row] & FLAG_BATCHED > 0
+
+
+    @property
+    def owner(self):
+        return self.table.owner_bytes(self.row).hex()
+
+
+    @property
+    def batch(self):
+        return self.table.batches[self.row]
+
+
+    @property
+    def index(self):
+        return self.table.indices[self.row]
+
+
+    @property
+    def token_id(self):
+        if not self.minted:
+            return None
+        key = self.table.key_bytes(self.row)
+        if self.batched:
+            return key.hex()
+        return key[:24].hex() + self.table.contents[self.row].to_bytes(8, 'big').hex()
+
+
+    def key(self):
+        return self.table.key_bytes(self.row).hex()
+
+
+    to_dict = MintedToken.to_dict
+    __str__ = MintedToken.__str__
+
+
+class TokenTable:
+    """Compact column store of minted tokens.
+
+    Each token takes 79 bytes: its 32 byte key, 20 byte owner, 2 byte batch, 8 byte index, the 8 bytes of token content kept with batch tokens, a flags byte, and its 8 byte row number in the index of its owner. Rows are returned as TokenRow views.
+
+    The tokens of each owner are indexed.
+    """
+
+    def __init__(self):
+        self.keys = bytearray()
+        self.owners = bytearray()
+        self.batches = array('H')
+        self.indices = array('Q')
+        self.contents = array('Q')
+        self.flags = bytearray()
+        self.owner_rows = {}
+
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        table = cls()
+        table.extend(tokens)
+        return table
+
+
+    def __len__(self):
+        return len(self.flags)
+
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        if row < 0 or row >= len(self):
+            raise IndexError(row)
+        return TokenRow(self, row)
+
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TokenRow(self, i)
+
+
+    def key_bytes(self, row):
+        i = row * KEY_SIZE
+        return bytes(self.keys[i:i+KEY_SIZE])
+
+
+    def owner_bytes(self, row):
+        i = row * ADDRESS_SIZE
+        return bytes(self.owners[i:i+ADDRESS_SIZE])
+
+
+    def append(self, token):
+        row = len(self)
+        flags = 0
+        key = bytes(KEY_SIZE)
+        content = 0
+        if token.minted:
+            flags |= FLAG_MINTED
+            if token.batched:
+                flags |= FLAG_BATCHED
+                key = bytes.fromhex(strip_0x(token.token_id))
+            else:
+                token_id = bytes.fromhex(strip_0x(token.token_id))
+                key = to_batch_key_bytes(token_id, token.batch, token.index)
+                content = int.from_bytes(token_id[24:], 'big')
+        owner = bytes.fromhex(strip_0x(token.owner))
+
+        self.keys += key
+        self.owners += owner
+        self.batches.append(token.batch)
+        self.indices.append(token.index)
+        self.contents.append(content)
+        self.flags.append(flags)
+
+        rows = self.owner_rows.get(owner)
+        if rows == None:
+            rows = array('Q')
+            self.owner_rows[owner] = rows
+        rows.append(row)
+        return row
+
+
+    def extend(self, tokens):
+        for token in tokens:
+            self.append(token)
+
+
+    def tokens_of(self, owner):
+        owner = bytes.fromhex(strip_0x(owner))
+        rows = self.owner_rows.get(owner, [])
+        return [TokenRow(self, i) for i in rows]
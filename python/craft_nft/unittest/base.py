@@ -1,24 +1,123 @@
 # standard imports
 import logging
+import threading
+import unittest
 
 # external imports
 from chainlib.eth.unittest.ethtester import EthTesterCase
+from chainlib.eth.unittest.base import TestRPCConnection
+from chainlib.eth.unittest.base import to_ethtester_call
 from chainlib.connection import RPCConnection
+from chainlib.connection import error_parser
 from chainlib.eth.nonce import RPCNonceOracle
 from chainlib.eth.address import to_checksum_address
 from chainlib.eth.tx import receipt
+from hexathon import strip_0x
+from hexathon import add_0x
 
 # local imports
 from craft_nft import CraftNFT
 
 
 logg = logging.getLogger(__name__)
+
+# the eth tester api does not expose storage, so it is read from the state of the py-evm backend, through a private function that other eth tester versions may not have
+try:
+    from eth_tester.backends.pyevm.main import _get_vm_for_block_number
+except ImportError:
+    _get_vm_for_block_number = None
+
+have_storage = _get_vm_for_block_number != None
+
+# skips tests that read contract storage when the test connection cannot serve eth_getStorageAt
+requires_storage = unittest.skipUnless(have_storage, 'contract storage cannot be read, as the installed eth_tester does not expose the state of its py-evm backend')
+
+
+class TestCraftNFTRPCConnection(TestRPCConnection):
+
+    def __init__(self, location, backend, signer):
+        super(TestCraftNFTRPCConnection, self).__init__(location, backend, signer)
+        self.roundtrips = 0
+        self.lock = threading.Lock()
+
+
+    # the eth tester backend is not thread safe
+    def do(self, o, error_parser=error_parser):
+        with self.lock:
+            self.roundtrips += 1
+            if isinstance(o, list):
+                r = []
+                for v in o:
+                    r.append(super(TestCraftNFTRPCConnection, self).do(v, error_parser=error_parser))
+                return r
+            return super(TestCraftNFTRPCConnection, self).do(o, error_parser=error_parser)
+
+
+    def eth_blockNumber(self, p):
+        r = super(TestCraftNFTRPCConnection, self).eth_blockNumber(p)
+        return hex(r)
+
+
+    def block_number(self, height):
+        if isinstance(height, dict):
+            block = self.backend.get_block_by_hash(height['blockHash'])
+            return block['number']
+        if height[:2] == '0x':
+            return int(height, 16)
+        return height
+
+
+    def eth_call(self, p):
+        tx = to_ethtester_call(p[0])
+        height = 'latest'
+        if len(p) > 1:
+            height = p[1]
+        return self.backend.call(tx, self.block_number(height))
+
+
+    def eth_getStorageAt(self, p):
+        if not have_storage:
+            raise NotImplementedError('eth_getStorageAt is not available with the installed eth_tester')
+        height = 'latest'
+        if len(p) > 2:
+            height = p[2]
+        vm = _get_vm_for_block_number(self.backend.backend.chain, self.block_number(height))
+        v = vm.state.get_storage(bytes.fromhex(strip_0x(p[0])), int(p[1], 16))
+        return add_0x(v.to_bytes(32, 'big').hex())
+
+
+    def eth_getLogs(self, p):
+        q = p[0]
+        topics = q.get('topics')
+        if topics != None:
+            for i in range(len(topics)):
+                if isinstance(topics[i], list):
+                    topics[i] = tuple(topics[i])
+            topics = tuple(topics)
+        logs = self.backend.get_logs(
+                from_block=int(q['fromBlock'], 16),
+                to_block=int(q['toBlock'], 16),
+                address=q.get('address'),
+                topics=topics,
+                )
+        r = []
+        for log in logs:
+            r.append({
+                'address': log['address'],
+                'topics': list(log['topics']),
+                'data': log['data'],
+                'blockNumber': hex(log['block_number']),
+                'transactionHash': log['transaction_hash'],
+                'logIndex': hex(log['log_index']),
+                })
+        return r
        
 
 class TestCraftNFT(EthTesterCase):
 
     def setUp(self):
         super(TestCraftNFT, self).setUp()
+        self.rpc = TestCraftNFTRPCConnection(None, self.helper, self.signer)
         nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
         c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
         (tx_hash, o) = c.constructor(self.accounts[0], 'DevBadge', 'DEV')
@@ -20,6 +20,9 @@ fi
 pip install -r requirements.txt
 pip install -r test_requirements.txt
 
+# regenerate the contract artifact module in case the contract build files have changed
+python -m craft_nft.build
+
 if [ "$venv" -eq "1" ]; then
 	deactivate
 fi
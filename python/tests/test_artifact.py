@@ -0,0 +1,55 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.hash import keccak256_string_to_hex
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft import artifact
+from craft_nft.build import render_files
+from craft_nft.build import datadir
+from craft_nft.build import ARTIFACT_FILE
+from craft_nft.calldata import method_selector
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+
+class TestArtifact(unittest.TestCase):
+
+    def test_artifact_current(self):
+        s = render_files(os.path.join(datadir, 'CraftNFT.json'), os.path.join(datadir, 'CraftNFT.bin'))
+        f = open(ARTIFACT_FILE, 'r')
+        r = f.read()
+        f.close()
+        self.assertEqual(r, s, 'artifact module is out of date, run python -m craft_nft.build')
+
+
+    def test_artifact_abi(self):
+        n = 0
+        for entry in CraftNFT.abi():
+            if entry['type'] not in ['function', 'event']:
+                continue
+            signature = '{}({})'.format(entry['name'], ','.join([v['type'] for v in entry['inputs']]))
+            h = keccak256_string_to_hex(signature)
+            if entry['type'] == 'function':
+                self.assertEqual(artifact.SELECTORS[signature], h[:8])
+                self.assertEqual(method_selector(signature), h[:8])
+            else:
+                self.assertEqual(artifact.TOPICS[signature], h)
+            n += 1
+        self.assertEqual(n, len(artifact.SELECTORS) + len(artifact.TOPICS))
+
+
+    def test_bytecode(self):
+        f = open(os.path.join(datadir, 'CraftNFT.bin'), 'r')
+        r = f.read()
+        f.close()
+        self.assertEqual(CraftNFT.bytecode(), r.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
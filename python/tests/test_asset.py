@@ -0,0 +1,183 @@
+# standard imports
+import os
+import io
+import hashlib
+import unittest
+import logging
+import tempfile
+import shutil
+import contextlib
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.cli.config import Config
+from chainlib.settings import ChainSettings
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.sign import AllocationEntry
+from craft_nft.sign import read_plan
+from craft_nft.asset import file_digest
+from craft_nft.asset import iter_asset_paths
+from craft_nft.asset import read_asset_list
+from craft_nft.asset import hash_files
+from craft_nft.asset import asset_allocations
+from craft_nft.asset import is_allocated
+from craft_nft.asset import write_asset_manifest
+from craft_nft.runnable.allocate import allocate_assets
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+
+class TestAsset(TestCraftNFT):
+
+    def setUp(self):
+        super(TestAsset, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        self.d = tempfile.mkdtemp()
+        self.contents = {
+            'b.txt': b'foo',
+            'a.txt': b'bar',
+            'sub/c.bin': os.urandom(1 << 20),
+            'sub/deeper/d.txt': b'baz',
+            'empty': b'',
+            'copy.txt': b'foo',
+            }
+        for (k, v) in self.contents.items():
+            path = os.path.join(self.d, k)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            f = open(path, 'wb')
+            f.write(v)
+            f.close()
+
+
+    def tearDown(self):
+        shutil.rmtree(self.d)
+        super(TestAsset, self).tearDown()
+
+
+    def path(self, k):
+        return os.path.join(self.d, k)
+
+
+    def test_digest(self):
+        for (k, v) in self.contents.items():
+            self.assertEqual(file_digest(self.path(k)), hashlib.sha256(v).hexdigest())
+
+
+    def test_paths(self):
+        r = list(iter_asset_paths([self.d, self.path('a.txt')]))
+        expect = ['a.txt', 'b.txt', 'copy.txt', 'empty', 'sub/c.bin', 'sub/deeper/d.txt', 'a.txt']
+        self.assertEqual(r, [self.path(v) for v in expect])
+
+        f = io.StringIO(self.path('sub/deeper') + '\n\n# comment\n' + self.path('empty') + '\n')
+        r = list(iter_asset_paths(read_asset_list(f)))
+        self.assertEqual(r, [self.path('sub/deeper/d.txt'), self.path('empty')])
+
+        with self.assertRaises(FileNotFoundError):
+            list(iter_asset_paths([self.path('nonexistent')]))
+
+
+    def test_hash_files(self):
+        paths = list(iter_asset_paths([self.d]))
+        expect = [(v, hashlib.sha256(open(v, 'rb').read()).hexdigest()) for v in paths]
+        for workers in [1, 3]:
+            r = list(hash_files(iter(paths), workers=workers))
+            self.assertEqual(r, expect)
+
+
+    def test_allocate(self):
+        digests = hash_files(iter_asset_paths([self.d]), workers=2)
+        entries = list(asset_allocations(digests, amount=3))
+        # copy.txt has the contents of b.txt
+        self.assertEqual(len(entries), 5)
+        self.assertEqual([v.line for v in entries], list(range(1, 6)))
+        self.assertEqual(entries[1].path, self.path('b.txt'))
+
+        w = io.StringIO()
+        for entry in entries:
+            write_asset_manifest(w, entry)
+        r = list(read_plan(io.StringIO(w.getvalue())))
+        self.assertIsInstance(r[0], AllocationEntry)
+        self.assertEqual([v.to_dict() for v in r], [v.to_dict() for v in entries])
+
+        for entry in entries:
+            (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], entry.token_id, entry.amount)
+            self.rpc.do(o)
+        r = self.rpc.wait(tx_hash_hex)
+        self.assertEqual(r['status'], 1)
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        self.assertEqual(list(scanner.token_ids()), [v.token_id for v in entries])
+        spec = scanner.token_specs(entries[0].token_id)[0]
+        self.assertEqual(spec.count, 3)
+        scanner.close()
+
+
+    def test_allocate_skip(self):
+        digests = list(hash_files(iter_asset_paths([self.d]), workers=1))
+        entries = list(asset_allocations(digests[:3]))
+        for entry in entries:
+            (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], entry.token_id, entry.amount)
+            self.rpc.do(o)
+        self.assertTrue(is_allocated(self.c, self.rpc, self.address, entries[0].token_id, sender_address=self.accounts[0]))
+
+        # the assets allocated in an earlier run are skipped, and the lines continue after it
+        allocated = lambda v: is_allocated(self.c, self.rpc, self.address, v, sender_address=self.accounts[0])
+        r = list(asset_allocations(digests, allocated=allocated, line=len(entries)))
+        self.assertEqual([v.line for v in r], [3, 4, 5])
+        self.assertEqual([v.path for v in r], [self.path('empty'), self.path('sub/c.bin'), self.path('sub/deeper/d.txt')])
+
+
+    def allocate_assets(self, manifest, send):
+        config = Config()
+        config.add([self.path('sub')], '_ASSETS', False)
+        config.add(None, '_ASSET_LIST', False)
+        config.add(manifest, '_MANIFEST', False)
+        config.add(1, '_WORKERS', False)
+        config.add(0, '_TOKEN_COUNT', False)
+        config.add(send, '_RPC_SEND', False)
+        config.add(send, '_WAIT', False)
+
+        settings = ChainSettings()
+        settings.set('CHAIN_SPEC', self.chain_spec)
+        settings.set('SIGNER', self.signer)
+        settings.set('NONCE_ORACLE', RPCNonceOracle(self.accounts[0], self.rpc))
+        settings.set('EXEC', self.address)
+        settings.set('SENDER_ADDRESS', self.accounts[0])
+        settings.set('CONN', self.rpc)
+
+        w = io.StringIO()
+        with contextlib.redirect_stdout(w):
+            allocate_assets(config, settings)
+        return w.getvalue().splitlines()
+
+
+    def test_allocate_assets_dry_run(self):
+        manifest = self.path('manifest')
+
+        # a run that does not send does not record the assets as allocated
+        r = self.allocate_assets(manifest, False)
+        self.assertEqual(len(r), 2)
+        self.assertFalse(os.path.exists(manifest))
+
+        r = self.allocate_assets(manifest, True)
+        self.assertEqual(len(r), 2)
+        f = open(manifest, 'r')
+        entries = list(read_plan(f))
+        f.close()
+        self.assertEqual([v.path for v in entries], [self.path('sub/c.bin'), self.path('sub/deeper/d.txt')])
+        for v in entries:
+            self.assertTrue(is_allocated(self.c, self.rpc, self.address, v.token_id, sender_address=self.accounts[0]))
+
+        r = self.allocate_assets(manifest, True)
+        self.assertEqual(r, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
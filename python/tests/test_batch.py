@@ -0,0 +1,179 @@
+# standard imports
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.nft import TokenSpec
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.stats import StatsConnection
+from craft_nft.batch import BatchTracker
+from craft_nft.batch import batch_available
+from craft_nft.batch import BatchIndex
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+hash_of_baz = 'baa5a0964d3320fbc0c6a922140453c8513ea24ab8fd0577034804a967248096'
+
+
+class TestBatch(TestCraftNFT):
+
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+        self.conn = StatsConnection(self.rpc)
+
+
+    def allocate(self, token_id, amount=0):
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], token_id, amount=amount)
+        self.rpc.do(o)
+
+
+    def mint(self, tracker, index=None):
+        batch = tracker.select()
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[1], tracker.token_id, batch, index=index)
+        self.rpc.do(o)
+        r = self.rpc.wait(tx_hash_hex)
+        self.assertEqual(r['status'], 1)
+        tracker.issue(batch, index=index)
+        return batch
+
+
+    def calls(self):
+        return self.conn.stats.to_dict()['roundtrips']
+
+
+    def test_available(self):
+        self.assertTrue(batch_available(TokenSpec(0, 0, False, True), 0))
+        self.assertFalse(batch_available(TokenSpec(0, 1, False, True), 0))
+        self.assertTrue(batch_available(TokenSpec(2, 1, False, True), 1))
+        self.assertFalse(batch_available(TokenSpec(2, 2, False, True), 1))
+        self.assertFalse(batch_available(TokenSpec(2, 0, True, True), 1))
+        self.assertTrue(batch_available(TokenSpec(7, 7, False, False), 1))
+
+
+    def test_select(self):
+        for amount in [2, 1, 3]:
+            self.allocate(hash_of_foo, amount=amount)
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+
+        r = [self.mint(tracker) for i in range(6)]
+        self.assertEqual(r, [0, 0, 1, 2, 2, 2])
+        calls = self.calls()
+
+        # all batches have run out, so the batches allocated since are fetched
+        self.assertIsNone(tracker.select())
+        self.assertGreater(self.calls(), calls)
+        self.allocate(hash_of_foo, amount=1)
+        self.assertEqual(self.mint(tracker), 3)
+        self.assertIsNone(tracker.select())
+
+
+    def test_select_no_reads(self):
+        for amount in [3, 4]:
+            self.allocate(hash_of_foo, amount=amount)
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+        self.assertEqual(tracker.select(), 0)
+        calls = self.calls()
+
+        r = [self.mint(tracker) for i in range(7)]
+        self.assertEqual(r, [0, 0, 0, 1, 1, 1, 1])
+        self.assertEqual(self.calls(), calls)
+
+
+    def test_unique_and_unbounded(self):
+        self.allocate(hash_of_bar)
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_bar, sender_address=self.accounts[0])
+        self.assertEqual(self.mint(tracker), 0)
+        self.assertIsNone(tracker.select())
+
+        self.allocate(hash_of_foo, amount=-1)
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+        r = [self.mint(tracker) for i in range(3)]
+        self.assertEqual(r, [0, 0, 0])
+        self.assertEqual(tracker.specs[0].count, 3)
+
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_baz, sender_address=self.accounts[0])
+        self.assertIsNone(tracker.select())
+
+
+    def test_invalidate(self):
+        for amount in [3, 2]:
+            self.allocate(hash_of_foo, amount=amount)
+        tracker = BatchTracker(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+        self.assertEqual(self.mint(tracker, index=0), 0)
+
+        # a mint made elsewhere is not seen until the specs are read again
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 0)
+        self.rpc.do(o)
+        self.assertEqual(tracker.select(), 0)
+        tracker.invalidate()
+        self.assertEqual(tracker.select(), 0)
+        self.assertEqual(tracker.specs[0].cursor, 2)
+
+        self.assertEqual(self.mint(tracker), 0)
+        self.assertEqual(tracker.select(), 1)
+
+        # an exact mint out of sequence makes the batch sparse
+        self.assertEqual(self.mint(tracker, index=1), 1)
+        self.assertTrue(tracker.specs[1].sparse)
+        self.assertIsNone(tracker.select())
+
+
+    def test_index(self):
+        for amount in [3, 1, 4]:
+            self.allocate(hash_of_foo, amount=amount)
+        idx = BatchIndex(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+        r = idx.batches_of(range(8))
+        self.assertEqual(r, [0, 0, 0, 1, 2, 2, 2, 2])
+        calls = self.calls()
+        r = idx.batches_of(reversed(range(8)))
+        self.assertEqual(r, [2, 2, 2, 2, 1, 0, 0, 0])
+        self.assertEqual(self.calls(), calls)
+
+        with self.assertRaises(ValueError):
+            idx.batch_of(8)
+        with self.assertRaises(ValueError):
+            idx.batch_of(-1)
+
+        # batches allocated since are read when looked up
+        self.allocate(hash_of_foo, amount=2)
+        self.assertEqual(idx.batch_of(9), 3)
+        self.assertEqual(len(idx.specs), 4)
+
+        self.allocate(hash_of_bar)
+        idx = BatchIndex(self.c, self.conn, self.address, hash_of_bar, sender_address=self.accounts[0])
+        with self.assertRaises(ValueError):
+            idx.batch_of(0)
+
+
+    def test_index_unbounded(self):
+        self.allocate(hash_of_foo, amount=-1)
+        tracker = BatchTracker(self.c, self.rpc, self.address, hash_of_foo, sender_address=self.accounts[0])
+        self.mint(tracker)
+        self.allocate(hash_of_foo, amount=2)
+
+        idx = BatchIndex(self.c, self.conn, self.address, hash_of_foo, sender_address=self.accounts[0])
+        self.assertEqual(idx.batches_of(range(3)), [0, 1, 1])
+
+        # the unbounded batch grows, and moves the batch after it
+        tracker.invalidate()
+        self.mint(tracker)
+        self.assertEqual(idx.batches_of(range(4)), [0, 0, 1, 1])
+
+        c = CraftNFT(self.chain_spec)
+        for i in range(2):
+            r = [c.batch_of(self.conn, self.address, hash_of_foo, v, sender_address=self.accounts[0]) for v in range(4)]
+            self.assertEqual(r, [0, 0, 1, 1])
+        self.assertEqual(len(c.batch_indices), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+# standard imports
+import io
+import json
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.tx import raw
+from chainlib.error import RPCException
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.bulk import BulkMinter
+from craft_nft.bulk import read_manifest
+from craft_nft.bulk import read_results
+from craft_nft.bulk import tx_nonce
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class FailingConnection:
+    """Passes calls on to conn, but fails to send any transaction after the first count.
+    """
+
+    def __init__(self, conn, count):
+        self.conn = conn
+        self.count = count
+
+
+    def do(self, o):
+        if o['method'] == 'eth_sendRawTransaction':
+            if self.count == 0:
+                raise RPCException('connection lost')
+            self.count -= 1
+        return self.conn.do(o)
+
+
+    def wait(self, tx_hash_hex):
+        return self.conn.wait(tx_hash_hex)
+
+
+class TestBulk(TestCraftNFT):
+
+    def setUp(self):
+        super(TestBulk, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=2)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+
+    def minted(self):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        r = list(scanner.minted())
+        scanner.close()
+        return r
+
+
+    def test_read_manifest(self):
+        f = io.StringIO('recipient,batch,token_id\n' + self.accounts[1] + ',1,' + hash_of_foo + '\n\n# comment\n' + strip_0x(self.accounts[2]).lower() + ',,\n')
+        r = list(read_manifest(f, token_id=hash_of_bar))
+        self.assertEqual(len(r), 2)
+        self.assertEqual(r[0].line, 2)
+        self.assertEqual(r[0].batch, 1)
+        self.assertEqual(r[0].token_id, hash_of_foo)
+        self.assertEqual(r[1].line, 5)
+        self.assertEqual(r[1].recipient, self.accounts[2])
+        self.assertEqual(r[1].token_id, hash_of_bar)
+        self.assertIsNone(r[1].batch)
+
+        f = io.StringIO(self.accounts[1] + ',' + hash_of_foo + ',1,2\n{"recipient": "' + self.accounts[2] + '", "token_id": "' + hash_of_bar + '"}\n')
+        r = list(read_manifest(f))
+        self.assertEqual(r[0].index, 2)
+        self.assertEqual(r[1].token_id, hash_of_bar)
+
+        f = io.StringIO(self.accounts[1] + ',' + hash_of_foo + ',,2\n')
+        with self.assertRaises(ValueError):
+            list(read_manifest(f))
+
+        f = io.StringIO(self.accounts[1] + '\n')
+        with self.assertRaises(ValueError):
+            list(read_manifest(f))
+
+
+    def test_mint_all(self):
+        lines = []
+        for i in range(5):
+            lines.append('{},{}'.format(self.accounts[i % 3 + 1], hash_of_foo))
+        lines.append('{},{},1,2'.format(self.accounts[4], hash_of_foo))
+        lines.append('{},{}'.format(self.accounts[4], hash_of_foo))
+        entries = read_manifest(io.StringIO('\n'.join(lines)))
+
+        w = io.StringIO()
+        minter = BulkMinter(self.c, self.rpc, self.address, self.accounts[0], in_flight=2, w=w)
+        with self.assertRaises(ValueError):
+            minter.mint_all(entries)
+
+        results = [json.loads(v) for v in w.getvalue().split('\n') if len(v) > 0]
+        success = [v for v in results if v['status'] == 'success']
+        self.assertEqual([v['batch'] for v in success], [0, 0, 1, 1, 1])
+        nonces = [v['nonce'] for v in results if v['status'] == 'sent']
+        self.assertEqual(nonces, list(range(nonces[0], nonces[0] + 6)))
+        revert = [v for v in results if v['status'] == 'revert']
+        self.assertEqual(len(revert), 1)
+        self.assertEqual(revert[0]['line'], 6)
+        self.assertEqual(results[-1]['status'], 'error')
+        self.assertEqual(results[-1]['line'], 7)
+
+        # resume, with a new entry in place of the one that could not be minted, and the reverted one retried
+        lines[6] = '{},{}'.format(self.accounts[4], hash_of_bar)
+        skip = read_results(io.StringIO(w.getvalue()))
+        self.assertEqual(skip, set(range(1, 6)))
+        entries = read_manifest(io.StringIO('\n'.join(lines)))
+        w = io.StringIO()
+        minter = BulkMinter(self.c, self.rpc, self.address, self.accounts[0], in_flight=4, w=w)
+        self.assertEqual(minter.mint_all(entries, skip=skip), 2)
+        results = [json.loads(v) for v in w.getvalue().split('\n') if len(v) > 0]
+        self.assertEqual([(v['line'], v['status']) for v in results if v['status'] != 'sent'], [(6, 'revert'), (7, 'success')])
+
+        r = self.minted()
+        self.assertEqual(len(r), 6)
+        self.assertEqual(r[4].index, 2)
+        self.assertEqual(r[4].owner, strip_0x(self.accounts[2]).lower())
+        self.assertEqual(r[5].token_id, hash_of_bar)
+        self.assertEqual(r[5].owner, strip_0x(self.accounts[4]).lower())
+
+
+    def test_sign_only(self):
+        entries = read_manifest(io.StringIO('{},{}\n{},{},1,2\n'.format(self.accounts[1], hash_of_foo, self.accounts[2], hash_of_foo)))
+        w = io.StringIO()
+        minter = BulkMinter(self.c, self.rpc, self.address, self.accounts[0], send=False, w=w)
+        self.assertEqual(minter.mint_all(entries), 2)
+
+        results = [json.loads(v) for v in w.getvalue().split('\n') if len(v) > 0]
+        self.assertEqual([v['status'] for v in results], ['signed', 'signed'])
+        self.assertEqual(tx_nonce(results[1]['tx']), results[0]['nonce'] + 1)
+        self.assertEqual(len(self.minted()), 0)
+        self.assertEqual(read_results(io.StringIO(w.getvalue())), set())
+
+
+    def test_sign_only_batches(self):
+        # more entries than the first batch holds, none of which are sent
+        lines = ['{},{}'.format(self.accounts[i % 3 + 1], hash_of_foo) for i in range(5)]
+        entries = read_manifest(io.StringIO('\n'.join(lines)))
+        w = io.StringIO()
+        minter = BulkMinter(self.c, self.rpc, self.address, self.accounts[0], send=False, w=w)
+        self.assertEqual(minter.mint_all(entries), 5)
+
+        results = [json.loads(v) for v in w.getvalue().split('\n') if len(v) > 0]
+        self.assertEqual([v['batch'] for v in results], [0, 0, 1, 1, 1])
+
+        # all of them can be minted when broadcast
+        for v in results:
+            self.rpc.do(raw(v['tx']))
+        for v in results:
+            r = self.rpc.wait(v['tx_hash'])
+            self.assertEqual(r['status'], 1)
+        self.assertEqual(len(self.minted()), 5)
+
+
+    def test_send_error(self):
+        lines = ['{},{}'.format(self.accounts[i % 3 + 1], hash_of_foo) for i in range(4)]
+        entries = read_manifest(io.StringIO('\n'.join(lines)))
+        w = io.StringIO()
+        conn = FailingConnection(self.rpc, 2)
+        minter = BulkMinter(self.c, conn, self.address, self.accounts[0], in_flight=4, w=w)
+        with self.assertRaises(RPCException):
+            minter.mint_all(entries)
+
+        # the mints sent before the error are confirmed
+        results = [json.loads(v) for v in w.getvalue().split('\n') if len(v) > 0]
+        self.assertEqual([(v['line'], v['status']) for v in results if v['status'] != 'sent'], [(3, 'error'), (1, 'success'), (2, 'success')])
+        self.assertEqual(read_results(io.StringIO(w.getvalue())), set([1, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# standard imports
+import os
+import unittest
+import logging
+import tempfile
+import shutil
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.unittest import requires_storage
+from craft_nft.cache import CachingConnection
+from craft_nft.cache import call_key
+from craft_nft.snapshot import Snapshot
+from craft_nft.scan import Scanner
+from craft_nft.storage import get_token_spec
+from craft_nft.storage import parse_token_spec_word
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestCache(TestCraftNFT):
+
+    def setUp(self):
+        super(TestCache, self).setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+        for i in range(3):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        super(TestCache, self).tearDown()
+
+
+    def test_cache_latest(self):
+        conn = CachingConnection(self.rpc, ttl=3600)
+        o = self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0])
+        self.rpc.roundtrips = 0
+        r = conn.do(o)
+        r = conn.do(o)
+        self.assertEqual(self.rpc.roundtrips, 1)
+        self.assertEqual(conn.hits, 1)
+        self.assertEqual(self.c.parse_token_spec(r).cursor, 3)
+
+        conn = CachingConnection(self.rpc, ttl=0)
+        self.rpc.roundtrips = 0
+        r = conn.do(o)
+        r = conn.do(o)
+        self.assertEqual(self.rpc.roundtrips, 2)
+
+
+    @requires_storage
+    def test_cache_storage(self):
+        conn = CachingConnection(self.rpc, ttl=3600)
+        o = get_token_spec(self.address, hash_of_foo, 0)
+        self.rpc.roundtrips = 0
+        r = conn.do(o)
+        r = conn.do(o)
+        self.assertEqual(self.rpc.roundtrips, 1)
+        self.assertEqual(parse_token_spec_word(r).cursor, 3)
+
+        o = get_token_spec(self.address, hash_of_foo, 0, height=1)
+        (key, pinned) = call_key(o)
+        self.assertTrue(pinned)
+        self.assertTrue(key.startswith('storage:'))
+
+
+    def test_cache_lru(self):
+        conn = CachingConnection(self.rpc, size=2)
+        reqs = []
+        for i in range(3):
+            reqs.append(self.c.token_at(self.address, i % 2, sender_address=self.accounts[0]))
+        reqs.append(self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0]))
+
+        self.rpc.roundtrips = 0
+        r = conn.do(reqs)
+        self.assertEqual(self.rpc.roundtrips, 1)
+        self.assertEqual(r, [self.rpc.do(v) for v in reqs])
+
+        # token_at 1 is the least recently used, and has been evicted
+        self.rpc.roundtrips = 0
+        conn.do(reqs[0])
+        conn.do(reqs[3])
+        self.assertEqual(self.rpc.roundtrips, 0)
+        conn.do(reqs[1])
+        self.assertEqual(self.rpc.roundtrips, 1)
+
+
+    def test_cache_pinned_disk(self):
+        path = os.path.join(self.cache_dir, 'cache.sqlite')
+        snapshot = Snapshot(self.c, self.rpc)
+        conn = CachingConnection(self.rpc, path=path)
+        scanner = Scanner(snapshot, conn, self.address, sender_address=self.accounts[0], batch_size=4)
+        expect = [str(v) for v in scanner.minted()]
+        conn.close()
+
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_foo, 0)
+        self.rpc.do(o)
+
+        conn = CachingConnection(self.rpc, path=path)
+        scanner = Scanner(snapshot, conn, self.address, sender_address=self.accounts[0], batch_size=4)
+        self.rpc.roundtrips = 0
+        r = [str(v) for v in scanner.minted()]
+        self.assertEqual(r, expect)
+        self.assertEqual(len(r), 3)
+
+        # only failed queries, at the end of lists, are not cached
+        self.assertEqual(self.rpc.roundtrips, conn.misses)
+        self.assertLess(conn.misses, conn.hits)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
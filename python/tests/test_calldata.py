@@ -0,0 +1,70 @@
+# standard imports
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.contract import ABIContractEncoder
+from chainlib.eth.contract import ABIContractType
+
+# local imports
+from craft_nft.calldata import calldata
+from craft_nft.calldata import word_uint
+from craft_nft.calldata import word_bytes32
+from craft_nft.calldata import word_address
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+address = '0x2B5AD5c4795c026514f8317c7a215E218DcCD6cF'
+
+
+class TestCalldata(unittest.TestCase):
+
+    def test_words(self):
+        for v in [hash_of_foo, '0x' + hash_of_foo, 'abc', '0x01', 'ff' * 32]:
+            enc = ABIContractEncoder()
+            enc.method('foo')
+            enc.typ(ABIContractType.BYTES32)
+            enc.bytes32(v)
+            self.assertEqual(calldata('foo(bytes32)', word_bytes32(v)), enc.get())
+
+        for v in [0, 1, 2**16-1, 2**48-1, 2**256-1]:
+            enc = ABIContractEncoder()
+            enc.method('foo')
+            enc.typ(ABIContractType.UINT256)
+            enc.uint256(v)
+            self.assertEqual(calldata('foo(uint256)', word_uint(v)), enc.get())
+
+        for v in [address, address[2:], address.lower()]:
+            enc = ABIContractEncoder()
+            enc.method('foo')
+            enc.typ(ABIContractType.ADDRESS)
+            enc.address(v)
+            self.assertEqual(calldata('foo(address)', word_address(v)), enc.get())
+
+        with self.assertRaises(ValueError):
+            word_bytes32(hash_of_foo + '00')
+        with self.assertRaises(ValueError):
+            word_address(address + '00')
+        with self.assertRaises(OverflowError):
+            word_uint(2**256)
+
+
+    def test_method(self):
+        enc = ABIContractEncoder()
+        enc.method('mintExactFromBatchTo')
+        enc.typ(ABIContractType.ADDRESS)
+        enc.typ(ABIContractType.BYTES32)
+        enc.typ(ABIContractType.UINT16)
+        enc.typ_literal('uint48')
+        enc.address(address)
+        enc.bytes32(hash_of_foo)
+        enc.uintn(3, 16)
+        enc.uintn(666, 48)
+        r = calldata('mintExactFromBatchTo(address,bytes32,uint16,uint48)', word_address(address), word_bytes32(hash_of_foo), word_uint(3), word_uint(666))
+        self.assertEqual(r, enc.get())
+
+
+if __name__ == '__main__':
+    unittest.main()
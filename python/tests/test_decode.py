@@ -0,0 +1,122 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.nft import to_batch_key
+from craft_nft.rpc import batch_results
+from craft_nft.decode import decode_tokens
+from craft_nft.decode import parse_tokens
+from craft_nft.decode import parse_token_specs
+from craft_nft import decode
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestDecode(TestCraftNFT):
+
+    def setUp(self):
+        super(TestDecode, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=-1)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(3):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_foo, 0, index=4)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+
+        self.token_ids = [hash_of_bar]
+        for i in range(6):
+            self.token_ids.append(to_batch_key(hash_of_foo, 0, i))
+        self.token_ids.append(to_batch_key(hash_of_foo, 1, 0))
+        reqs = [self.c.get_token(self.address, v, sender_address=self.accounts[0]) for v in self.token_ids]
+        self.token_results = list(batch_results(self.rpc, reqs))
+
+        reqs = [
+            self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0]),
+            self.c.get_token_spec(self.address, hash_of_foo, 1, sender_address=self.accounts[0]),
+            self.c.get_token_spec(self.address, hash_of_bar, 0, sender_address=self.accounts[0]),
+            ]
+        self.spec_results = list(batch_results(self.rpc, reqs))
+
+
+    def check_tokens(self, use_numpy):
+        expect = []
+        for (v, r) in zip(self.token_ids, self.token_results):
+            expect.append(self.c.parse_token(r, v).__dict__)
+
+        r = parse_tokens(self.token_results, self.token_ids, use_numpy=use_numpy)
+        self.assertEqual([v.__dict__ for v in r], expect)
+        self.assertEqual(sum([int(v.minted) for v in r]), 6)
+
+        b = b''.join([bytes.fromhex(v[2:]) for v in self.token_results])
+        r = parse_tokens(b, self.token_ids, use_numpy=use_numpy)
+        self.assertEqual([v.__dict__ for v in r], expect)
+
+        # empty results, as returned by an address without the contract, are not unminted tokens
+        with self.assertRaises(ValueError):
+            decode_tokens(['0x'], use_numpy=use_numpy)
+        with self.assertRaises(ValueError):
+            parse_tokens(self.token_results[:1] + ['0x'], self.token_ids[:2], use_numpy=use_numpy)
+
+
+    def check_specs(self, use_numpy):
+        expect = []
+        for r in self.spec_results:
+            expect.append(self.c.parse_token_spec(r).__dict__)
+        r = parse_token_specs(self.spec_results, use_numpy=use_numpy)
+        self.assertEqual([v.__dict__ for v in r], expect)
+        self.assertTrue(r[0].sparse)
+        self.assertFalse(r[1].capped)
+
+        # results without the capped word
+        r = parse_token_specs([v[:194] for v in self.spec_results], use_numpy=use_numpy)
+        self.assertEqual(r[0].__dict__, expect[0])
+        self.assertTrue(r[1].capped)
+
+        with self.assertRaises(ValueError):
+            parse_token_specs(['0x'], use_numpy=use_numpy)
+
+
+    def test_decode_python(self):
+        self.check_tokens(False)
+        self.check_specs(False)
+        d = decode_tokens(self.token_results, use_numpy=False)
+        self.assertEqual(d['single'][:2], [True, False])
+
+
+    @unittest.skipIf(not decode.have_numpy(), 'numpy not installed')
+    def test_decode_numpy(self):
+        self.check_tokens(True)
+        self.check_specs(True)
+        d = decode_tokens(self.token_results)
+        self.assertEqual(list(d['single'][:2]), [True, False])
+        self.assertEqual(d['owner'].shape, (len(self.token_ids), 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
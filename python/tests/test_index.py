@@ -0,0 +1,113 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.address import is_same_address
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.index import TokenIndex
+from craft_nft.nft import to_batch_key
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+hash_of_baz = 'baa5a0964d3320fbc0c6a922140453c8513ea24ab8fd0577034804a967248096'
+
+
+class TestIndex(TestCraftNFT):
+
+    def setUp(self):
+        super(TestIndex, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(4):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=2)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+
+
+    def test_index(self):
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address, chunk_size=3)
+
+        self.assertEqual(idx.token_ids(), [hash_of_foo, hash_of_bar])
+        self.assertEqual(len(idx.specs[hash_of_foo]), 2)
+        spec = idx.specs[hash_of_foo][0]
+        self.assertEqual(spec.cursor, 4)
+        self.assertFalse(spec.sparse)
+        spec = idx.specs[hash_of_foo][1]
+        self.assertEqual(spec.count, 3)
+        self.assertEqual(spec.cursor, 1)
+        self.assertTrue(spec.sparse)
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        expect = [str(v) for v in scanner.minted()]
+        r = [str(v) for v in idx.minted()]
+        self.assertEqual(r, expect)
+
+
+    def test_index_zero_suffix(self):
+        # the key of the first token of the batch is the token id itself
+        token_id = hash_of_baz[:48] + '00' * 8
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], token_id, amount=3)
+        self.rpc.do(o)
+        for i in range(2):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], token_id, 0)
+            self.rpc.do(o)
+            r = self.rpc.wait(tx_hash_hex)
+            self.assertEqual(r['status'], 1)
+
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address)
+        r = list(idx.minted(token_id=token_id))
+        self.assertEqual([(v.batched, v.batch, v.index) for v in r], [(False, 0, 0), (False, 0, 1)])
+        self.assertEqual(r[0].key(), token_id)
+        self.assertEqual(idx.specs[token_id][0].cursor, 2)
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        expect = [str(v) for v in scanner.minted(token_id=token_id)]
+        scanner.close()
+        self.assertEqual([str(v) for v in r], expect)
+
+
+    def test_index_transfer(self):
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address)
+
+        key = to_batch_key(hash_of_foo, 0, 1)
+        nonce_oracle = RPCNonceOracle(self.accounts[2], self.rpc)
+        c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+        (tx_hash_hex, o) = c.transfer_from(self.address, self.accounts[2], self.accounts[2], self.accounts[5], int(key, 16))
+        self.rpc.do(o)
+
+        self.assertEqual(len(idx.tokens_of(self.accounts[2])), 2)
+
+        idx.sync(self.rpc, self.address)
+        self.assertEqual(len(idx.tokens_of(self.accounts[2])), 1)
+        self.assertEqual(idx.tokens_of(self.accounts[5]), [key])
+        self.assertTrue(is_same_address(idx.mints[key].owner, self.accounts[5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# standard imports
+import unittest
+import logging
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.nft import to_batch_key
+from craft_nft.nft import to_batch_key_bytes
+from craft_nft.nft import batch_keys
+from craft_nft.nft import parse_token_word
+from craft_nft.calldata import word_bytes32
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+owner = 'eb3907ecad74a0013c259d5874ae7f22dcbcc95c'
+
+
+class TestKeys(unittest.TestCase):
+
+    def test_key_bytes(self):
+        token_id = bytes.fromhex(hash_of_foo)
+        for (batch, index) in [(0, 0), (1, 42), (2**16-1, 2**48-1)]:
+            expect = to_batch_key(hash_of_foo, batch, index)
+            self.assertEqual(to_batch_key_bytes(token_id, batch, index).hex(), expect)
+            self.assertEqual(to_batch_key_bytes(memoryview(token_id), batch, index).hex(), expect)
+
+        with self.assertRaises(ValueError):
+            to_batch_key_bytes(token_id[:31], 0, 0)
+        with self.assertRaises(OverflowError):
+            to_batch_key_bytes(token_id, 0, 2**48)
+
+
+    def test_batch_keys(self):
+        token_id = bytearray.fromhex(hash_of_foo)
+        r = list(batch_keys(token_id, 3, range(10, 20)))
+        self.assertEqual(len(r), 10)
+        for (i, key) in enumerate(r):
+            self.assertEqual(key.hex(), to_batch_key(hash_of_foo, 3, 10 + i))
+
+        with self.assertRaises(OverflowError):
+            list(batch_keys(token_id, 2**16, [0]))
+        with self.assertRaises(OverflowError):
+            list(batch_keys(token_id, 0, [2**48]))
+
+
+    def test_parse_word(self):
+        c = CraftNFT(None)
+        key = to_batch_key_bytes(bytes.fromhex(hash_of_foo), 1, 2)
+        values = [
+            '00' * 32,
+            '80' + hash_of_foo[48:] + '000000' + owner,
+            'c0' + '00' * 11 + owner,
+            ]
+        for v in values:
+            expect = c.parse_token(v, key.hex())
+            r = parse_token_word(bytes.fromhex(v), key)
+            self.assertEqual(r.minted, expect.minted)
+            self.assertEqual(r.batched, expect.batched)
+            self.assertEqual(r.token_id, expect.token_id)
+            self.assertEqual(r.owner, expect.owner)
+            self.assertEqual(r.batch, expect.batch)
+            self.assertEqual(r.index, expect.index)
+
+
+    def test_word_bytes(self):
+        key = bytes.fromhex(hash_of_foo)
+        self.assertEqual(word_bytes32(key), hash_of_foo)
+        self.assertEqual(word_bytes32(memoryview(key)), hash_of_foo)
+        self.assertEqual(word_bytes32(b'\x01'), word_bytes32('01'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# standard imports
+import os
+import unittest
+import logging
+import itertools
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.error import JSONRPCException
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.nft import to_batch_key
+from craft_nft.rpc import batch_results
+from craft_nft.rpc import find_length
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestRPC(TestCraftNFT):
+
+    def setUp(self):
+        super(TestRPC, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(4):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+
+
+    def test_batch_results(self):
+        reqs = (self.c.token_at(self.address, i, sender_address=self.accounts[0]) for i in itertools.count())
+        self.rpc.roundtrips = 0
+        r = list(batch_results(self.rpc, reqs, batch_size=2, until_error=True))
+        self.assertEqual(len(r), 3)
+        self.assertEqual(strip_0x(r[0]), hash_of_foo)
+        self.assertEqual(strip_0x(r[1]), hash_of_foo)
+        self.assertEqual(strip_0x(r[2]), hash_of_bar)
+
+        # 1 batch with two results, 1 failed batch, 1 successful and 1 failed single retry
+        self.assertEqual(self.rpc.roundtrips, 4)
+
+        reqs = (self.c.token_at(self.address, i, sender_address=self.accounts[0]) for i in itertools.count())
+        with self.assertRaises(JSONRPCException):
+            for r in batch_results(self.rpc, reqs, batch_size=2):
+                pass
+
+
+    def test_batch_results_order(self):
+        token_ids = []
+        for i in range(5):
+            token_ids.append(to_batch_key(hash_of_foo, 0, i))
+        reqs = [self.c.get_token(self.address, v, sender_address=self.accounts[0]) for v in token_ids]
+
+        self.rpc.roundtrips = 0
+        r = list(batch_results(self.rpc, reqs, batch_size=100))
+        self.assertEqual(self.rpc.roundtrips, 1)
+
+        for i in range(5):
+            token = self.c.parse_token(r[i], token_ids[i])
+            if i < 4:
+                self.assertTrue(token.minted)
+                self.assertEqual(token.index, i)
+            else:
+                self.assertFalse(token.minted)
+
+        self.rpc.roundtrips = 0
+        rr = list(batch_results(self.rpc, reqs, batch_size=1))
+        self.assertEqual(self.rpc.roundtrips, 5)
+        self.assertEqual(r, rr)
+
+
+    def test_find_length(self):
+        self.rpc.roundtrips = 0
+        r = find_length(self.rpc, lambda i: self.c.token_at(self.address, i, sender_address=self.accounts[0]))
+        self.assertEqual(r, 3)
+        # index 0, 1, 3 then binary search on 2
+        self.assertEqual(self.rpc.roundtrips, 4)
+
+        r = find_length(self.rpc, lambda i: self.c.get_token_spec(self.address, hash_of_foo, i, sender_address=self.accounts[0]), start=1)
+        self.assertEqual(r, 2)
+        r = find_length(self.rpc, lambda i: self.c.get_token_spec(self.address, hash_of_bar, i, sender_address=self.accounts[0]), start=1)
+        self.assertEqual(r, 1)
+
+        # simulate arrays of any length by querying a missing element beyond the length
+        for n in range(20):
+            def req(i):
+                if i >= n:
+                    return self.c.token_at(self.address, 1000, sender_address=self.accounts[0])
+                return self.c.token_at(self.address, i % 3, sender_address=self.accounts[0])
+            r = find_length(self.rpc, req)
+            self.assertEqual(r, n)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# standard imports
+import os
+import sys
+import unittest
+import subprocess
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+rootdir = os.path.dirname(testdir)
+
+RUNNABLES = [
+    'publish',
+    'allocate',
+    'mint',
+    'dump',
+    'sync',
+    'sign',
+    ]
+
+
+def run_python(code):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = rootdir + os.pathsep + env.get('PYTHONPATH', '')
+    return subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+class TestRunnable(unittest.TestCase):
+
+    def test_import_package(self):
+        r = run_python('import sys; import craft_nft; sys.exit(int("craft_nft.nft" in sys.modules))')
+        self.assertEqual(r.returncode, 0, r.stderr)
+
+        r = run_python('from craft_nft import CraftNFT, create, bytecode, args')
+        self.assertEqual(r.returncode, 0, r.stderr)
+
+
+    def test_import_runnables(self):
+        # without side effects, importing a runnable without any arguments must neither exit nor connect
+        for m in RUNNABLES:
+            r = run_python('import craft_nft.runnable.{}'.format(m))
+            self.assertEqual(r.returncode, 0, r.stderr)
+
+
+    def test_import_dump_sources(self):
+        # the modules of each token source are only imported when that source is used
+        for m in ['store', 'statedump', 'storage', 'cache', 'index', 'checkpoint']:
+            r = run_python('import sys; import craft_nft.runnable.dump; sys.exit(int("craft_nft.{}" in sys.modules))'.format(m))
+            self.assertEqual(r.returncode, 0, m)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.index import block_height
+from craft_nft.index import TokenIndex
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestScan(TestCraftNFT):
+
+    def setUp(self):
+        super(TestScan, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(4):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=2)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+
+
+    def scan(self, token_id=None, **kwargs):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0], **kwargs)
+        try:
+            return [str(v) for v in scanner.minted(token_id=token_id)]
+        finally:
+            scanner.close()
+
+
+    def test_scan(self):
+        r = self.scan()
+        self.assertEqual(len(r), 6)
+        self.assertEqual(r[4][:64], hash_of_foo[:48] + '0001000000000002')
+        self.assertEqual(r[5][:64], hash_of_bar)
+
+
+    def test_scan_workers(self):
+        expect = self.scan()
+
+        r = self.scan(workers=4)
+        self.assertEqual(r, expect)
+
+        r = self.scan(workers=4, batch_size=2)
+        self.assertEqual(r, expect)
+
+        r = self.scan(workers=3, batch_size=2, ordered=False)
+        self.assertEqual(len(r), len(expect))
+        self.assertEqual(set(r), set(expect))
+
+
+    def test_scan_token(self):
+        scanner = Scanner(self.c, self.rpc, self.address, workers=2, sender_address=self.accounts[0])
+        r = list(scanner.minted(token_id=hash_of_bar))
+        scanner.close()
+        self.assertEqual(len(r), 1)
+        self.assertEqual(r[0].token_id, hash_of_bar)
+
+
+    def test_scan_sparse(self):
+        hash_of_baz = 'baa5a0964d3320fbc0c6a922140453c8513ea24ab8fd0577034804a967248096'
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_baz, amount=100000)
+        self.rpc.do(o)
+        for i in [42, 7, 99999]:
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_baz, 0, index=i)
+            self.rpc.do(o)
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0], block_chunk_size=4)
+        self.rpc.roundtrips = 0
+        r = list(scanner.minted(token_id=hash_of_baz))
+        scanner.close()
+        self.assertEqual([v.index for v in r], [7, 42, 99999])
+        self.assertLess(self.rpc.roundtrips, 20)
+
+        # mints before from_block are missing from the mint events, so the indices are probed instead
+        hash_of_qux = '21f58d27f827d295ffcd860c65045685e3baf1ad4506caa0140113b316647534'
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_qux, amount=50)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_qux, 0, index=3)
+        self.rpc.do(o)
+        from_block = block_height(self.rpc) + 1
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_qux, 0, index=40)
+        self.rpc.do(o)
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0], from_block=from_block)
+        r = list(scanner.minted(token_id=hash_of_qux))
+        scanner.close()
+        self.assertEqual([v.index for v in r], [3, 40])
+
+        # the mint events and the index probe agree
+        expect = self.scan(token_id=hash_of_foo, mint_logs=False)
+        r = self.scan(token_id=hash_of_foo)
+        self.assertEqual(r, expect)
+        self.assertEqual(len(r), 5)
+
+
+    def test_iter_minted(self):
+        expect = self.scan()
+        it = self.c.iter_minted(self.rpc, self.address, sender_address=self.accounts[0], batch_size=2)
+        token = next(it)
+        self.assertEqual(str(token), expect[0])
+        r = [str(token)] + [str(v) for v in it]
+        self.assertEqual(r, expect)
+
+        token = next(self.c.iter_minted(self.rpc, self.address, token_id=hash_of_foo, sender_address=self.accounts[0]))
+        d = token.to_dict()
+        self.assertEqual(d['key'], hash_of_foo[:48] + '0000000000000000')
+        self.assertEqual(d['token_id'], hash_of_foo)
+        self.assertEqual(d['batch'], 0)
+        self.assertEqual(d['index'], 0)
+        self.assertFalse(d['batched'])
+        self.assertEqual(d['owner'], self.accounts[1])
+
+
+    def test_iter_specs(self):
+        r = [v.to_dict() for v in self.c.iter_specs(self.rpc, self.address, sender_address=self.accounts[0], workers=2)]
+        self.assertEqual([(v['token_id'], v['batch']) for v in r], [(hash_of_foo, 0), (hash_of_foo, 1), (hash_of_bar, 0)])
+        self.assertEqual((r[0]['count'], r[0]['cursor'], r[0]['sparse'], r[0]['capped']), (5, 4, False, True))
+        self.assertTrue(r[1]['sparse'])
+        self.assertEqual((r[2]['count'], r[2]['cursor']), (0, 1))
+
+        # the specs rebuilt from events are the same
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address)
+        self.assertEqual([v.to_dict() for v in idx.iter_specs()], r)
+
+        r = [str(v) for v in self.c.iter_specs(self.rpc, self.address, token_id=hash_of_bar, sender_address=self.accounts[0])]
+        self.assertEqual(r, ['{} batch 0 minted 1 / 0'.format(hash_of_bar)])
+
+
+    def test_scan_after(self):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0], batch_size=2)
+        tokens = list(scanner.minted())
+        expect = [str(v) for v in tokens]
+
+        for i, token in enumerate(tokens):
+            after = (token.token_id, token.batch, token.index,)
+            if token.batched:
+                after = (token.token_id, None, None,)
+            r = [str(v) for v in scanner.minted(after=after)]
+            self.assertEqual(r, expect[i+1:])
+
+        # the token id of the checkpoint may be given in any case, with 0x
+        token = tokens[0]
+        after = ('0x' + token.token_id.upper(), token.batch, token.index,)
+        if token.batched:
+            after = (after[0], None, None,)
+        r = [str(v) for v in scanner.minted(after=after)]
+        self.assertEqual(r, expect[1:])
+
+        # a checkpoint of another contract
+        with self.assertRaises(ValueError):
+            list(scanner.minted(after=('ee' * 32, 0, 0,)))
+        scanner.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
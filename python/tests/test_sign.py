@@ -0,0 +1,118 @@
+# standard imports
+import io
+import json
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import OverrideNonceOracle
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.gas import OverrideGasOracle
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.bulk import ManifestEntry
+from craft_nft.bulk import tx_nonce
+from craft_nft.sign import AllocationEntry
+from craft_nft.sign import SigningPool
+from craft_nft.sign import read_plan
+from craft_nft.sign import build_txs
+from craft_nft.sign import write_signed
+from craft_nft.sign import broadcast
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestSign(TestCraftNFT):
+
+    def setUp(self):
+        super(TestSign, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.nonce = nonce_oracle.get_nonce()
+        gas_oracle = OverrideGasOracle(price=1000000000, limit=200000)
+        self.c = CraftNFT(self.chain_spec, gas_oracle=gas_oracle, nonce_oracle=OverrideNonceOracle(self.accounts[0], self.nonce))
+
+        lines = [
+            json.dumps({'method': 'allocate', 'token_id': hash_of_foo, 'amount': 3}),
+            json.dumps({'method': 'allocate', 'token_id': hash_of_bar}),
+            ]
+        for i in range(3):
+            lines.append('{},{}'.format(self.accounts[i + 1], hash_of_foo))
+        lines.append(json.dumps({'method': 'mint_to', 'recipient': self.accounts[4], 'token_id': hash_of_bar}))
+        self.plan = '\n'.join(lines) + '\n'
+
+
+    def minted(self):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        r = list(scanner.minted())
+        scanner.close()
+        return r
+
+
+    def test_read_plan(self):
+        r = list(read_plan(io.StringIO(self.plan)))
+        self.assertEqual(len(r), 6)
+        self.assertIsInstance(r[0], AllocationEntry)
+        self.assertEqual(r[0].amount, 3)
+        self.assertEqual(r[1].amount, 0)
+        self.assertIsInstance(r[2], ManifestEntry)
+        self.assertEqual(r[5].recipient, self.accounts[4])
+        self.assertEqual(r[5].line, 6)
+
+        with self.assertRaises(ValueError):
+            list(read_plan(io.StringIO('{"method": "burn", "token_id": "' + hash_of_foo + '"}\n')))
+
+        with self.assertRaises(ValueError):
+            list(read_plan(io.StringIO('{"method": "allocate"}\n')))
+
+
+    def test_sign_broadcast(self):
+        for workers in [1, 3]:
+            self.c.nonce_oracle = OverrideNonceOracle(self.accounts[0], self.nonce)
+            entries = read_plan(io.StringIO(self.plan))
+            txs = build_txs(self.c, self.address, self.accounts[0], entries)
+            pool = SigningPool(self.chain_spec, self.signer, workers=workers, chunk_size=2)
+            w = io.StringIO()
+            results = io.StringIO()
+            try:
+                self.assertEqual(write_signed(w, pool.sign(txs), results=results), 6)
+            finally:
+                pool.close()
+
+            signed = w.getvalue()
+            if workers > 1:
+                self.assertEqual(signed, expect)
+            expect = signed
+
+        lines = expect.split('\n')[:-1]
+        self.assertEqual([tx_nonce(v) for v in lines], list(range(self.nonce, self.nonce + 6)))
+        results = [json.loads(v) for v in results.getvalue().split('\n') if len(v) > 0]
+        self.assertEqual([v['line'] for v in results], list(range(1, 7)))
+        self.assertEqual(results[0]['method'], 'allocate')
+        self.assertEqual([v['nonce'] for v in results], list(range(self.nonce, self.nonce + 6)))
+
+        # nothing is sent until the signed transactions are replayed
+        self.assertEqual(len(self.minted()), 0)
+
+        r = list(broadcast(self.rpc, io.StringIO(expect)))
+        self.assertEqual(r, [v['tx_hash'] for v in results])
+        for tx_hash_hex in r:
+            rcpt = self.rpc.wait(tx_hash_hex)
+            self.assertEqual(rcpt['status'], 1)
+
+        r = self.minted()
+        self.assertEqual(len(r), 4)
+        self.assertEqual(r[2].owner, strip_0x(self.accounts[3]).lower())
+        self.assertEqual(r[3].token_id, hash_of_bar)
+        self.assertEqual(r[3].owner, strip_0x(self.accounts[4]).lower())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.block import block_latest
+from chainlib.eth.block import block_by_number
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.scan import Scanner
+from craft_nft.snapshot import Snapshot
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestSnapshot(TestCraftNFT):
+
+    def setUp(self):
+        super(TestSnapshot, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[1], hash_of_foo, 0)
+        self.rpc.do(o)
+
+
+    def test_snapshot(self):
+        snapshot = Snapshot(self.c, self.rpc)
+        o = block_latest()
+        self.assertEqual(snapshot.height, int(strip_0x(self.rpc.do(o)), 16))
+        o = block_by_number(snapshot.height)
+        block_hash = self.rpc.do(o)['hash']
+
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 0)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        o = snapshot.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0])
+        spec = self.c.parse_token_spec(self.rpc.do(o))
+        self.assertEqual(spec.cursor, 1)
+
+        o = self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0], height=block_hash)
+        spec = self.c.parse_token_spec(self.rpc.do(o))
+        self.assertEqual(spec.cursor, 1)
+
+        o = self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0])
+        spec = self.c.parse_token_spec(self.rpc.do(o))
+        self.assertEqual(spec.cursor, 2)
+
+        scanner = Scanner(snapshot, self.rpc, self.address, sender_address=self.accounts[0])
+        r = list(scanner.minted())
+        self.assertEqual(len(r), 1)
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0], height=block_hash)
+        r = list(scanner.minted())
+        self.assertEqual(len(r), 1)
+        self.assertEqual(scanner.batch_minted_indices(hash_of_foo, 0), [0])
+
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        r = list(scanner.minted())
+        self.assertEqual(len(r), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+# standard imports
+import os
+import io
+import sys
+import json
+import random
+import unittest
+import logging
+import tempfile
+import subprocess
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.unittest import requires_storage
+from craft_nft.index import TokenIndex
+from craft_nft.scan import Scanner
+from craft_nft import storage
+from craft_nft.statedump import StateDump
+from craft_nft.statedump import load_state_dump
+from craft_nft.statedump import iter_storage_entries
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+rootdir = os.path.dirname(os.path.dirname(__file__))
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+@requires_storage
+class TestStateDump(TestCraftNFT):
+
+    def setUp(self):
+        super(TestStateDump, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=7)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(3):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=4)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+
+        self.entries = self.read_storage()
+        self.d = tempfile.mkdtemp()
+
+
+    def tearDown(self):
+        for v in os.listdir(self.d):
+            os.unlink(os.path.join(self.d, v))
+        os.rmdir(self.d)
+        super(TestStateDump, self).tearDown()
+
+
+    def read_storage(self):
+        """Return all the storage slots of the contract that hold token state, and some that do not, with their values as hex.
+        """
+        slots = list(range(storage.SLOT_DEFAULT_DIGEST_ENCODING + 1))
+        slots += [storage.tokens_slot(i) for i in range(3)]
+        slots += [storage.token_by_index_slot(i) for i in range(5)]
+        for token_id in [hash_of_foo, hash_of_bar]:
+            slots.append(storage.token_spec_count_slot(token_id))
+            slots += [storage.token_spec_slot(token_id, i) for i in range(2)]
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        for token in scanner.minted():
+            slots.append(storage.minted_token_slot(token.key()))
+        scanner.close()
+        for address in self.accounts[1:4]:
+            slots.append(storage.balance_slot(address))
+
+        r = []
+        for slot in slots:
+            v = self.rpc.do(storage.get_storage_at(self.address, slot))
+            if int(v, 16) == 0:
+                continue
+            r.append((hex(slot), v,))
+        random.shuffle(r)
+        return r
+
+
+    def write(self, name, lines):
+        path = os.path.join(self.d, name)
+        f = open(path, 'w')
+        for line in lines:
+            f.write(line + '\n')
+        f.close()
+        return path
+
+
+    def expect(self):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        r = [str(v) for v in scanner.minted()]
+        scanner.close()
+        return r
+
+
+    def test_entries(self):
+        f = io.StringIO('0x03 0x05\n\n{"slot": "0x4", "value": "0x"}\n{"result": {"storage": {"0xab": {"key": null, "value": "0x01"}, "0xcd": {"key": "0x06", "value": "0x02"}}, "nextKey": null}}\n')
+        r = list(iter_storage_entries(f))
+        self.assertEqual(r, [(3, 5), (4, 0), (6, 2)])
+
+        f = io.StringIO('{"address": "0x' + 'ee' * 20 + '", "storage": {"0x03": "0x05"}}\n{"address": "' + self.address + '", "storage": {"0x03": "0x07"}}\n')
+        r = list(iter_storage_entries(f, contract_address=self.address))
+        self.assertEqual(r, [(3, 7)])
+
+
+    def test_load(self):
+        expect = self.expect()
+        self.assertEqual(len(expect), 5)
+
+        path = self.write('plain', ['{} {}'.format(slot, value) for (slot, value) in self.entries])
+        idx = load_state_dump(path)
+        self.assertIsInstance(idx, TokenIndex)
+        self.assertEqual([str(v) for v in idx.minted()], expect)
+        self.assertEqual(idx.token_ids(), [hash_of_foo, hash_of_bar])
+
+        for batch in range(2):
+            o = self.c.get_token_spec(self.address, hash_of_foo, batch, sender_address=self.accounts[0])
+            spec = self.c.parse_token_spec(self.rpc.do(o))
+            loaded = idx.specs[hash_of_foo][batch]
+            self.assertEqual((loaded.count, loaded.cursor, loaded.sparse, loaded.capped), (spec.count, spec.cursor, spec.sparse, spec.capped))
+        self.assertEqual(len(idx.specs[hash_of_bar]), 1)
+
+        owner = strip_0x(self.accounts[2]).lower()
+        self.assertEqual(len(idx.tokens_of(owner)), 2)
+        self.assertEqual(len(idx.tokens_of(self.accounts[3])), 2)
+
+        r = [str(v) for v in idx.minted(token_id=hash_of_bar)]
+        self.assertEqual(r, expect[-1:])
+
+
+    def test_load_storage_range(self):
+        expect = self.expect()
+
+        # split in pages, and add an entry whose slot preimage is missing
+        pages = []
+        for i in range(0, len(self.entries), 4):
+            page = {}
+            for (slot, value) in self.entries[i:i+4]:
+                page[os.urandom(32).hex()] = {'key': slot, 'value': value}
+            pages.append(json.dumps({'jsonrpc': '2.0', 'id': i, 'result': {'storage': page, 'nextKey': None}}))
+        pages.append(json.dumps({'storage': {os.urandom(32).hex(): {'key': None, 'value': '0x01'}}}))
+        path = self.write('range', pages)
+        idx = StateDump(path).load(height=42)
+        self.assertEqual([str(v) for v in idx.minted()], expect)
+        self.assertEqual(idx.next_block, 43)
+
+        # a single pretty printed document
+        page = {}
+        for (slot, value) in self.entries:
+            page[os.urandom(32).hex()] = {'key': slot, 'value': value}
+        path = self.write('document', json.dumps({'storage': page}, indent=2).split('\n'))
+        idx = load_state_dump(path)
+        self.assertEqual([str(v) for v in idx.minted()], expect)
+
+
+    def test_dump_offline(self):
+        expect = self.expect()
+        path = self.write('plain', ['{} {}'.format(slot, value) for (slot, value) in self.entries])
+
+        # no node listens on the rpc provider, and no wallet is given
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.abspath(rootdir) + os.pathsep + env.get('PYTHONPATH', '')
+        cmd = [sys.executable, '-m', 'craft_nft.runnable.dump', '-p', 'http://localhost:1', '--state-dump', path, self.address]
+        r = subprocess.run(cmd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=60)
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual(r.stdout.decode().splitlines(), ['token {}'.format(v) for v in expect])
+
+        r = subprocess.run(cmd + ['--specs', '--format', 'csv'], env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=60)
+        self.assertEqual(r.returncode, 0, r.stderr)
+        r = r.stdout.decode().splitlines()
+        self.assertEqual(r[0], 'token_id,batch,count,cursor,sparse,capped')
+        self.assertEqual(r[1:], [
+            '{},0,5,3,False,True'.format(hash_of_foo),
+            '{},1,7,1,True,True'.format(hash_of_foo),
+            '{},0,0,1,False,True'.format(hash_of_bar),
+            ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# standard imports
+import io
+import json
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.error import JSONRPCException
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.stats import Stats
+from craft_nft.stats import StatsConnection
+from craft_nft.stats import query_key
+from craft_nft.stats import phase
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+
+
+class TestStats(TestCraftNFT):
+
+    def setUp(self):
+        super(TestStats, self).setUp()
+        self.stats = Stats()
+        self.conn = StatsConnection(self.rpc, stats=self.stats)
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+
+    def test_query_key(self):
+        o = self.c.token_at(self.address, 0, sender_address=self.accounts[0])
+        self.assertEqual(query_key(o), 'eth_call tokens(uint256)')
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=2)
+        self.assertEqual(query_key(o), 'eth_sendRawTransaction allocate(bytes32,int48)')
+
+        o = {'method': 'eth_blockNumber', 'params': []}
+        self.assertEqual(query_key(o), 'eth_blockNumber')
+
+
+    def test_connection(self):
+        hooked = []
+        self.stats.add_hook(lambda *args: hooked.append(args))
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=2)
+        self.conn.do(o)
+
+        o = self.c.token_at(self.address, 0, sender_address=self.accounts[0])
+        self.conn.do(o)
+        o = self.c.token_at(self.address, 1, sender_address=self.accounts[0])
+        with self.assertRaises(JSONRPCException):
+            self.conn.do(o)
+
+        reqs = [self.c.get_token_spec(self.address, hash_of_foo, 0, sender_address=self.accounts[0])] * 3
+        r = self.conn.do(reqs)
+        self.assertEqual(len(r), 3)
+
+        with phase(self.stats, 'foo'):
+            pass
+        with phase(None, 'foo'):
+            pass
+
+        d = self.stats.to_dict()
+        self.assertEqual(d['roundtrips'], 4)
+        self.assertEqual(d['methods']['eth_sendRawTransaction allocate(bytes32,int48)']['count'], 1)
+        v = d['methods']['eth_call tokens(uint256)']
+        self.assertEqual(v['count'], 2)
+        self.assertEqual(v['errors'], 1)
+        self.assertEqual(sum(v['histogram'].values()), 2)
+        self.assertGreater(v['bytes_sent'], 0)
+        v = d['methods']['eth_call token(bytes32,uint256)']
+        self.assertEqual(v['count'], 3)
+        self.assertEqual(v['bytes_received'], len(json.dumps(r[0])) * 3)
+        self.assertIn('foo', d['phases'])
+
+        self.assertEqual(len(hooked), 6)
+        self.assertEqual(hooked[0][0], 'eth_sendRawTransaction allocate(bytes32,int48)')
+        self.assertIsInstance(hooked[2][4], JSONRPCException)
+
+        w = io.StringIO()
+        self.stats.write(w)
+        self.assertEqual(json.loads(w.getvalue())['roundtrips'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# standard imports
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.block import block_latest
+from hexathon import strip_0x
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.unittest import requires_storage
+from craft_nft.scan import Scanner
+from craft_nft.storage import StorageScanner
+from craft_nft.storage import iter_minted
+from craft_nft.storage import token_count
+from craft_nft.storage import get_token_spec
+from craft_nft.storage import get_token
+from craft_nft.storage import total_supply
+from craft_nft.storage import balance_of
+from craft_nft.storage import token_of_owner_by_index
+from craft_nft.storage import parse_word
+from craft_nft.storage import parse_uint
+from craft_nft.storage import parse_token_spec_word
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+@requires_storage
+class TestStorage(TestCraftNFT):
+
+    def setUp(self):
+        super(TestStorage, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=7)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(3):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=4)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+
+
+    def test_token_spec(self):
+        r = self.rpc.do(token_count(self.address))
+        self.assertEqual(parse_uint(r), 3)
+
+        for batch in range(2):
+            o = self.c.get_token_spec(self.address, hash_of_foo, batch, sender_address=self.accounts[0])
+            expect = self.c.parse_token_spec(self.rpc.do(o))
+            r = self.rpc.do(get_token_spec(self.address, hash_of_foo, batch))
+            spec = parse_token_spec_word(r)
+            self.assertEqual(spec.count, expect.count)
+            self.assertEqual(spec.cursor, expect.cursor)
+            self.assertEqual(spec.sparse, expect.sparse)
+            self.assertEqual(spec.capped, expect.capped)
+
+        r = self.rpc.do(get_token_spec(self.address, hash_of_bar, 0))
+        spec = parse_token_spec_word(r)
+        self.assertEqual(spec.count, 0)
+        self.assertTrue(spec.capped)
+
+        spec = parse_token_spec_word((1 << 104) | (1 << 96) | (3 << 48) | 42)
+        self.assertEqual(spec.count, 42)
+        self.assertEqual(spec.cursor, 3)
+        self.assertTrue(spec.sparse)
+        self.assertTrue(spec.capped)
+
+
+    def test_token(self):
+        o = self.c.get_token(self.address, hash_of_bar, sender_address=self.accounts[0])
+        expect = self.rpc.do(o)
+        r = self.rpc.do(get_token(self.address, hash_of_bar))
+        self.assertEqual(parse_word(r), strip_0x(expect))
+        token = self.c.parse_token(r, hash_of_bar)
+        self.assertEqual(token.owner, strip_0x(self.accounts[3]).lower())
+
+        self.assertEqual(parse_word('0x0'), '0' * 64)
+
+
+    def test_enumeration(self):
+        r = self.rpc.do(total_supply(self.address))
+        self.assertEqual(parse_uint(r), 5)
+
+        r = self.rpc.do(balance_of(self.address, self.accounts[2]))
+        self.assertEqual(parse_uint(r), 2)
+
+        r = self.rpc.do(token_of_owner_by_index(self.address, self.accounts[2], 1))
+        self.assertEqual(parse_word(r)[:48], hash_of_foo[:48])
+
+
+    def test_scan(self):
+        scanner = Scanner(self.c, self.rpc, self.address, sender_address=self.accounts[0])
+        expect = [str(v) for v in scanner.minted()]
+        scanner.close()
+        self.assertEqual(len(expect), 5)
+
+        for kwargs in [{}, {'batch_size': 3}, {'workers': 3, 'batch_size': 2}, {'mint_logs': False}]:
+            scanner = StorageScanner(self.c, self.rpc, self.address, **kwargs)
+            r = [str(v) for v in scanner.minted()]
+            scanner.close()
+            self.assertEqual(r, expect)
+
+        r = list(iter_minted(self.c, self.rpc, self.address, token_id=hash_of_bar))
+        self.assertEqual(len(r), 1)
+        self.assertEqual(r[0].token_id, hash_of_bar)
+
+        r = list(iter_minted(self.c, self.rpc, self.address, token_id='00' * 32))
+        self.assertEqual(len(r), 0)
+
+
+    def test_scan_height(self):
+        height = self.rpc.do(block_latest())
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[4], hash_of_foo, 0)
+        self.rpc.do(o)
+
+        r = list(iter_minted(self.c, self.rpc, self.address))
+        self.assertEqual(len(r), 6)
+
+        r = list(iter_minted(self.c, self.rpc, self.address, height=int(height, 16)))
+        self.assertEqual(len(r), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# standard imports
+import os
+import unittest
+import logging
+import tempfile
+import shutil
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.index import TokenIndex
+from craft_nft.store import TokenStore
+from craft_nft.nft import to_batch_key
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+hash_of_baz = 'baa5a0964d3320fbc0c6a922140453c8513ea24ab8fd0577034804a967248096'
+
+
+class TestStore(TestCraftNFT):
+
+    def setUp(self):
+        super(TestStore, self).setUp()
+        self.store_dir = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.store_dir, 'index.sqlite')
+
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(2):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=2)
+        self.rpc.do(o)
+
+
+    def tearDown(self):
+        shutil.rmtree(self.store_dir)
+        super(TestStore, self).tearDown()
+
+
+    def test_store_sync(self):
+        store = TokenStore(self.store_path)
+        self.assertIsNone(store.next_block(self.address))
+        store.sync(self.rpc, self.address)
+        next_block = store.next_block(self.address)
+        self.assertGreater(next_block, 0)
+        store.close()
+
+        # more mints and a transfer after the first sync
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_foo, 0)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_bar, 0)
+        self.rpc.do(o)
+        key = to_batch_key(hash_of_foo, 0, 0)
+        nonce_oracle = RPCNonceOracle(self.accounts[1], self.rpc)
+        c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+        (tx_hash_hex, o) = c.transfer_from(self.address, self.accounts[1], self.accounts[1], self.accounts[4], int(key, 16))
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_baz, amount=2)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[3], hash_of_baz, 0)
+        self.rpc.do(o)
+
+        store = TokenStore(self.store_path)
+        idx = store.load(self.address)
+        self.assertEqual(idx.next_block, next_block)
+        self.assertEqual(len(idx.mints), 3)
+
+        # only the tokens and mints changed since the first sync are read and written
+        idx = store.sync(self.rpc, self.address)
+        self.assertGreater(store.next_block(self.address), next_block)
+        self.assertEqual(idx.tokens, [hash_of_baz])
+        self.assertEqual(sorted(idx.specs.keys()), sorted([hash_of_foo, hash_of_bar, hash_of_baz]))
+        self.assertEqual(len(idx.mints), 4)
+        self.assertIn(key, idx.mints)
+        self.assertEqual(store.tokens_of(self.address, self.accounts[1]), [])
+        self.assertEqual(store.tokens_of(self.address, self.accounts[4]), [key])
+
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address)
+        expect = [str(v) for v in idx.minted()]
+        r = [str(v) for v in store.minted(self.address)]
+        self.assertEqual(r, expect)
+        self.assertEqual(len(r), 6)
+
+        r = [str(v) for v in store.minted(self.address, token_id=hash_of_bar)]
+        expect = [str(v) for v in idx.minted(token_id=hash_of_bar)]
+        self.assertEqual(r, expect)
+
+        idx = store.load(self.address)
+        spec = idx.specs[hash_of_foo][1]
+        self.assertTrue(spec.sparse)
+        self.assertTrue(spec.capped)
+        self.assertEqual(spec.count, 3)
+        self.assertEqual(idx.token_ids(), [hash_of_foo, hash_of_bar, hash_of_baz])
+        self.assertEqual(idx.specs[hash_of_foo][0].cursor, 3)
+
+        idx = TokenIndex()
+        idx.sync(self.rpc, self.address)
+        r = [v.to_dict() for v in store.iter_specs(self.address)]
+        self.assertEqual(r, [v.to_dict() for v in idx.iter_specs()])
+        r = [v.to_dict() for v in store.iter_specs(self.address, token_id=hash_of_baz)]
+        self.assertEqual([(v['batch'], v['count'], v['cursor']) for v in r], [(0, 2, 1)])
+
+        # nothing is written if there are no new blocks
+        idx = store.sync(self.rpc, self.address, to_block=next_block - 1)
+        self.assertEqual(len(idx.mints), 0)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
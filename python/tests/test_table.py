@@ -0,0 +1,78 @@
+# standard imports
+import os
+import unittest
+import logging
+
+# external imports
+from chainlib.eth.nonce import RPCNonceOracle
+from chainlib.eth.address import is_same_address
+
+# local imports
+from craft_nft import CraftNFT
+from craft_nft.unittest import TestCraftNFT
+from craft_nft.nft import MintedToken
+from craft_nft.table import TokenTable
+
+logging.basicConfig(level=logging.DEBUG)
+logg = logging.getLogger()
+
+testdir = os.path.dirname(__file__)
+
+hash_of_foo = '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
+hash_of_bar = 'fcde2b2edba56bf408601fb721fe9b5c338d10ee429ea04fae5511b68fbf8fb9'
+
+
+class TestTable(TestCraftNFT):
+
+    def setUp(self):
+        super(TestTable, self).setUp()
+        nonce_oracle = RPCNonceOracle(self.accounts[0], self.rpc)
+        self.c = CraftNFT(self.chain_spec, signer=self.signer, nonce_oracle=nonce_oracle)
+
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=5)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_foo, amount=3)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.allocate(self.address, self.accounts[0], hash_of_bar)
+        self.rpc.do(o)
+
+        for i in range(3):
+            (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[i+1], hash_of_foo, 0)
+            self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_foo, 1, index=2)
+        self.rpc.do(o)
+        (tx_hash_hex, o) = self.c.mint_to(self.address, self.accounts[0], self.accounts[2], hash_of_bar, 0)
+        self.rpc.do(o)
+
+
+    def test_table(self):
+        tokens = list(self.c.iter_minted(self.rpc, self.address, sender_address=self.accounts[0]))
+        table = TokenTable.from_tokens(tokens)
+        self.assertEqual(len(table), 5)
+
+        for (token, row) in zip(tokens, table):
+            # a row is a slotted view, without an instance dict of its own
+            self.assertFalse(hasattr(row, '__dict__'))
+            self.assertEqual((row.minted, row.batched, row.owner, row.batch, row.index), (token.minted, token.batched, token.owner, token.batch, token.index))
+            self.assertEqual(str(row), str(token))
+            self.assertEqual(row.to_dict(), token.to_dict())
+            self.assertEqual(row.token_id, token.token_id)
+            self.assertEqual(row.key(), token.key())
+        self.assertTrue(table[-1].batched)
+        self.assertEqual(table[3].batch, 1)
+        self.assertEqual(table[3].index, 2)
+
+        r = table.tokens_of(self.accounts[2])
+        self.assertEqual([v.key() for v in r], [tokens[1].key(), tokens[3].key(), tokens[4].key()])
+        self.assertEqual(table.tokens_of(self.accounts[5]), [])
+
+        with self.assertRaises(IndexError):
+            table[5]
+
+        table.append(MintedToken())
+        self.assertFalse(table[5].minted)
+        self.assertIsNone(table[5].token_id)
+
+
+if __name__ == '__main__':
+    unittest.main()